@@ -44,11 +44,17 @@ logger.add(
 
 # Import des composants nécessaires
 from backend.scraper.core.list_scraper import JobListScraper
+from backend.scraper.core.http_client import HTTPClient
+from backend.scraper.core.extractor import JobExtractor
 from backend.scraper.core.cache import JobCache
-from backend.scraper.core.html_cleaner import HTMLCleaner
+from backend.scraper.core.offer_state import OfferStage
+from backend.scraper.core.boilerplate import BoilerplateModel
+from backend.scraper.core.cleaning_executor import CleaningExecutor
 from backend.scraper.core.job_analyzer import JobAnalyzer
+from backend.scraper.core.seen_index import SeenIndex
+from backend.scraper.core.stages import new_stats, clean_offers, analyze_offers, load_offers
 from backend.scraper.core.storage import JobStorage
-from backend.scraper.config.settings import SCRAPING_INTERVAL
+from backend.scraper.config.settings import BOILERPLATE_ENABLED, SCRAPING_INTERVAL
 
 # Configuration par défaut du DAG
 default_args = {
@@ -68,213 +74,124 @@ async def extract_jobs():
     """
     Étape 1: Extraction des offres d'emploi
     """
+    http_client = HTTPClient()
+    seen_index = SeenIndex()
     try:
-        list_scraper = JobListScraper()
         cache = JobCache()
+        list_scraper = JobListScraper(http_client=http_client, cache=cache, seen_index=seen_index)
         
         airflow_logger.info("🚀 Début de l'extraction")
         
         try:
-            urls = await list_scraper.get_all_job_urls()
+            url_sources = await list_scraper.get_job_url_sources()
+            urls = list(url_sources)
             airflow_logger.info(f"📑 {len(urls)} offres trouvées au total")
         except Exception as e:
             airflow_logger.error(f"❌ Erreur lors de la récupération des URLs: {str(e)}")
             raise
         
-        extracted = 0
-        skipped = 0
-        failed = 0
-        
-        for url in urls:
-            try:
-                if await cache.is_processed(url):
-                    airflow_logger.debug(f"⏭️ URL déjà extraite: {url}")
-                    skipped += 1
-                    continue
-                
-                html_content = await list_scraper._fetch_page(url)
-                
-                if html_content:
-                    await cache.store_raw_html(url, html_content)
-                    extracted += 1
-                    airflow_logger.info(f"✅ HTML extrait: {url}")
-                else:
-                    failed += 1
-                    airflow_logger.error(f"❌ Échec de l'extraction: {url}")
-                    
-            except Exception as e:
-                failed += 1
-                airflow_logger.error(f"❌ Erreur lors de l'extraction de {url}: {str(e)}")
+        extractor = JobExtractor(cache, http_client, seen_index=seen_index)
+        stats = await extractor.extract(urls, sources=url_sources)
         
         airflow_logger.info(
             "📊 Bilan de l'extraction:\n"
             f"  - Offres trouvées: {len(urls)}\n"
-            f"  - HTML extraits: {extracted}\n"
-            f"  - Déjà vus: {skipped}\n"
-            f"  - Échecs: {failed}"
+            f"  - HTML extraits: {stats['extracted']}\n"
+            f"  - Déjà vus: {stats['skipped']}\n"
+            f"  - Déjà chargés (index): {stats['known']}\n"
+            f"  - Inchangés (304): {stats['not_modified']}\n"
+            f"  - Échecs: {stats['failed']}"
         )
         
     except Exception as e:
         airflow_logger.error(f"❌ Erreur fatale: {str(e)}")
         raise
     finally:
-        cache.close()
+        await http_client.close()
+        seen_index.close()
+        await cache.log_summary()
+        await cache.close()
 
 async def transform_and_analyze():
     """
     Étape 2: Transformation et analyse des offres
     """
+    executor = CleaningExecutor(boilerplate=BoilerplateModel() if BOILERPLATE_ENABLED else None)
     try:
         cache = JobCache()
-        cleaner = HTMLCleaner()
         analyzer = JobAnalyzer()
         
-        # Partie 1: Nettoyage HTML
-        airflow_logger.info("🧹 Début du nettoyage HTML")
-        raw_keys = await cache.get_all_raw_html_keys()
-        airflow_logger.info(f"📑 {len(raw_keys)} offres à nettoyer")
-        
-        cleaned = 0
-        cleaning_failed = 0
-        
-        for key in raw_keys:
-            try:
-                html_content = await cache.get_raw_html(key)
-                if not html_content:
-                    airflow_logger.warning(f"⚠️ HTML non trouvé pour {key}")
-                    cleaning_failed += 1
-                    continue
-                
-                # Nettoyage du HTML
-                cleaned_html = cleaner.clean(html_content)
-                
-                await cache.store_cleaned_html(key, cleaned_html)
-                cleaned += 1
-                airflow_logger.info(f"✅ Nettoyage réussi: {key}")
-                    
-            except Exception as e:
-                cleaning_failed += 1
-                airflow_logger.error(f"❌ Erreur lors du nettoyage de {key}: {str(e)}")
+        # Partie 1: Nettoyage HTML des offres récupérées
+        airflow_logger.info(f"🧹 Début du nettoyage HTML ({await cache.count_offers(OfferStage.FETCHED)} offres en attente)")
+        raw_total = 0
+        cleaning = new_stats()
         
-        # Partie 2: Analyse
-        airflow_logger.info("🧠 Début de l'analyse")
-        cleaned_keys = await cache.get_all_cleaned_html_keys()
-        airflow_logger.info(f"📑 {len(cleaned_keys)} offres à analyser")
+        async for urls in cache.iter_offers(OfferStage.FETCHED):
+            raw_total += len(urls)
+            await clean_offers(cache, executor, urls, cleaning)
         
-        analyzed = 0
-        analysis_failed = 0
+        # Partie 2: Analyse des offres nettoyées
+        airflow_logger.info(f"🧠 Début de l'analyse ({await cache.count_offers(OfferStage.CLEANED)} offres en attente)")
+        cleaned_total = 0
+        analysis = new_stats()
         
-        for key in cleaned_keys:
-            try:
-                cleaned_html = await cache.get_cleaned_html(key)
-                if not cleaned_html:
-                    airflow_logger.warning(f"⚠️ HTML nettoyé non trouvé pour {key}")
-                    analysis_failed += 1
-                    continue
-                
-                # Analyse simplifiée
-                analysis = await analyzer.analyze(cleaned_html, key)
-                
-                if analysis:
-                    await cache.store_analysis(key, analysis)
-                    analyzed += 1
-                    airflow_logger.info(f"✅ Analyse réussie: {key}")
-                else:
-                    analysis_failed += 1
-                    airflow_logger.error(f"❌ Échec de l'analyse: {key}")
-                    
-            except Exception as e:
-                analysis_failed += 1
-                airflow_logger.error(f"❌ Erreur lors de l'analyse de {key}: {str(e)}")
+        async for urls in cache.iter_offers(OfferStage.CLEANED):
+            cleaned_total += len(urls)
+            await analyze_offers(cache, analyzer, urls, analysis)
         
         airflow_logger.info(
             "📊 Bilan de la transformation:\n"
-            f"  - Nettoyages réussis: {cleaned}/{len(raw_keys)}\n"
-            f"  - Analyses réussies: {analyzed}/{len(cleaned_keys)}\n"
-            f"  - Échecs nettoyage: {cleaning_failed}\n"
-            f"  - Échecs analyse: {analysis_failed}"
+            f"  - Nettoyages réussis: {cleaning['processed']}/{raw_total}\n"
+            f"  - Nettoyages ignorés (inchangés): {cleaning['skipped']}\n"
+            f"  - Analyses réussies: {analysis['processed']}/{cleaned_total}\n"
+            f"  - Analyses ignorées (inchangées): {analysis['skipped']}\n"
+            f"  - Échecs nettoyage: {cleaning['failed']}\n"
+            f"  - Échecs analyse: {analysis['failed']}"
         )
         
     except Exception as e:
         airflow_logger.error(f"❌ Erreur fatale lors de la transformation: {str(e)}")
         raise
     finally:
-        cache.close()
+        executor.close()
+        await cache.log_summary()
+        await cache.close()
 
 async def load_to_supabase():
     """
     Étape 3: Chargement des analyses dans Supabase
     """
+    seen_index = SeenIndex()
     try:
         cache = JobCache()
         storage = JobStorage()
         
-        airflow_logger.info("📤 Début du chargement des analyses vers Supabase")
-        
-        analysis_keys = await cache.get_all_analysis_keys()
-        airflow_logger.info(f"📊 {len(analysis_keys)} analyses à charger")
+        airflow_logger.info(
+            f"📤 Début du chargement des analyses vers Supabase "
+            f"({await cache.count_offers(OfferStage.ANALYZED)} offres en attente)"
+        )
         
-        success_count = 0
-        failure_count = 0
+        analysis_total = 0
+        stats = new_stats()
         
-        for key in analysis_keys:
-            try:
-                analysis = await cache.get_analysis(key)
-                if not analysis:
-                    airflow_logger.warning(f"⚠️ Analyse non trouvée pour {key}")
-                    failure_count += 1
-                    continue
-                
-                # Extraction de l'URL depuis la clé
-                url = key.split("analysis:", 1)[1] if "analysis:" in key else None
-                if not url:
-                    airflow_logger.error(f"❌ URL non trouvée dans la clé: {key}")
-                    failure_count += 1
-                    continue
-                
-                analysis['URL'] = url
-                
-                # Nettoyage des valeurs None
-                if analysis.get('DURATION_DAYS') == "None":
-                    analysis['DURATION_DAYS'] = None
-                
-                # Assurer que CONTRACT_TYPE est une liste
-                contract_type = analysis.get('CONTRACT_TYPE')
-                if contract_type:
-                    if isinstance(contract_type, str):
-                        analysis['CONTRACT_TYPE'] = [contract_type]
-                    elif not isinstance(contract_type, list):
-                        analysis['CONTRACT_TYPE'] = [str(contract_type)]
-                else:
-                    analysis['CONTRACT_TYPE'] = []
-                
-                # Stockage dans Supabase
-                success = await storage.store_job_analysis(analysis)
-                if success:
-                    success_count += 1
-                    airflow_logger.info(f"✅ Analyse chargée avec succès : {key}")
-                    await cache.delete_analysis(key)
-                else:
-                    failure_count += 1
-                    airflow_logger.error(f"❌ Échec du chargement de l'analyse : {key}")
-                
-            except Exception as e:
-                failure_count += 1
-                airflow_logger.error(f"❌ Erreur lors du chargement de {key}: {str(e)}")
-                airflow_logger.exception("Détails de l'erreur:")
+        async for urls in cache.iter_offers(OfferStage.ANALYZED):
+            analysis_total += len(urls)
+            await load_offers(cache, storage, urls, stats, seen_index)
         
         airflow_logger.info(
             "📊 Bilan du chargement:\n"
-            f"  - Analyses à charger: {len(analysis_keys)}\n"
-            f"  - Chargements réussis: {success_count}\n"
-            f"  - Échecs: {failure_count}"
+            f"  - Analyses à charger: {analysis_total}\n"
+            f"  - Chargements réussis: {stats['processed']}\n"
+            f"  - Échecs: {stats['failed']}"
         )
         
     except Exception as e:
         airflow_logger.error(f"❌ Erreur fatale lors du chargement: {str(e)}")
         raise
     finally:
-        cache.close()
+        seen_index.close()
+        await cache.log_summary()
+        await cache.close()
 
 def run_extract():
     """Point d'entrée pour l'extraction"""
@@ -17,15 +17,19 @@ from ..core.enums import (
 load_dotenv()
 
 # Configuration du scraping de liste
+SCRAPING_BASE_URL = "https://www.free-work.com"  # Base des liens relatifs et hôte canonique
 SCRAPING_SOURCES = [
      {
          'name': 'free-work-fullstack',
          'base_url': "https://www.free-work.com/fr/tech-it/jobs?query=D%C3%A9veloppeur%C2%B7euse%20fullstack&freshness=less_than_24_hours",
          'enabled': True,
          'max_pages': 10,  # Limite à 10 pages pour les tests
+         'rate_limit': {'rate': 2.0, 'burst': 4},  # Requêtes/seconde sur l'hôte
          'selectors': {
              'job_link': 'a[href*="/job-mission/"]',
-             'next_button': 'button:-soup-contains("Suivant")'
+             'next_button': 'button:-soup-contains("Suivant")',
+             'job_link_xpath': '//a[contains(@href, "/job-mission/")]',
+             'next_button_xpath': '//button[contains(normalize-space(.), "Suivant")]'
          }
      },
      {
@@ -33,9 +37,12 @@ SCRAPING_SOURCES = [
          'base_url': "https://www.free-work.com/fr/tech-it/jobs?query=Data%20analyst&freshness=less_than_24_hours",
          'enabled': True,
          'max_pages': 10,  # Limite à 10 pages pour les tests
+         'rate_limit': {'rate': 2.0, 'burst': 4},  # Requêtes/seconde sur l'hôte
          'selectors': {
              'job_link': 'a[href*="/job-mission/"]',
-             'next_button': 'button:-soup-contains("Suivant")'
+             'next_button': 'button:-soup-contains("Suivant")',
+             'job_link_xpath': '//a[contains(@href, "/job-mission/")]',
+             'next_button_xpath': '//button[contains(normalize-space(.), "Suivant")]'
          }
      },
      {
@@ -43,9 +50,12 @@ SCRAPING_SOURCES = [
          'base_url': "https://www.free-work.com/fr/tech-it/jobs?query=Data%20engineer&freshness=less_than_24_hours",
          'enabled': True,
          'max_pages': 10,  # Limite à 10 pages pour les tests
+         'rate_limit': {'rate': 2.0, 'burst': 4},  # Requêtes/seconde sur l'hôte
          'selectors': {
              'job_link': 'a[href*="/job-mission/"]',
-             'next_button': 'button:-soup-contains("Suivant")'
+             'next_button': 'button:-soup-contains("Suivant")',
+             'job_link_xpath': '//a[contains(@href, "/job-mission/")]',
+             'next_button_xpath': '//button[contains(normalize-space(.), "Suivant")]'
          }
      },
      {
@@ -53,9 +63,12 @@ SCRAPING_SOURCES = [
           'base_url': "https://www.free-work.com/fr/tech-it/jobs?query=D%C3%A9veloppeur%C2%B7euse%20front-end%20%28JavaScript,%20Node,%20React,%20Angular,%20Vue...%29&freshness=less_than_24_hours",
           'enabled': True,
           'max_pages': 10,  # Limite à 10 pages pour les tests
+          'rate_limit': {'rate': 2.0, 'burst': 4},  # Requêtes/seconde sur l'hôte
           'selectors': {
               'job_link': 'a[href*="/job-mission/"]',
-              'next_button': 'button:-soup-contains("Suivant")'
+              'next_button': 'button:-soup-contains("Suivant")',
+              'job_link_xpath': '//a[contains(@href, "/job-mission/")]',
+              'next_button_xpath': '//button[contains(normalize-space(.), "Suivant")]'
           }
       },
       {
@@ -63,9 +76,12 @@ SCRAPING_SOURCES = [
           'base_url': "https://www.free-work.com/fr/tech-it/jobs?query=D%C3%A9veloppeur%C2%B7euse%20mobile%20iOS%20%28Swift,%20Objective-C...%29&freshness=less_than_24_hours",
           'enabled': True,
           'max_pages': 10,  # Limite à 10 pages pour les tests
+          'rate_limit': {'rate': 2.0, 'burst': 4},  # Requêtes/seconde sur l'hôte
           'selectors': {
               'job_link': 'a[href*="/job-mission/"]',
-              'next_button': 'button:-soup-contains("Suivant")'
+              'next_button': 'button:-soup-contains("Suivant")',
+              'job_link_xpath': '//a[contains(@href, "/job-mission/")]',
+              'next_button_xpath': '//button[contains(normalize-space(.), "Suivant")]'
           }
       },
       {
@@ -73,16 +89,25 @@ SCRAPING_SOURCES = [
           'base_url': "https://www.free-work.com/fr/tech-it/jobs?query=Data%20scientist&freshness=less_than_24_hours",
           'enabled': True,
           'max_pages': 10,  # Limite à 10 pages pour les tests
+          'rate_limit': {'rate': 2.0, 'burst': 4},  # Requêtes/seconde sur l'hôte
           'selectors': {
               'job_link': 'a[href*="/job-mission/"]',
-              'next_button': 'button:-soup-contains("Suivant")'
+              'next_button': 'button:-soup-contains("Suivant")',
+              'job_link_xpath': '//a[contains(@href, "/job-mission/")]',
+              'next_button_xpath': '//button[contains(normalize-space(.), "Suivant")]'
           }
       }
 ]
 
-REQUEST_DELAY = 2  # secondes entre chaque requête
-MAX_RETRIES = 3
-RETRY_DELAY = 5  # secondes
+# Limitation de débit par hôte (token bucket), utilisée si la source n'en définit pas
+RATE_LIMIT_DEFAULT = {'rate': 2.0, 'burst': 4}
+EXTRACTION_CONCURRENCY = 10  # pages d'offres en parallèle au plus (ajusté par ADAPTIVE_CONCURRENCY)
+LIST_PREFETCH = True  # Demande la page N+1 pendant l'analyse de la page N
+LIST_PARSER_ENGINE = 'lxml'  # Moteur d'analyse des pages de liste si la source n'en définit pas ('bs4' ou 'lxml')
+INCREMENTAL_DISCOVERY = True  # Arrête la pagination quand les pages ne contiennent plus que des offres connues
+INCREMENTAL_STOP_AFTER_SEEN_PAGES = 2  # Pages consécutives sans nouvelle offre avant l'arrêt (surchargeable par source)
+MAX_RETRIES = 3  # Nouvelles tentatives après un 429/5xx ou un timeout
+RETRY_DELAY = 5  # secondes, délai de base du backoff exponentiel
 
 # Configuration de l'API Mistral
 MISTRAL_API_KEY = os.getenv('MISTRAL_API_KEY')
@@ -284,8 +309,24 @@ Return NULL if the TJM is missing or for permanent contracts (CDI).
 """
 }
 
+# Extraction des champs par règles (tags et informations clés), avant l'appel à Mistral
+FIELD_EXTRACTOR_MIN_CONFIDENCE = float(os.getenv('FIELD_EXTRACTOR_MIN_CONFIDENCE', 0.8))  # Confiance minimale d'un champ extrait pour ne pas le demander à Mistral (> 1 : tout est demandé)
+
 
 # Configuration du nettoyage HTML
+HTML_CLEANER_ENGINE = 'lxml'  # Moteur du nettoyage des offres ('bs4' ou 'lxml', sortie identique)
+CLEANING_WORKERS = int(os.getenv('CLEANING_WORKERS', max(1, (os.cpu_count() or 1) - 1)))  # Processus de nettoyage (1 = dans le processus courant)
+CLEANING_CHUNK_SIZE = 10  # Pages envoyées à un processus de nettoyage par tâche
+HTML_CLEANER_OUTPUT = os.getenv('HTML_CLEANER_OUTPUT', 'html')  # Format du contenu nettoyé envoyé à Mistral ('html', ou 'markdown' / 'text', plus compacts)
+HTML_CLEANER_TOKEN_BUDGET = 3000  # Tokens au plus en sortie markdown / text, les sections les moins prioritaires sont tronquées
+TOKEN_CHARS_RATIO = 3.5  # Caractères par token, estimation pour le tokenizer Mistral sur du texte français
+
+# Blocs récurrents du gabarit du site (navigation, pied de page, mentions), appris au fil des nettoyages
+BOILERPLATE_ENABLED = os.getenv('BOILERPLATE_ENABLED', 'true').lower() == 'true'  # Retire les blocs de gabarit du contenu nettoyé
+BOILERPLATE_MODEL_PATH = os.getenv('BOILERPLATE_MODEL_PATH', os.path.join('data', 'boilerplate.json'))
+BOILERPLATE_THRESHOLD = 0.5  # Part des pages au-delà de laquelle un bloc est considéré comme du gabarit
+BOILERPLATE_MIN_PAGES = 50  # Pages observées avant de retirer le moindre bloc
+BOILERPLATE_WINDOW = 2000  # Pages entre deux divisions par deux des compteurs (suivi des changements de gabarit)
 ALLOWED_TAGS = [
     'div', 'p', 'span', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
     'ul', 'ol', 'li', 'strong', 'em', 'b', 'i', 'br'
@@ -299,8 +340,29 @@ RELEVANT_CLASSES = [
 
 # Configuration HTTP
 HTTP_TIMEOUT = 30  # secondes
-MAX_RETRIES = 3
-RETRY_DELAY = 5  # secondes
+HTTP_CONNECT_TIMEOUT = 10  # secondes
+HTTP_POOL_LIMIT = 100  # connexions simultanées au total
+HTTP_POOL_LIMIT_PER_HOST = 10  # connexions simultanées par hôte
+HTTP_DNS_CACHE_TTL = 300  # secondes
+HTTP_KEEPALIVE_TIMEOUT = 30  # secondes
+HTTP_HEADERS = {
+    'User-Agent': "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36",
+    'Accept': "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    'Accept-Language': "fr-FR,fr;q=0.9,en;q=0.8",
+    'Accept-Encoding': "gzip, deflate"
+}
+
+# Concurrence adaptative par hôte (AIMD) : +1 requête en vol par fenêtre de réponses
+# rapides, limite multipliée par `decrease_factor` sur 429/5xx/timeout
+ADAPTIVE_CONCURRENCY = {
+    'initial': 2,
+    'min': 1,
+    'max': HTTP_POOL_LIMIT_PER_HOST,
+    'latency_target': 2.0,  # secondes, au-delà la limite n'augmente plus
+    'decrease_factor': 0.5
+}
+RETRY_STATUSES = (429, 500, 502, 503, 504)  # Statuts relancés avec backoff
+RETRY_MAX_DELAY = 60  # secondes, plafond du backoff et du Retry-After
 
 # Configuration du logging
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
@@ -350,11 +412,41 @@ URL: {url}
 
 📊 Stats nettoyage: {original_size:,} → {cleaned_size:,} chars | {scripts_removed} scripts supprimés"""
 
+# Backend du cache : 'redis' (partagé entre machines), 'sqlite' (fichier local, sans réseau) ou 'memory' (tests)
+CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'redis')
+CACHE_SQLITE_PATH = os.getenv('CACHE_SQLITE_PATH', os.path.join('data', 'cache.sqlite3'))
+CACHE_SQLITE_MMAP_SIZE = 256 * 1024 * 1024  # Octets du fichier SQLite lus par projection mémoire
+
 # Configuration du cache Redis
 REDIS_HOST = os.getenv('REDIS_HOST', 'redis')  # Nom du service dans docker-compose
 REDIS_PORT = int(os.getenv('REDIS_PORT', 6379))
 REDIS_DB = int(os.getenv('REDIS_DB', 0))
+REDIS_MAX_CONNECTIONS = int(os.getenv('REDIS_MAX_CONNECTIONS', 32))  # Taille de chaque pool de connexions du cache
 CACHE_TTL = 48 * 3600  # 48 heures
+CACHE_SCAN_COUNT = 500  # Clés demandées par itération de SCAN
+CACHE_BATCH_SIZE = 100  # Offres lues / écrites par aller-retour groupé (MGET, pipeline)
+OFFER_TTL = 7 * 24 * 3600  # 7 jours, durée de vie du suivi d'étape d'une offre (offer:<url>)
+VALIDATORS_TTL = 30 * 24 * 3600  # 30 jours, conservés après expiration du marqueur pour les requêtes conditionnelles
+FINGERPRINT_TTL = 30 * 24 * 3600  # 30 jours, empreintes des entrées déjà nettoyées / analysées
+CACHE_METRICS_SAMPLE_INTERVAL = 300  # Secondes entre deux mesures de l'occupation mémoire par préfixe
+CACHE_METRICS_SAMPLE_SIZE = 200  # Clés tirées au hasard par mesure (MEMORY USAGE, backend Redis)
+CACHE_COMPRESSION = os.getenv('CACHE_COMPRESSION', 'zlib')  # 'zlib', 'zstd' (si zstandard est installé) ou 'none'
+CACHE_COMPRESSION_LEVEL = 6
+CACHE_COMPRESSION_DICTIONARY_PATH = os.getenv('CACHE_COMPRESSION_DICTIONARY_PATH', os.path.join('data', 'freework.zdict'))  # Dictionnaire zstd entraîné (train_compression_dictionary), utilisé s'il existe
+
+# Files de travail Redis Streams (workers répartis sur une ou plusieurs machines)
+WORK_QUEUE_ENABLED = os.getenv('WORK_QUEUE_ENABLED', 'false').lower() == 'true'  # Publie chaque offre dans le stream de son étape
+WORK_QUEUE_GROUP = os.getenv('WORK_QUEUE_GROUP', 'workers')  # Groupe de consommateurs partagé par les workers d'une étape
+WORK_QUEUE_BATCH_SIZE = 20  # Offres réclamées par un worker à chaque lecture
+WORK_QUEUE_BLOCK_MS = 5000  # Attente maximale d'une lecture sur un stream vide
+STREAM_MAXLEN = 100_000  # Longueur approximative des streams (l'index d'étape reste la référence)
+STREAM_CLAIM_IDLE_MS = 10 * 60 * 1000  # 10 minutes sans acquittement : l'offre est reprise par un autre worker
+STREAM_MAX_DELIVERIES = 5  # Distributions d'un message en échec avant son abandon (acquitté sans traitement)
+
+# Index longue durée des offres déjà chargées (filtre de Bloom sur disque)
+SEEN_INDEX_PATH = os.getenv('SEEN_INDEX_PATH', os.path.join('data', 'seen_urls.bloom'))
+SEEN_INDEX_CAPACITY = 5_000_000  # URLs prévues, fixe la taille du fichier à la création
+SEEN_INDEX_ERROR_RATE = 0.001  # Part d'offres nouvelles ignorées à tort, à pleine capacité
 
 # Configuration Docker
 DOCKER_IMAGE = 'job-analyzer-scraper'
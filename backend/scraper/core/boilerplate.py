@@ -0,0 +1,172 @@
+"""
+Module d'apprentissage des blocs récurrents du gabarit du site (navigation, pied de page, mentions légales).
+"""
+
+import fcntl
+import json
+import os
+from typing import Dict, FrozenSet, Iterable
+from loguru import logger
+
+from .fingerprint import fingerprint
+from ..config.settings import (
+    BOILERPLATE_MIN_PAGES,
+    BOILERPLATE_MODEL_PATH,
+    BOILERPLATE_THRESHOLD,
+    BOILERPLATE_WINDOW
+)
+
+def block_fingerprint(tag: str, text: str) -> str:
+    """
+    Calcule l'empreinte d'un bloc de contenu, indépendante des espaces.
+
+    Args:
+        tag: La balise du bloc
+        text: Le texte du bloc
+
+    Returns:
+        str: L'empreinte hexadécimale (64 bits)
+    """
+    return fingerprint(f"{tag}:{' '.join(text.split())}")[:16]
+
+class BoilerplateSnapshot:
+    """
+    Blocs de gabarit figés à un instant, envoyés aux processus du pool de nettoyage
+    avec chaque paquet de pages (le modèle, lui, reste dans le processus principal).
+    """
+
+    def __init__(self, blocks: FrozenSet[str]):
+        self.blocks = blocks
+
+    def is_boilerplate(self, block: str) -> bool:
+        """True si le bloc faisait partie du gabarit au moment de la copie."""
+        return block in self.blocks
+
+class BoilerplateModel:
+    """
+    Fréquence des blocs de contenu sur les pages d'offres nettoyées.
+
+    Chaque page apporte les empreintes de ses blocs ; un bloc présent sur plus de
+    `threshold` des pages observées appartient au gabarit du site et est retiré.
+    Les compteurs sont divisés par deux toutes les `window` pages : après un changement
+    de gabarit, les anciens blocs sont oubliés et les nouveaux appris en quelques
+    centaines de pages.
+
+    Plusieurs processus (workers, DAG) peuvent partager le fichier du modèle : chacun
+    y ajoute ses propres observations à l'enregistrement, sous verrou.
+    """
+
+    def __init__(
+        self,
+        path: str = BOILERPLATE_MODEL_PATH,
+        threshold: float = BOILERPLATE_THRESHOLD,
+        min_pages: int = BOILERPLATE_MIN_PAGES,
+        window: int = BOILERPLATE_WINDOW
+    ):
+        """
+        Charge le modèle, vide s'il n'existe pas.
+
+        Args:
+            path: Chemin du fichier JSON du modèle
+            threshold: Part des pages au-delà de laquelle un bloc est du gabarit
+            min_pages: Pages observées avant de retirer des blocs
+            window: Pages entre deux divisions des compteurs
+        """
+        if not 0 < threshold < 1 or window < 2:
+            raise ValueError(f"Paramètres du modèle invalides (threshold={threshold}, window={window})")
+        self.path = path
+        self.threshold = threshold
+        self.min_pages = min_pages
+        self.window = window
+        self.pages = 0
+        self.counts: Dict[str, int] = {}
+        # Observations pas encore enregistrées, ajoutées au fichier par save()
+        self._pending_pages = 0
+        self._pending_counts: Dict[str, int] = {}
+        self._load()
+
+    def _load(self) -> None:
+        """Charge les compteurs depuis le fichier du modèle."""
+        self.pages = 0
+        self.counts = {}
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+            self.pages = int(data['pages'])
+            self.counts = {str(block): int(count) for block, count in data['blocks'].items()}
+            logger.debug(f"🧱 Modèle de gabarit chargé ({self.pages} pages, {len(self.counts)} blocs)")
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"⚠️ Modèle de gabarit illisible, il sera reconstruit: {self.path} ({str(e)})")
+            self.pages = 0
+            self.counts = {}
+
+    def is_boilerplate(self, block: str) -> bool:
+        """True si le bloc apparaît sur trop de pages pour être propre à une offre."""
+        return self.pages >= self.min_pages and self.counts.get(block, 0) > self.threshold * self.pages
+
+    def observe(self, blocks: Iterable[str]) -> None:
+        """
+        Enregistre les blocs d'une page.
+
+        Args:
+            blocks: Les empreintes des blocs de la page
+        """
+        for block in set(blocks):
+            self.counts[block] = self.counts.get(block, 0) + 1
+            self._pending_counts[block] = self._pending_counts.get(block, 0) + 1
+        self.pages += 1
+        self._pending_pages += 1
+        self._decay()
+
+    def _decay(self) -> None:
+        """Divise les compteurs par deux tant que la fenêtre est atteinte."""
+        while self.pages >= self.window:
+            # Vieillissement : les blocs qui ne reviennent plus finissent par disparaître
+            self.pages //= 2
+            self.counts = {block: count // 2 for block, count in self.counts.items() if count >= 2}
+
+    @property
+    def boilerplate_count(self) -> int:
+        """Nombre de blocs actuellement considérés comme du gabarit."""
+        return sum(self.is_boilerplate(block) for block in self.counts)
+
+    def boilerplate_blocks(self) -> FrozenSet[str]:
+        """Retourne les empreintes des blocs actuellement considérés comme du gabarit."""
+        return frozenset(block for block in self.counts if self.is_boilerplate(block))
+
+    def snapshot(self) -> BoilerplateSnapshot:
+        """Retourne une copie figée des blocs de gabarit, à envoyer à un autre processus."""
+        return BoilerplateSnapshot(self.boilerplate_blocks())
+
+    def save(self) -> None:
+        """
+        Ajoute les nouvelles observations au modèle enregistré sur disque.
+
+        Le fichier est relu sous verrou exclusif, complété des observations de ce
+        processus puis remplacé atomiquement (fichier temporaire propre au processus) :
+        les enregistrements concurrents s'additionnent au lieu de s'écraser.
+        """
+        if not self._pending_pages:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(f"{self.path}.lock", 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            self._load()
+            for block, count in self._pending_counts.items():
+                self.counts[block] = self.counts.get(block, 0) + count
+            self.pages += self._pending_pages
+            self._decay()
+            temporary_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temporary_path, 'w', encoding='utf-8') as f:
+                json.dump({'pages': self.pages, 'blocks': self.counts}, f, separators=(',', ':'))
+            os.replace(temporary_path, self.path)
+        self._pending_pages = 0
+        self._pending_counts = {}
+        logger.debug(
+            f"🧱 Modèle de gabarit enregistré ({self.pages} pages, {len(self.counts)} blocs, "
+            f"{self.boilerplate_count} retirés)"
+        )
@@ -1,42 +1,125 @@
 """
-Module de gestion du cache Redis pour le suivi des offres traitées.
+Module de gestion du cache pour le suivi des offres traitées.
 """
 
+import asyncio
+import time
 from datetime import datetime
-from typing import Optional
-from redis import Redis
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
 from loguru import logger
 
+from .cache_backend import CacheBackend, CacheBatch, create_backend
+from .cache_metrics import CacheMetrics, timed
+from .compression import compress_text, decompress_text
+from .fingerprint import fingerprint
+from .serialization import encode_payload, decode_payload
+from .offer_state import OfferStage, INDEXED_STAGES, ANY_STAGE, NO_STAGE
+
 from ..config.settings import (
-    REDIS_HOST,
-    REDIS_PORT,
-    REDIS_DB,
-    CACHE_TTL
+    CACHE_TTL,
+    OFFER_TTL,
+    CACHE_BATCH_SIZE,
+    VALIDATORS_TTL,
+    FINGERPRINT_TTL,
+    CACHE_METRICS_SAMPLE_INTERVAL,
+    CACHE_METRICS_SAMPLE_SIZE,
+    WORK_QUEUE_ENABLED
 )
 
+# Préfixe du résultat de chaque étape à empreinte
+STAGE_PAYLOAD_PREFIXES = {"cleaned": "cleaned_html", "analyzed": "analysis"}
+
+# Champs du hash offer:<url> qui portent les validateurs HTTP en attente de chargement
+VALIDATOR_FIELD_PREFIX = "validator_"
+
+async def batched(keys: AsyncIterator[str], size: int = CACHE_BATCH_SIZE) -> AsyncIterator[List[str]]:
+    """
+    Regroupe un flux de clés en lots pour les opérations groupées du cache.
+    
+    Args:
+        keys: Le flux de clés (ex: JobCache.iter_raw_html_keys())
+        size: Taille maximale d'un lot
+        
+    Yields:
+        List[str]: Les lots de clés
+    """
+    batch = []
+    async for key in keys:
+        batch.append(key)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
 class JobCache:
     """
-    Gestion du cache Redis pour le suivi des offres d'emploi traitées.
-    Utilise Redis pour stocker les URLs avec un TTL de 48 heures.
+    Gestion du cache pour le suivi des offres d'emploi traitées.
+    Stocke les URLs avec un TTL de 48 heures, dans le backend configuré
+    (Redis par défaut, SQLite ou mémoire pour une seule machine).
     """
 
-    def __init__(self):
-        """Initialise la connexion Redis avec les paramètres de configuration."""
+    def __init__(self, backend: Optional[CacheBackend] = None):
+        """
+        Initialise le cache sur un backend.
+
+        Args:
+            backend: Le backend de stockage (CACHE_BACKEND par défaut)
+        """
         try:
-            self.redis = Redis(
-                host=REDIS_HOST,
-                port=REDIS_PORT,
-                db=REDIS_DB,
-                decode_responses=True  # Pour avoir des str au lieu de bytes
-            )
-            logger.info(f"✅ Connexion Redis établie ({REDIS_HOST}:{REDIS_PORT})")
+            self.backend = backend or create_backend()
         except Exception as e:
-            logger.error(f"❌ Erreur de connexion Redis: {str(e)}")
+            logger.error(f"❌ Erreur d'initialisation du cache: {str(e)}")
             raise
+        if WORK_QUEUE_ENABLED and self.backend.name != "redis":
+            logger.warning(f"⚠️ Files de travail indisponibles avec le backend {self.backend.name}")
+        self.metrics = CacheMetrics()
+        self._memory_task: Optional[asyncio.Task] = None
+        self._memory_sampled_at = time.monotonic()
+
+    def _maybe_sample_memory(self) -> None:
+        """Lance en tâche de fond un échantillonnage mémoire toutes les CACHE_METRICS_SAMPLE_INTERVAL secondes."""
+        if time.monotonic() - self._memory_sampled_at < CACHE_METRICS_SAMPLE_INTERVAL:
+            return
+        if self._memory_task is not None and not self._memory_task.done():
+            return
+        self._memory_sampled_at = time.monotonic()
+        self._memory_task = asyncio.get_running_loop().create_task(self.sample_memory())
+
+    async def sample_memory(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Mesure l'occupation du cache par préfixe et l'ajoute aux métriques.
+        
+        Sur Redis, l'occupation est estimée à partir de CACHE_METRICS_SAMPLE_SIZE
+        clés tirées au hasard (MEMORY USAGE) ; elle est exacte sur les backends embarqués.
+        
+        Returns:
+            Dict[str, Tuple[int, int]]: Préfixe → (nombre de clés, octets)
+        """
+        try:
+            usage = await self.backend.memory_usage(CACHE_METRICS_SAMPLE_SIZE)
+            self.metrics.record_memory(usage)
+            return usage
+        except Exception as e:
+            logger.error(f"❌ Erreur lors de la mesure de l'occupation du cache: {str(e)}")
+            return {}
+
+    async def log_summary(self) -> None:
+        """Mesure l'occupation du cache puis journalise le bilan des métriques."""
+        await self.sample_memory()
+        logger.info(self.metrics.summary())
+
+    async def _execute(self, batch: CacheBatch) -> List[Any]:
+        """Applique un lot puis comptabilise ses écritures dans les métriques, une fois réussies."""
+        writes = batch.pending_writes()
+        results = await batch.execute()
+        for key, size in writes:
+            self.metrics.record_write(key, size)
+        return results
 
     def _get_key(self, url: str, prefix: str = "job") -> str:
         """
-        Génère la clé Redis pour une URL.
+        Génère la clé du cache pour une URL.
         
         Args:
             url: L'URL de l'offre
@@ -47,29 +130,62 @@ class JobCache:
         """
         return f"{prefix}:{url}"
 
-    async def store_raw_html(self, url: str, html_content: str) -> None:
+    async def _iter_keys(self, prefix: str) -> AsyncIterator[str]:
         """
-        Stocke le HTML brut d'une offre dans Redis.
+        Parcourt les clés d'un préfixe.
+        
+        Sur Redis, le parcours utilise SCAN, qui ne bloque pas le serveur : les
+        clés arrivent par lots de CACHE_SCAN_COUNT. Une clé peut être renvoyée
+        plusieurs fois, d'où le dédoublonnage local.
+        
+        Args:
+            prefix: Le préfixe des clés à parcourir
+            
+        Yields:
+            str: Les clés trouvées
+        """
+        seen = set()
+        try:
+            async for key in self.backend.iter_keys(self._get_key("", prefix=prefix)):
+                if key not in seen:
+                    seen.add(key)
+                    yield key
+        except Exception as e:
+            logger.error(f"❌ Erreur lors du parcours des clés {prefix}: {str(e)}")
+
+    @timed("store_raw_html")
+    async def store_raw_html(self, url: str, html_content: str, validators: Optional[Dict[str, str]] = None) -> None:
+        """
+        Stocke le HTML brut d'une offre dans le cache.
+        
+        Les validateurs HTTP de la réponse sont gardés dans le hash de l'offre :
+        ils ne servent aux requêtes conditionnelles qu'une fois l'offre chargée
+        (voir complete_offers), sans quoi une réponse 304 sauterait une offre
+        jamais arrivée dans Supabase.
         
         Args:
             url: L'URL de l'offre
             html_content: Le contenu HTML brut à stocker
+            validators: Les validateurs retournés par le serveur
         """
         try:
             # Utilise un préfixe différent pour le HTML brut
             key = self._get_key(url, prefix="raw_html")
-            self.redis.set(
-                key,
-                html_content,
-                ex=CACHE_TTL
-            )
-            # Marque aussi l'URL comme traitée
-            await self.mark_processed(url)
+            batch = self.backend.batch()
+            batch.set(key, compress_text(html_content), CACHE_TTL)
+            # Marque aussi l'URL comme traitée et l'offre comme récupérée, dans le même aller-retour
+            batch.set(self._get_key(url), str(datetime.now().timestamp()), CACHE_TTL)
+            pending_validators = {
+                f"{VALIDATOR_FIELD_PREFIX}{name}": value for name, value in (validators or {}).items()
+            }
+            self._queue_transition(batch, url, OfferStage.FETCHED, raw_ref=key, **pending_validators)
+            await self._execute(batch)
             logger.debug(f"✅ HTML stocké pour: {url}")
         except Exception as e:
             logger.error(f"❌ Erreur lors du stockage du HTML: {str(e)}")
             raise
 
+    @timed("is_processed")
     async def is_processed(self, url: str) -> bool:
         """
         Vérifie si une URL a déjà été traitée.
@@ -81,11 +197,36 @@ class JobCache:
             bool: True si l'URL est dans le cache
         """
         try:
-            return bool(self.redis.exists(self._get_key(url)))
+            return (await self.are_processed([url]))[0]
         except Exception as e:
+            self.metrics.observe_error("is_processed")
             logger.error(f"❌ Erreur lors de la vérification du cache: {str(e)}")
             return False
 
+    @timed("are_processed")
+    async def are_processed(self, urls: List[str]) -> List[bool]:
+        """
+        Vérifie en un seul aller-retour quelles URLs ont déjà été traitées.
+        
+        Args:
+            urls: Les URLs à vérifier
+            
+        Returns:
+            List[bool]: Pour chaque URL (même ordre), True si elle est dans le cache
+        """
+        if not urls:
+            return []
+        try:
+            keys = [self._get_key(url) for url in urls]
+            processed = await self.backend.exists_many(keys)
+            self.metrics.record_lookup(keys, processed)
+            return processed
+        except Exception as e:
+            self.metrics.observe_error("are_processed")
+            logger.error(f"❌ Erreur lors de la vérification du cache: {str(e)}")
+            return [False] * len(urls)
+
+    @timed("mark_processed")
     async def mark_processed(self, url: str) -> None:
         """
         Marque une URL comme traitée avec un TTL.
@@ -95,15 +236,78 @@ class JobCache:
         """
         try:
             key = self._get_key(url)
-            self.redis.set(
+            await self._execute(self.backend.batch().set(
                 key,
                 str(datetime.now().timestamp()),
-                ex=CACHE_TTL
-            )
+                CACHE_TTL
+            ))
             logger.debug(f"✅ URL marquée comme traitée: {url}")
         except Exception as e:
+            self.metrics.observe_error("mark_processed")
             logger.error(f"❌ Erreur lors du marquage dans le cache: {str(e)}")
 
+    @timed("store_validators")
+    async def store_validators(self, url: str, validators: Dict[str, str]) -> None:
+        """
+        Stocke les validateurs HTTP (ETag, Last-Modified, taille) d'une offre chargée.
+        Ils survivent au marqueur de traitement pour permettre une revalidation.
+        
+        Args:
+            url: L'URL de l'offre
+            validators: Les validateurs retournés par le serveur
+        """
+        if not validators:
+            return
+        try:
+            key = self._get_key(url, prefix="validators")
+            await self._execute(self.backend.batch(transaction=True).set_hash(key, validators, VALIDATORS_TTL))
+            logger.debug(f"✅ Validateurs stockés pour: {url}")
+        except Exception as e:
+            self.metrics.observe_error("store_validators")
+            logger.error(f"❌ Erreur lors du stockage des validateurs: {str(e)}")
+
+    @timed("get_validators")
+    async def get_validators(self, url: str) -> Dict[str, str]:
+        """
+        Récupère les validateurs HTTP connus d'une offre.
+        
+        Args:
+            url: L'URL de l'offre
+            
+        Returns:
+            Dict[str, str]: Les validateurs (vide si inconnus)
+        """
+        try:
+            return (await self.get_validators_many([url]))[0]
+        except Exception as e:
+            self.metrics.observe_error("get_validators")
+            logger.error(f"❌ Erreur lors de la récupération des validateurs: {str(e)}")
+            return {}
+
+    @timed("get_validators_many")
+    async def get_validators_many(self, urls: List[str]) -> List[Dict[str, str]]:
+        """
+        Récupère en un seul aller-retour les validateurs HTTP de plusieurs offres.
+        
+        Args:
+            urls: Les URLs des offres
+            
+        Returns:
+            List[Dict[str, str]]: Les validateurs de chaque URL (même ordre, vides si inconnus)
+        """
+        if not urls:
+            return []
+        try:
+            keys = [self._get_key(url, prefix="validators") for url in urls]
+            validators = await self.backend.get_hashes(keys)
+            self.metrics.record_lookup(keys, validators)
+            return validators
+        except Exception as e:
+            self.metrics.observe_error("get_validators_many")
+            logger.error(f"❌ Erreur lors de la récupération des validateurs: {str(e)}")
+            return [{} for _ in urls]
+
+    @timed("get_last_processed_time")
     async def get_last_processed_time(self, url: str) -> Optional[datetime]:
         """
         Récupère la dernière date de traitement d'une URL.
@@ -115,197 +319,715 @@ class JobCache:
             Optional[datetime]: La date de dernier traitement ou None
         """
         try:
-            timestamp = self.redis.get(self._get_key(url))
+            timestamp = (await self.backend.get_many([self._get_key(url)]))[0]
             if timestamp:
                 return datetime.fromtimestamp(float(timestamp))
             return None
         except Exception as e:
+            self.metrics.observe_error("get_last_processed_time")
             logger.error(f"❌ Erreur lors de la récupération du timestamp: {str(e)}")
             return None
 
-    def clear_cache(self) -> None:
+    async def clear_cache(self) -> None:
         """Vide le cache (utile pour les tests)."""
         try:
-            self.redis.flushdb()
-            logger.warning("🗑 Cache Redis vidé")
+            await self.backend.clear()
+            logger.warning("🗑 Cache vidé")
         except Exception as e:
             logger.error(f"❌ Erreur lors du vidage du cache: {str(e)}")
 
-    def close(self) -> None:
-        """Ferme la connexion Redis."""
+    async def close(self) -> None:
+        """Ferme le backend (clients et pools Redis, fichier SQLite)."""
+        if self._memory_task is not None and not self._memory_task.done():
+            self._memory_task.cancel()
         try:
-            self.redis.close()
-            logger.info("👋 Connexion Redis fermée")
+            await self.backend.close()
+            logger.info(f"👋 Cache {self.backend.name} fermé")
         except Exception as e:
-            logger.error(f"❌ Erreur lors de la fermeture de Redis: {str(e)}")
+            logger.error(f"❌ Erreur lors de la fermeture du cache: {str(e)}")
 
     async def get_all_raw_html_keys(self) -> list[str]:
         """
-        Récupère toutes les clés des HTML bruts stockés.
+        Récupère toutes les clés raw_html (préférer iter_raw_html_keys pour un parcours progressif).
         
         Returns:
             list[str]: Liste des clés raw_html
         """
-        try:
-            pattern = self._get_key("*", prefix="raw_html")
-            keys = self.redis.keys(pattern)
-            logger.debug(f"✅ {len(keys)} clés raw_html trouvées")
-            return keys
-        except Exception as e:
-            logger.error(f"❌ Erreur lors de la récupération des clés raw_html: {str(e)}")
-            return []
+        keys = [key async for key in self.iter_raw_html_keys()]
+        logger.debug(f"✅ {len(keys)} clés raw_html trouvées")
+        return keys
 
+    async def iter_raw_html_keys(self) -> AsyncIterator[str]:
+        """
+        Parcourt les clés raw_html par lots, sans charger tout l'espace de clés.
+        
+        Yields:
+            str: Les clés raw_html
+        """
+        async for key in self._iter_keys("raw_html"):
+            yield key
+
+    @timed("get_raw_html")
     async def get_raw_html(self, key: str) -> Optional[str]:
         """
         Récupère le HTML brut pour une clé donnée.
         
         Args:
-            key: La clé Redis complète (raw_html:url)
+            key: La clé complète (raw_html:url)
             
         Returns:
             Optional[str]: Le contenu HTML ou None
         """
         try:
-            content = self.redis.get(key)
+            content = (await self.backend.get_many([key]))[0]
+            self.metrics.record_lookup([key], [content])
             if content:
                 logger.debug(f"✅ HTML récupéré pour: {key}")
-                return content
+                return decompress_text(content)
             return None
         except Exception as e:
+            self.metrics.observe_error("get_raw_html")
             logger.error(f"❌ Erreur lors de la récupération du HTML: {str(e)}")
             return None
 
-    async def store_analysis(self, key: str, analysis: dict) -> None:
+    @timed("get_raw_html_many")
+    async def get_raw_html_many(self, keys: List[str]) -> List[Optional[str]]:
+        """
+        Récupère le HTML brut de plusieurs offres en un seul MGET.
+        
+        Args:
+            keys: Les clés complètes (raw_html:url)
+            
+        Returns:
+            List[Optional[str]]: Le contenu HTML de chaque clé (même ordre, None si absent)
+        """
+        return await self._get_html_many(keys, "get_raw_html_many")
+
+    async def _get_html_many(self, keys: List[str], operation: str) -> List[Optional[str]]:
+        """Lit et décompresse plusieurs pages HTML en un seul MGET."""
+        if not keys:
+            return []
+        try:
+            values = await self.backend.get_many(keys)
+            self.metrics.record_lookup(keys, values)
+            return [decompress_text(value) if value else None for value in values]
+        except Exception as e:
+            self.metrics.observe_error(operation)
+            logger.error(f"❌ Erreur lors de la récupération groupée du HTML: {str(e)}")
+            return [None] * len(keys)
+
+    @timed("store_analysis")
+    async def store_analysis(self, key: str, analysis: dict, source_fingerprint: Optional[str] = None) -> None:
         """
         Stocke le résultat de l'analyse DeepSeek.
         
         Args:
-            key: La clé Redis de l'offre (raw_html:url)
+            key: La clé de l'offre (raw_html:url)
             analysis: Le dictionnaire contenant l'analyse
+            source_fingerprint: Empreinte du HTML nettoyé analysé
         """
         try:
-            # Extrait l'URL de la clé raw_html:url
-            url = key.split(":", 1)[1]
-            
-            # Ajoute l'URL à l'analyse
-            analysis['URL'] = url
-            
-            # Stocke avec le préfixe analysis
-            analysis_key = self._get_key(url, prefix="analysis")
-            self.redis.set(
-                analysis_key,
-                str(analysis),  # Convertit le dict en str
-                ex=CACHE_TTL
-            )
+            batch = self.backend.batch(transaction=True)
+            url = self._queue_analysis(batch, key, analysis, source_fingerprint)
+            await self._execute(batch)
             logger.debug(f"✅ Analyse stockée pour: {url}")
         except Exception as e:
             logger.error(f"❌ Erreur lors du stockage de l'analyse: {str(e)}")
             raise
 
-    async def store_cleaned_html(self, key: str, cleaned_html: str) -> None:
+    @timed("store_analysis_many")
+    async def store_analysis_many(self, items: List[Tuple[str, dict, Optional[str]]]) -> None:
+        """
+        Stocke plusieurs analyses en un seul aller-retour.
+        
+        Args:
+            items: Triplets (clé raw_html:url, analyse, empreinte du HTML nettoyé)
+        """
+        if not items:
+            return
+        try:
+            batch = self.backend.batch()
+            for key, analysis, source_fingerprint in items:
+                self._queue_analysis(batch, key, analysis, source_fingerprint)
+            await self._execute(batch)
+            logger.debug(f"✅ {len(items)} analyses stockées")
+        except Exception as e:
+            logger.error(f"❌ Erreur lors du stockage groupé des analyses: {str(e)}")
+            raise
+
+    def _queue_analysis(self, batch: CacheBatch, key: str, analysis: dict, source_fingerprint: Optional[str]) -> str:
+        """Ajoute l'écriture d'une analyse (empreinte et étape comprises) à un lot, retourne l'URL."""
+        # Extrait l'URL de la clé raw_html:url
+        url = key.split(":", 1)[1]
+        
+        # Ajoute l'URL à l'analyse
+        analysis['URL'] = url
+        
+        # Stocke avec le préfixe analysis ; une analyse réussie (avec empreinte) est
+        # gardée après le chargement, pour une offre récupérée à l'identique
+        batch.set(
+            self._get_key(url, prefix="analysis"),
+            encode_payload(analysis),
+            FINGERPRINT_TTL if source_fingerprint else CACHE_TTL
+        )
+        if source_fingerprint:
+            batch.set(self._get_key(url, prefix="fp:analyzed"), source_fingerprint, FINGERPRINT_TTL)
+        self._queue_transition(
+            batch, url, OfferStage.ANALYZED, OfferStage.CLEANED,
+            analysis_ref=self._get_key(url, prefix="analysis")
+        )
+        return url
+
+    @timed("store_cleaned_html")
+    async def store_cleaned_html(self, key: str, cleaned_html: str, source_fingerprint: Optional[str] = None) -> None:
         """
-        Stocke le HTML nettoyé dans Redis.
+        Stocke le HTML nettoyé dans le cache.
         
         Args:
-            key: La clé Redis de l'offre (raw_html:url)
+            key: La clé de l'offre (raw_html:url)
             cleaned_html: Le contenu HTML nettoyé
+            source_fingerprint: Empreinte du HTML brut nettoyé
         """
         try:
-            cleaned_key = key.replace('raw_html:', 'cleaned_html:')
-            self.redis.set(cleaned_key, cleaned_html, ex=CACHE_TTL)
+            batch = self.backend.batch(transaction=True)
+            cleaned_key = self._queue_cleaned_html(batch, key, cleaned_html, source_fingerprint)
+            await self._execute(batch)
             logger.debug(f"✅ HTML nettoyé stocké pour: {cleaned_key}")
         except Exception as e:
             logger.error(f"❌ Erreur lors du stockage du HTML nettoyé: {str(e)}")
             raise
 
+    @timed("store_cleaned_html_many")
+    async def store_cleaned_html_many(self, items: List[Tuple[str, str, Optional[str]]]) -> None:
+        """
+        Stocke plusieurs HTML nettoyés en un seul aller-retour.
+        
+        Args:
+            items: Triplets (clé raw_html:url, HTML nettoyé, empreinte du HTML brut)
+        """
+        if not items:
+            return
+        try:
+            batch = self.backend.batch()
+            for key, cleaned_html, source_fingerprint in items:
+                self._queue_cleaned_html(batch, key, cleaned_html, source_fingerprint)
+            await self._execute(batch)
+            logger.debug(f"✅ {len(items)} HTML nettoyés stockés")
+        except Exception as e:
+            logger.error(f"❌ Erreur lors du stockage groupé des HTML nettoyés: {str(e)}")
+            raise
+
+    def _queue_cleaned_html(self, batch: CacheBatch, key: str, cleaned_html: str, source_fingerprint: Optional[str]) -> str:
+        """Ajoute l'écriture d'un HTML nettoyé (empreinte et étape comprises) à un lot, retourne sa clé."""
+        cleaned_key = key.replace('raw_html:', 'cleaned_html:')
+        url = key.split(":", 1)[1]
+        batch.set(cleaned_key, compress_text(cleaned_html), CACHE_TTL)
+        if source_fingerprint:
+            batch.set(self._get_key(url, prefix="fp:cleaned"), source_fingerprint, FINGERPRINT_TTL)
+            # Empreinte du résultat : l'analyse gardée n'est réutilisable que si elle porte sur lui
+            batch.set(self._get_key(url, prefix="fp:cleaned_output"), fingerprint(cleaned_html), FINGERPRINT_TTL)
+        self._queue_transition(batch, url, OfferStage.CLEANED, OfferStage.FETCHED, cleaned_ref=cleaned_key)
+        return cleaned_key
+
+    @timed("get_fingerprint")
+    async def get_fingerprint(self, url: str, stage: str) -> Optional[str]:
+        """
+        Récupère l'empreinte de l'entrée traitée lors du dernier passage d'une étape.
+        
+        Args:
+            url: L'URL de l'offre
+            stage: L'étape ("cleaned" ou "analyzed")
+            
+        Returns:
+            Optional[str]: L'empreinte ou None si l'étape n'a jamais abouti
+        """
+        try:
+            return (await self.get_fingerprints([url], stage))[0]
+        except Exception as e:
+            self.metrics.observe_error("get_fingerprint")
+            logger.error(f"❌ Erreur lors de la récupération de l'empreinte: {str(e)}")
+            return None
+
+    @timed("get_fingerprints")
+    async def get_fingerprints(self, urls: List[str], stage: str) -> List[Optional[str]]:
+        """
+        Récupère en un seul MGET les empreintes d'une étape pour plusieurs offres.
+        
+        Args:
+            urls: Les URLs des offres
+            stage: L'étape ("cleaned", "cleaned_output" ou "analyzed")
+            
+        Returns:
+            List[Optional[str]]: L'empreinte de chaque URL (même ordre, None si absente)
+        """
+        if not urls:
+            return []
+        try:
+            keys = [self._get_key(url, prefix=f"fp:{stage}") for url in urls]
+            values = await self.backend.get_many(keys)
+            self.metrics.record_lookup(keys, values)
+            return [value.decode('utf-8') if value else None for value in values]
+        except Exception as e:
+            self.metrics.observe_error("get_fingerprints")
+            logger.error(f"❌ Erreur lors de la récupération des empreintes: {str(e)}")
+            return [None] * len(urls)
+
+    @timed("get_reusable_fingerprints")
+    async def get_reusable_fingerprints(self, urls: List[str], stage: str) -> List[Optional[str]]:
+        """
+        Récupère les empreintes d'une étape pour les offres dont le résultat est encore en cache.
+        
+        Les empreintes peuvent survivre au résultat (le HTML nettoyé expire après
+        CACHE_TTL et est supprimé au chargement) : une empreinte identique ne permet
+        de sauter l'étape que si le HTML nettoyé ou l'analyse existe toujours.
+        
+        Args:
+            urls: Les URLs des offres
+            stage: L'étape ("cleaned" ou "analyzed")
+            
+        Returns:
+            List[Optional[str]]: L'empreinte de chaque URL (même ordre, None si absente ou sans résultat)
+        """
+        if not urls:
+            return []
+        try:
+            payload_prefix = STAGE_PAYLOAD_PREFIXES[stage]
+            fingerprints, payloads = await asyncio.gather(
+                self.get_fingerprints(urls, stage),
+                self.backend.exists_many([self._get_key(url, prefix=payload_prefix) for url in urls])
+            )
+            return [value if exists else None for value, exists in zip(fingerprints, payloads)]
+        except Exception as e:
+            self.metrics.observe_error("get_reusable_fingerprints")
+            logger.error(f"❌ Erreur lors de la récupération des empreintes: {str(e)}")
+            return [None] * len(urls)
+
+    @timed("get_cleaned_html")
     async def get_cleaned_html(self, key: str) -> Optional[str]:
         """
-        Récupère le HTML nettoyé depuis Redis.
+        Récupère le HTML nettoyé depuis le cache.
         
         Args:
-            key: La clé Redis de l'offre (cleaned_html:url)
+            key: La clé de l'offre (cleaned_html:url)
             
         Returns:
             Optional[str]: Le contenu HTML nettoyé ou None
         """
         try:
-            content = self.redis.get(key)
+            content = (await self.backend.get_many([key]))[0]
+            self.metrics.record_lookup([key], [content])
             if content:
                 logger.debug(f"✅ HTML nettoyé récupéré pour: {key}")
-                return content
+                return decompress_text(content)
             return None
         except Exception as e:
+            self.metrics.observe_error("get_cleaned_html")
             logger.error(f"❌ Erreur lors de la récupération du HTML nettoyé: {str(e)}")
             return None
 
+    @timed("get_cleaned_html_many")
+    async def get_cleaned_html_many(self, keys: List[str]) -> List[Optional[str]]:
+        """
+        Récupère plusieurs HTML nettoyés en un seul MGET.
+        
+        Args:
+            keys: Les clés complètes (cleaned_html:url)
+            
+        Returns:
+            List[Optional[str]]: Le HTML nettoyé de chaque clé (même ordre, None si absent)
+        """
+        return await self._get_html_many(keys, "get_cleaned_html_many")
+
     async def get_all_cleaned_html_keys(self) -> list[str]:
         """
-        Récupère toutes les clés des HTML nettoyés.
+        Récupère toutes les clés cleaned_html (préférer iter_cleaned_html_keys pour un parcours progressif).
         
         Returns:
             list[str]: Liste des clés cleaned_html
         """
-        try:
-            pattern = self._get_key("*", prefix="cleaned_html")
-            keys = self.redis.keys(pattern)
-            logger.debug(f"✅ {len(keys)} clés cleaned_html trouvées")
-            return keys
-        except Exception as e:
-            logger.error(f"❌ Erreur lors de la récupération des clés cleaned_html: {str(e)}")
-            return []
+        keys = [key async for key in self.iter_cleaned_html_keys()]
+        logger.debug(f"✅ {len(keys)} clés cleaned_html trouvées")
+        return keys
+
+    async def iter_cleaned_html_keys(self) -> AsyncIterator[str]:
+        """
+        Parcourt les clés cleaned_html par lots, sans charger tout l'espace de clés.
+        
+        Yields:
+            str: Les clés cleaned_html
+        """
+        async for key in self._iter_keys("cleaned_html"):
+            yield key
 
     async def get_all_analysis_keys(self) -> list[str]:
         """
-        Récupère toutes les clés des analyses stockées.
+        Récupère toutes les clés analysis (préférer iter_analysis_keys pour un parcours progressif).
         
         Returns:
             list[str]: Liste des clés analysis
         """
-        try:
-            pattern = self._get_key("*", prefix="analysis")
-            keys = self.redis.keys(pattern)
-            logger.debug(f"✅ {len(keys)} clés analysis trouvées")
-            return keys
-        except Exception as e:
-            logger.error(f"❌ Erreur lors de la récupération des clés analysis: {str(e)}")
-            return []
+        keys = [key async for key in self.iter_analysis_keys()]
+        logger.debug(f"✅ {len(keys)} clés analysis trouvées")
+        return keys
+
+    async def iter_analysis_keys(self) -> AsyncIterator[str]:
+        """
+        Parcourt les clés analysis par lots, sans charger tout l'espace de clés.
+        
+        Yields:
+            str: Les clés analysis
+        """
+        async for key in self._iter_keys("analysis"):
+            yield key
 
+    @timed("get_analysis")
     async def get_analysis(self, key: str) -> Optional[dict]:
         """
-        Récupère une analyse depuis Redis.
+        Récupère une analyse depuis le cache.
         
         Args:
-            key: La clé Redis de l'analyse (analysis:url)
+            key: La clé de l'analyse (analysis:url)
             
         Returns:
             Optional[dict]: Le dictionnaire d'analyse ou None
         """
         try:
-            content = self.redis.get(key)
+            content = (await self.backend.get_many([key]))[0]
+            self.metrics.record_lookup([key], [content])
             if content:
                 logger.debug(f"✅ Analyse récupérée pour: {key}")
-                return eval(content)  # Convertit la str en dict
+                return decode_payload(content)
             return None
         except Exception as e:
+            self.metrics.observe_error("get_analysis")
             logger.error(f"❌ Erreur lors de la récupération de l'analyse: {str(e)}")
             return None
 
+    @timed("get_analysis_many")
+    async def get_analysis_many(self, keys: List[str]) -> List[Optional[dict]]:
+        """
+        Récupère plusieurs analyses en un seul MGET.
+        
+        Args:
+            keys: Les clés des analyses (analysis:url)
+            
+        Returns:
+            List[Optional[dict]]: L'analyse de chaque clé (même ordre, None si absente ou illisible)
+        """
+        if not keys:
+            return []
+        try:
+            contents = await self.backend.get_many(keys)
+            self.metrics.record_lookup(keys, contents)
+        except Exception as e:
+            self.metrics.observe_error("get_analysis_many")
+            logger.error(f"❌ Erreur lors de la récupération groupée des analyses: {str(e)}")
+            return [None] * len(keys)
+        analyses = []
+        for key, content in zip(keys, contents):
+            try:
+                analyses.append(decode_payload(content) if content else None)
+            except Exception as e:
+                logger.error(f"❌ Analyse illisible pour {key}: {str(e)}")
+                analyses.append(None)
+        return analyses
+
+    @timed("delete_analysis")
     async def delete_analysis(self, key: str) -> bool:
         """
-        Supprime une analyse de Redis après son chargement dans Supabase.
+        Supprime une analyse du cache après son chargement dans Supabase.
         
         Args:
-            key: La clé Redis de l'analyse (analysis:url)
+            key: La clé de l'analyse (analysis:url)
             
         Returns:
             bool: True si supprimé avec succès
         """
         try:
-            deleted = self.redis.delete(key)
+            deleted = await self.backend.delete([key])
             if deleted:
                 logger.debug(f"✅ Analyse supprimée: {key}")
                 return True
             return False
         except Exception as e:
+            self.metrics.observe_error("delete_analysis")
             logger.error(f"❌ Erreur lors de la suppression de l'analyse: {str(e)}")
-            return False
\ No newline at end of file
+            return False
+
+    @timed("delete_analysis_many")
+    async def delete_analysis_many(self, keys: List[str]) -> int:
+        """
+        Supprime plusieurs analyses en une seule commande après leur chargement.
+        
+        Args:
+            keys: Les clés des analyses (analysis:url)
+            
+        Returns:
+            int: Le nombre d'analyses supprimées
+        """
+        if not keys:
+            return 0
+        try:
+            deleted = await self.backend.delete(keys)
+            logger.debug(f"✅ {deleted} analyses supprimées")
+            return deleted
+        except Exception as e:
+            self.metrics.observe_error("delete_analysis_many")
+            logger.error(f"❌ Erreur lors de la suppression des analyses: {str(e)}")
+            return 0
+
+    def _queue_transition(
+        self,
+        batch: CacheBatch,
+        url: str,
+        stage: OfferStage,
+        allowed_from: Union[str, OfferStage, Iterable[Union[str, OfferStage]]] = ANY_STAGE,
+        **fields: str
+    ) -> None:
+        """
+        Ajoute à un lot le passage atomique d'une offre à une étape.
+        
+        La transition vérifie l'étape courante, met à jour le hash offer:<url>
+        (étape, horodatages, références) et déplace l'URL d'un index d'étape
+        à l'autre : une offre n'est jamais prise en charge deux fois. Si les
+        files de travail sont activées (backend Redis), l'URL est aussi publiée
+        dans le stream stream:<étape> consommé par les workers.
+        
+        Args:
+            batch: Le lot d'écritures
+            url: L'URL de l'offre
+            stage: L'étape cible
+            allowed_from: Étape(s) de départ autorisée(s), NO_STAGE pour une offre inconnue
+            **fields: Champs supplémentaires (références des contenus en cache)
+        """
+        if isinstance(allowed_from, (str, OfferStage)):
+            allowed_from = [allowed_from]
+        batch.transition(
+            self._get_key(url, prefix="offer"), url, stage.value,
+            tuple(getattr(s, 'value', s) for s in allowed_from),
+            str(datetime.now().timestamp()), OFFER_TTL,
+            self._get_key("", prefix="stage"), stage in INDEXED_STAGES,
+            self._get_key("", prefix="stream") if WORK_QUEUE_ENABLED else "",
+            fields
+        )
+
+    @timed("transition_offers")
+    async def transition_offers(
+        self,
+        urls: List[str],
+        stage: OfferStage,
+        allowed_from: Union[str, OfferStage, Iterable[Union[str, OfferStage]]] = ANY_STAGE
+    ) -> List[bool]:
+        """
+        Fait passer plusieurs offres à une étape, en un seul aller-retour.
+        
+        Args:
+            urls: Les URLs des offres
+            stage: L'étape cible
+            allowed_from: Étape(s) de départ autorisée(s)
+            
+        Returns:
+            List[bool]: Pour chaque URL, True si la transition a eu lieu
+        """
+        if not urls:
+            return []
+        try:
+            batch = self.backend.batch()
+            for url in urls:
+                self._queue_transition(batch, url, stage, allowed_from)
+            return [bool(done) for done in await self._execute(batch)]
+        except Exception as e:
+            self.metrics.observe_error("transition_offers")
+            logger.error(f"❌ Erreur lors du passage à l'étape {stage.value}: {str(e)}")
+            return [False] * len(urls)
+
+    @timed("register_discovered")
+    async def register_discovered(self, urls: List[str], sources: Optional[Dict[str, Iterable[str]]] = None) -> int:
+        """
+        Enregistre les offres trouvées dans les pages de liste.
+        
+        Seules les offres inconnues ou déjà chargées (republiées) sont
+        enregistrées : une offre en cours de traitement garde son étape.
+        
+        Args:
+            urls: Les URLs des offres à récupérer
+            sources: URL -> noms des sources qui l'ont trouvée, gardés dans le
+                champ `sources` du hash offer:<url> (noms séparés par des virgules)
+            
+        Returns:
+            int: Le nombre d'offres enregistrées
+        """
+        if not urls:
+            return 0
+        try:
+            batch = self.backend.batch()
+            for url in urls:
+                fields = {'sources': ",".join(sorted(sources[url]))} if sources and sources.get(url) else {}
+                self._queue_transition(batch, url, OfferStage.DISCOVERED, (NO_STAGE, OfferStage.LOADED), **fields)
+            return sum(bool(done) for done in await self._execute(batch))
+        except Exception as e:
+            self.metrics.observe_error("register_discovered")
+            logger.error(f"❌ Erreur lors de l'enregistrement des offres découvertes: {str(e)}")
+            return 0
+
+    @timed("complete_offers")
+    async def complete_offers(self, urls: List[str]) -> int:
+        """
+        Marque des offres comme chargées et supprime leurs HTML brut et nettoyé.
+        
+        Les empreintes et la dernière analyse sont gardées (FINGERPRINT_TTL) : une
+        offre récupérée à l'identique saute le nettoyage et l'analyse.
+        
+        Les validateurs HTTP reçus à l'extraction deviennent alors ceux des
+        requêtes conditionnelles : une réponse 304 ne désigne plus qu'un
+        contenu effectivement chargé. Ils sont lus par JobExtractor, y compris
+        pour les offres de l'index des offres chargées.
+        
+        Args:
+            urls: Les URLs des offres chargées dans Supabase
+            
+        Returns:
+            int: Le nombre d'offres passées à l'étape loaded
+        """
+        if not urls:
+            return 0
+        try:
+            offers = await self.backend.get_hashes([self._get_key(url, prefix="offer") for url in urls])
+            batch = self.backend.batch()
+            for url in urls:
+                self._queue_transition(batch, url, OfferStage.LOADED, OfferStage.ANALYZED)
+            batch.delete(*[
+                self._get_key(url, prefix=prefix)
+                for url in urls
+                for prefix in ("raw_html", "cleaned_html")
+            ])
+            for url, offer in zip(urls, offers):
+                validators = {
+                    name[len(VALIDATOR_FIELD_PREFIX):]: value
+                    for name, value in offer.items()
+                    if name.startswith(VALIDATOR_FIELD_PREFIX)
+                }
+                if validators and offer.get('stage') == OfferStage.ANALYZED.value:
+                    batch.set_hash(self._get_key(url, prefix="validators"), validators, VALIDATORS_TTL)
+            results = await self._execute(batch)
+            logger.debug(f"✅ {len(urls)} offres chargées, HTML supprimés du cache")
+            return sum(bool(done) for done in results[:len(urls)])
+        except Exception as e:
+            self.metrics.observe_error("complete_offers")
+            logger.error(f"❌ Erreur lors de la clôture des offres: {str(e)}")
+            return 0
+
+    @timed("discard_offers")
+    async def discard_offers(self, urls: List[str]) -> None:
+        """
+        Oublie des offres dont le contenu a expiré : elles seront redécouvertes.
+        
+        Args:
+            urls: Les URLs des offres
+        """
+        if not urls:
+            return
+        try:
+            batch = self.backend.batch()
+            for stage in INDEXED_STAGES:
+                batch.remove_members(self._get_key(stage.value, prefix="stage"), *urls)
+            batch.delete(*[self._get_key(url, prefix="offer") for url in urls])
+            await self._execute(batch)
+            logger.debug(f"🗑 {len(urls)} offres oubliées")
+        except Exception as e:
+            self.metrics.observe_error("discard_offers")
+            logger.error(f"❌ Erreur lors de la suppression des offres: {str(e)}")
+
+    async def iter_offers(self, stage: OfferStage) -> AsyncIterator[List[str]]:
+        """
+        Parcourt par lots les offres qui attendent à une étape.
+        
+        L'index de l'étape est parcouru progressivement (SSCAN sur Redis) et
+        chaque lot est vérifié contre le hash des offres : les entrées périmées (offre expirée ou
+        déjà passée à une autre étape) sont retirées de l'index.
+        
+        Args:
+            stage: L'étape dont on veut le backlog
+            
+        Yields:
+            List[str]: Les URLs des offres, par lots de CACHE_BATCH_SIZE au plus
+        """
+        if stage not in INDEXED_STAGES:
+            raise ValueError(f"Étape non indexée: {stage.value}")
+        stage_key = self._get_key(stage.value, prefix="stage")
+        async for urls in batched(self.backend.iter_members(stage_key)):
+            try:
+                pending = await self._filter_offers(urls, stage, prune=True)
+            except Exception as e:
+                logger.error(f"❌ Erreur lors du parcours de l'étape {stage.value}: {str(e)}")
+                return
+            if pending:
+                yield pending
+
+    @timed("filter_offers")
+    async def filter_offers(self, urls: List[str], stage: OfferStage) -> List[str]:
+        """
+        Garde les offres qui sont toujours à une étape, en un seul aller-retour.
+        
+        Permet aux workers d'ignorer les messages en double (offre republiée,
+        message repris après la panne d'un worker) ou périmés.
+        
+        Args:
+            urls: Les URLs des offres
+            stage: L'étape attendue
+            
+        Returns:
+            List[str]: Les URLs des offres à cette étape, sans doublon
+        """
+        try:
+            return await self._filter_offers(list(dict.fromkeys(urls)), stage)
+        except Exception as e:
+            self.metrics.observe_error("filter_offers")
+            logger.error(f"❌ Erreur lors de la vérification de l'étape {stage.value}: {str(e)}")
+            return []
+
+    async def _filter_offers(self, urls: List[str], stage: OfferStage, prune: bool = False) -> List[str]:
+        """Lit l'étape courante des offres, en retirant de l'index les entrées périmées si prune."""
+        if not urls:
+            return []
+        current = await self.backend.get_hash_field([self._get_key(url, prefix="offer") for url in urls], "stage")
+        stale = [url for url, value in zip(urls, current) if value != stage.value]
+        if prune and stale:
+            await self.backend.remove_members(self._get_key(stage.value, prefix="stage"), stale)
+        return [url for url, value in zip(urls, current) if value == stage.value]
+
+    @timed("count_offers")
+    async def count_offers(self, stage: OfferStage) -> int:
+        """
+        Retourne le nombre d'offres qui attendent à une étape (O(1)).
+        
+        Args:
+            stage: L'étape
+            
+        Returns:
+            int: La taille de l'index de l'étape (entrées périmées comprises)
+        """
+        try:
+            return await self.backend.count_members(self._get_key(stage.value, prefix="stage"))
+        except Exception as e:
+            self.metrics.observe_error("count_offers")
+            logger.error(f"❌ Erreur lors du comptage de l'étape {stage.value}: {str(e)}")
+            return 0
+
+    @timed("get_offer")
+    async def get_offer(self, url: str) -> Dict[str, str]:
+        """
+        Récupère l'enregistrement d'une offre (étape, horodatages, références).
+        
+        Args:
+            url: L'URL de l'offre
+            
+        Returns:
+            Dict[str, str]: Les champs du hash offer:<url> (vide si inconnue)
+        """
+        try:
+            return (await self.backend.get_hashes([self._get_key(url, prefix="offer")]))[0]
+        except Exception as e:
+            self.metrics.observe_error("get_offer")
+            logger.error(f"❌ Erreur lors de la récupération de l'offre: {str(e)}")
+            return {}
\ No newline at end of file
@@ -0,0 +1,711 @@
+"""
+Module des backends de stockage du cache des offres : Redis, mémoire et SQLite.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager, nullcontext
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.utils import HIREDIS_AVAILABLE
+from loguru import logger
+
+from .cache_metrics import key_prefix
+from .offer_state import ANY_STAGE, NO_STAGE, TRANSITION_SCRIPT
+from ..config.settings import (
+    REDIS_HOST,
+    REDIS_PORT,
+    REDIS_DB,
+    REDIS_MAX_CONNECTIONS,
+    CACHE_BACKEND,
+    CACHE_SCAN_COUNT,
+    CACHE_SQLITE_PATH,
+    CACHE_SQLITE_MMAP_SIZE,
+    STREAM_MAXLEN
+)
+
+Value = Union[str, bytes]
+
+class CacheBatch:
+    """
+    Écritures groupées du cache, appliquées en une fois par execute().
+
+    Sur Redis, un lot est un pipeline (un seul aller-retour) ; sur les
+    backends embarqués, une transaction.
+    """
+
+    def __init__(self, backend: "CacheBackend", transaction: bool = False):
+        self._backend = backend
+        self._transaction = transaction
+        self._ops: List[tuple] = []
+
+    def __len__(self) -> int:
+        return len(self._ops)
+
+    def pending_writes(self) -> List[Tuple[str, int]]:
+        """Clés et tailles (octets) des valeurs que le lot va écrire."""
+        return [(op[1], len(op[2])) for op in self._ops if op[0] == 'set']
+
+    def set(self, key: str, value: Value, ttl: int) -> "CacheBatch":
+        """Écrit une valeur avec une durée de vie en secondes."""
+        self._ops.append(('set', key, value, ttl))
+        return self
+
+    def delete(self, *keys: str) -> "CacheBatch":
+        """Supprime des clés (résultat : le nombre de clés supprimées)."""
+        self._ops.append(('delete', keys))
+        return self
+
+    def remove_members(self, key: str, *members: str) -> "CacheBatch":
+        """Retire des membres d'un ensemble (résultat : le nombre de membres retirés)."""
+        self._ops.append(('remove_members', key, members))
+        return self
+
+    def set_hash(self, key: str, mapping: Dict[str, str], ttl: int) -> "CacheBatch":
+        """Remplace un hash par les champs donnés, avec une durée de vie."""
+        self._ops.append(('set_hash', key, mapping, ttl))
+        return self
+
+    def transition(
+        self,
+        key: str,
+        url: str,
+        stage: str,
+        allowed: Tuple[str, ...],
+        now: str,
+        ttl: int,
+        stage_prefix: str,
+        indexed: bool,
+        stream_prefix: str = "",
+        fields: Optional[Dict[str, str]] = None
+    ) -> "CacheBatch":
+        """
+        Fait passer une offre à une étape (résultat : 1 si la transition a eu lieu).
+
+        Voir TRANSITION_SCRIPT pour la sémantique, commune à tous les backends.
+        """
+        self._ops.append(('transition', key, url, stage, allowed, now, ttl, stage_prefix, indexed, stream_prefix, fields or {}))
+        return self
+
+    async def execute(self) -> List[Any]:
+        """Applique les écritures et retourne un résultat par écriture."""
+        if not self._ops:
+            return []
+        ops, self._ops = self._ops, []
+        return await self._backend.execute(ops, self._transaction)
+
+class CacheBackend(ABC):
+    """
+    Stockage clé-valeur avec expiration, hashes et ensembles, utilisé par JobCache.
+
+    Tous les backends ont la même sémantique (TTL compris) : une clé expirée
+    est absente pour toutes les opérations.
+    """
+
+    name = "abstract"
+
+    def batch(self, transaction: bool = False) -> CacheBatch:
+        """
+        Ouvre un lot d'écritures.
+
+        Args:
+            transaction: Applique le lot de façon atomique (MULTI sur Redis,
+                toujours le cas sur les backends embarqués)
+        """
+        return CacheBatch(self, transaction)
+
+    @abstractmethod
+    async def execute(self, ops: List[tuple], transaction: bool) -> List[Any]:
+        """Applique les écritures d'un lot."""
+
+    @abstractmethod
+    async def get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        """Lit plusieurs valeurs (None si absentes ou expirées)."""
+
+    @abstractmethod
+    async def exists_many(self, keys: List[str]) -> List[bool]:
+        """Indique pour chaque clé si elle existe."""
+
+    @abstractmethod
+    async def delete(self, keys: List[str]) -> int:
+        """Supprime des clés et retourne le nombre de clés supprimées."""
+
+    @abstractmethod
+    async def get_hashes(self, keys: List[str]) -> List[Dict[str, str]]:
+        """Lit plusieurs hashes (vides si absents)."""
+
+    @abstractmethod
+    async def get_hash_field(self, keys: List[str], field: str) -> List[Optional[str]]:
+        """Lit un champ de plusieurs hashes."""
+
+    @abstractmethod
+    def iter_keys(self, prefix: str) -> AsyncIterator[str]:
+        """Parcourt les clés d'un préfixe (une clé peut revenir plusieurs fois)."""
+
+    @abstractmethod
+    def iter_members(self, key: str) -> AsyncIterator[str]:
+        """Parcourt les membres d'un ensemble."""
+
+    @abstractmethod
+    async def remove_members(self, key: str, members: List[str]) -> int:
+        """Retire des membres d'un ensemble."""
+
+    @abstractmethod
+    async def count_members(self, key: str) -> int:
+        """Retourne la taille d'un ensemble."""
+
+    @abstractmethod
+    async def memory_usage(self, sample_size: int) -> Dict[str, Tuple[int, int]]:
+        """
+        Estime l'occupation du cache par préfixe de clé.
+
+        Args:
+            sample_size: Nombre de clés échantillonnées (backends qui estiment)
+
+        Returns:
+            Dict[str, Tuple[int, int]]: Préfixe → (nombre de clés, octets)
+        """
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Vide le cache."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Libère les connexions et fichiers du backend."""
+
+class RedisBackend(CacheBackend):
+    """
+    Backend Redis, partagé entre machines.
+
+    Deux clients partagent le serveur : l'un décode les réponses (hashes,
+    ensembles, scripts), l'autre les laisse en octets (pages compressées).
+    """
+
+    name = "redis"
+
+    def __init__(self, host: str = REDIS_HOST, port: int = REDIS_PORT, db: int = REDIS_DB):
+        """
+        Initialise les clients Redis asynchrones.
+
+        Les connexions sont ouvertes à la demande et partagées via un pool par
+        client : les requêtes concurrentes ne bloquent pas la boucle asyncio et,
+        une fois le pool plein, attendent qu'une connexion se libère.
+        """
+        self._pool = BlockingConnectionPool(
+            host=host,
+            port=port,
+            db=db,
+            max_connections=REDIS_MAX_CONNECTIONS,
+            decode_responses=True  # Pour avoir des str au lieu de bytes
+        )
+        # Client binaire pour les pages HTML, stockées compressées
+        self._binary_pool = BlockingConnectionPool(
+            host=host,
+            port=port,
+            db=db,
+            max_connections=REDIS_MAX_CONNECTIONS,
+            decode_responses=False
+        )
+        self.redis = Redis(connection_pool=self._pool)
+        self.redis_binary = Redis(connection_pool=self._binary_pool)
+        self._transition_script = self.redis.register_script(TRANSITION_SCRIPT)
+        logger.info(
+            f"✅ Client Redis initialisé ({host}:{port}, "
+            f"parseur: {'hiredis' if HIREDIS_AVAILABLE else 'python'})"
+        )
+
+    async def execute(self, ops: List[tuple], transaction: bool) -> List[Any]:
+        pipeline = self.redis_binary.pipeline(transaction=transaction)
+        sizes = []
+        for op in ops:
+            kind = op[0]
+            if kind == 'set':
+                _, key, value, ttl = op
+                pipeline.set(key, value, ex=ttl)
+                sizes.append(1)
+            elif kind == 'delete':
+                pipeline.delete(*op[1])
+                sizes.append(1)
+            elif kind == 'remove_members':
+                pipeline.srem(op[1], *op[2])
+                sizes.append(1)
+            elif kind == 'set_hash':
+                _, key, mapping, ttl = op
+                pipeline.delete(key)
+                pipeline.hset(key, mapping=mapping)
+                pipeline.expire(key, ttl)
+                sizes.append(3)
+            else:
+                _, key, url, stage, allowed, now, ttl, stage_prefix, indexed, stream_prefix, fields = op
+                args = [
+                    url, stage, now, ttl, stage_prefix, ",".join(allowed), '1' if indexed else '0',
+                    stream_prefix, STREAM_MAXLEN
+                ]
+                for field, value in fields.items():
+                    args.extend([field, value])
+                await self._transition_script(keys=[key], args=args, client=pipeline)
+                sizes.append(1)
+
+        results = await pipeline.execute()
+        # Un résultat par écriture du lot : celui de la commande principale
+        grouped, position = [], 0
+        for size in sizes:
+            grouped.append(results[position + (1 if size == 3 else 0)])
+            position += size
+        return grouped
+
+    async def get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        return await self.redis_binary.mget(keys)
+
+    async def exists_many(self, keys: List[str]) -> List[bool]:
+        pipeline = self.redis.pipeline(transaction=False)
+        for key in keys:
+            pipeline.exists(key)
+        return [bool(exists) for exists in await pipeline.execute()]
+
+    async def delete(self, keys: List[str]) -> int:
+        return await self.redis.delete(*keys)
+
+    async def get_hashes(self, keys: List[str]) -> List[Dict[str, str]]:
+        pipeline = self.redis.pipeline(transaction=False)
+        for key in keys:
+            pipeline.hgetall(key)
+        return await pipeline.execute()
+
+    async def get_hash_field(self, keys: List[str], field: str) -> List[Optional[str]]:
+        pipeline = self.redis.pipeline(transaction=False)
+        for key in keys:
+            pipeline.hget(key, field)
+        return await pipeline.execute()
+
+    async def iter_keys(self, prefix: str) -> AsyncIterator[str]:
+        # SCAN ne bloque pas le serveur, contrairement à KEYS
+        async for key in self.redis.scan_iter(match=f"{prefix}*", count=CACHE_SCAN_COUNT):
+            yield key
+
+    async def iter_members(self, key: str) -> AsyncIterator[str]:
+        async for member in self.redis.sscan_iter(key, count=CACHE_SCAN_COUNT):
+            yield member
+
+    async def remove_members(self, key: str, members: List[str]) -> int:
+        return await self.redis.srem(key, *members)
+
+    async def count_members(self, key: str) -> int:
+        return await self.redis.scard(key)
+
+    async def memory_usage(self, sample_size: int) -> Dict[str, Tuple[int, int]]:
+        # Échantillon de clés tirées au hasard (RANDOMKEY) dont on mesure la taille
+        # (MEMORY USAGE), extrapolé au nombre total de clés (DBSIZE)
+        total = await self.redis.dbsize()
+        if not total:
+            return {}
+        pipeline = self.redis.pipeline(transaction=False)
+        for _ in range(sample_size):
+            pipeline.randomkey()
+        keys = [key for key in await pipeline.execute() if key]
+        pipeline = self.redis.pipeline(transaction=False)
+        for key in keys:
+            pipeline.memory_usage(key)
+        sizes = await pipeline.execute(raise_on_error=False)
+
+        sampled: Dict[str, List[int]] = {}
+        for key, size in zip(keys, sizes):
+            counts = sampled.setdefault(key_prefix(key), [0, 0])
+            counts[0] += 1
+            counts[1] += size if isinstance(size, int) else 0
+        return {
+            prefix: (round(total * count / len(keys)), round(total * size / len(keys)))
+            for prefix, (count, size) in sampled.items()
+        }
+
+    async def clear(self) -> None:
+        await self.redis.flushdb()
+
+    async def close(self) -> None:
+        await self.redis.aclose()
+        await self.redis_binary.aclose()
+        await self._pool.disconnect()
+        await self._binary_pool.disconnect()
+
+class _LocalBackend(CacheBackend):
+    """
+    Base des backends embarqués : les écritures d'un lot, transitions
+    comprises, sont écrites une seule fois ici à partir de quelques
+    primitives synchrones.
+
+    Les expirations sont vérifiées à la lecture, et les entrées expirées
+    purgées toutes les SWEEP_EVERY écritures.
+    """
+
+    SWEEP_EVERY = 1000
+
+    def __init__(self):
+        self._writes = 0
+
+    # Primitives
+    @abstractmethod
+    def _read(self, key: str, now: float) -> Any:
+        """Valeur (octets ou dict pour un hash) d'une clé non expirée, sinon None."""
+
+    @abstractmethod
+    def _write(self, key: str, value: Any, expires_at: Optional[float]) -> None:
+        """Écrit une valeur (octets ou dict pour un hash)."""
+
+    @abstractmethod
+    def _remove(self, keys: Iterable[str], now: float) -> int:
+        """Supprime des clés et retourne le nombre de clés non expirées supprimées."""
+
+    @abstractmethod
+    def _add_members(self, key: str, members: List[str]) -> None:
+        """Ajoute des membres à un ensemble."""
+
+    @abstractmethod
+    def _remove_members(self, key: str, members: List[str]) -> int:
+        """Retire des membres d'un ensemble."""
+
+    @abstractmethod
+    def _members(self, key: str) -> List[str]:
+        """Membres d'un ensemble."""
+
+    @abstractmethod
+    def _keys(self, prefix: str, now: float) -> List[str]:
+        """Clés non expirées d'un préfixe."""
+
+    @abstractmethod
+    def _purge_expired(self, now: float) -> None:
+        """Supprime les entrées expirées."""
+
+    @abstractmethod
+    def _sizes(self, now: float) -> Iterator[Tuple[str, int]]:
+        """Couples (clé, octets) de toutes les entrées non expirées et des ensembles."""
+
+    def _atomic(self):
+        """Contexte dans lequel un lot est appliqué d'un bloc."""
+        return nullcontext()
+
+    # Écritures
+    async def execute(self, ops: List[tuple], transaction: bool) -> List[Any]:
+        now = time.time()
+        with self._atomic():
+            results = [self._apply(op, now) for op in ops]
+            self._writes += len(ops)
+            if self._writes >= self.SWEEP_EVERY:
+                self._writes = 0
+                self._purge_expired(now)
+        return results
+
+    def _apply(self, op: tuple, now: float) -> Any:
+        """Applique une écriture d'un lot."""
+        kind = op[0]
+        if kind == 'set':
+            _, key, value, ttl = op
+            self._write(key, value.encode('utf-8') if isinstance(value, str) else value, now + ttl)
+            return True
+        if kind == 'delete':
+            return self._remove(op[1], now)
+        if kind == 'remove_members':
+            return self._remove_members(op[1], list(op[2]))
+        if kind == 'set_hash':
+            _, key, mapping, ttl = op
+            self._write(key, {field: str(value) for field, value in mapping.items()}, now + ttl)
+            return True
+        return self._transition(now, *op[1:])
+
+    def _transition(
+        self, now: float, key: str, url: str, stage: str, allowed: Tuple[str, ...], timestamp: str,
+        ttl: int, stage_prefix: str, indexed: bool, stream_prefix: str, fields: Dict[str, str]
+    ) -> int:
+        """Transition d'une offre, équivalente à TRANSITION_SCRIPT (sans stream de travail)."""
+        offer = self._read(key, now) or {}
+        current = offer.get('stage')
+        if ANY_STAGE not in allowed and not any(
+            candidate == current or (candidate == NO_STAGE and current is None) for candidate in allowed
+        ):
+            return 0
+        if current:
+            self._remove_members(stage_prefix + current, [url])
+        else:
+            offer.update({'url': url, 'discovered_at': timestamp})
+        offer.update({'stage': stage, f'{stage}_at': timestamp, 'updated_at': timestamp})
+        offer.update(fields)
+        if indexed:
+            self._add_members(stage_prefix + stage, [url])
+        self._write(key, offer, now + ttl)
+        return 1
+
+    # Lectures
+    async def get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        now = time.time()
+        values = [self._read(key, now) for key in keys]
+        return [value if isinstance(value, bytes) else None for value in values]
+
+    async def exists_many(self, keys: List[str]) -> List[bool]:
+        now = time.time()
+        return [self._read(key, now) is not None for key in keys]
+
+    async def delete(self, keys: List[str]) -> int:
+        with self._atomic():
+            return self._remove(keys, time.time())
+
+    async def get_hashes(self, keys: List[str]) -> List[Dict[str, str]]:
+        now = time.time()
+        values = [self._read(key, now) for key in keys]
+        return [dict(value) if isinstance(value, dict) else {} for value in values]
+
+    async def get_hash_field(self, keys: List[str], field: str) -> List[Optional[str]]:
+        return [value.get(field) for value in await self.get_hashes(keys)]
+
+    async def iter_keys(self, prefix: str) -> AsyncIterator[str]:
+        for key in self._keys(prefix, time.time()):
+            yield key
+
+    async def iter_members(self, key: str) -> AsyncIterator[str]:
+        for member in self._members(key):
+            yield member
+
+    async def remove_members(self, key: str, members: List[str]) -> int:
+        with self._atomic():
+            return self._remove_members(key, members)
+
+    async def count_members(self, key: str) -> int:
+        return len(self._members(key))
+
+    async def memory_usage(self, sample_size: int) -> Dict[str, Tuple[int, int]]:
+        # Mesure exacte : tout est local, sans aller-retour réseau
+        usage: Dict[str, List[int]] = {}
+        for key, size in self._sizes(time.time()):
+            counts = usage.setdefault(key_prefix(key), [0, 0])
+            counts[0] += 1
+            counts[1] += size
+        return {prefix: (count, size) for prefix, (count, size) in usage.items()}
+
+class MemoryBackend(_LocalBackend):
+    """
+    Backend en mémoire du processus, pour les tests et les exécutions locales.
+
+    Rien n'est partagé entre processus ni conservé après l'arrêt.
+    """
+
+    name = "memory"
+
+    def __init__(self):
+        super().__init__()
+        self._data: Dict[str, Tuple[Any, Optional[float]]] = {}
+        self._sets: Dict[str, set] = {}
+
+    def _read(self, key: str, now: float) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= now:
+            del self._data[key]
+            return None
+        return value
+
+    def _write(self, key: str, value: Any, expires_at: Optional[float]) -> None:
+        self._data[key] = (value, expires_at)
+
+    def _remove(self, keys: Iterable[str], now: float) -> int:
+        removed = 0
+        for key in keys:
+            if self._read(key, now) is not None:
+                del self._data[key]
+                removed += 1
+            elif self._sets.pop(key, None):
+                removed += 1
+        return removed
+
+    def _add_members(self, key: str, members: List[str]) -> None:
+        self._sets.setdefault(key, set()).update(members)
+
+    def _remove_members(self, key: str, members: List[str]) -> int:
+        existing = self._sets.get(key)
+        if not existing:
+            return 0
+        removed = len(existing.intersection(members))
+        existing.difference_update(members)
+        if not existing:
+            del self._sets[key]
+        return removed
+
+    def _members(self, key: str) -> List[str]:
+        return list(self._sets.get(key, ()))
+
+    def _keys(self, prefix: str, now: float) -> List[str]:
+        return [key for key in list(self._data) if key.startswith(prefix) and self._read(key, now) is not None]
+
+    def _purge_expired(self, now: float) -> None:
+        for key in list(self._data):
+            self._read(key, now)
+
+    def _sizes(self, now: float) -> Iterator[Tuple[str, int]]:
+        for key in list(self._data):
+            value = self._read(key, now)
+            if isinstance(value, dict):
+                yield key, sum(len(field) + len(item) for field, item in value.items())
+            elif value is not None:
+                yield key, len(value)
+        for key, members in self._sets.items():
+            yield key, sum(len(member) for member in members)
+
+    async def clear(self) -> None:
+        self._data.clear()
+        self._sets.clear()
+
+    async def close(self) -> None:
+        pass
+
+class SQLiteBackend(_LocalBackend):
+    """
+    Backend embarqué SQLite (WAL, lectures projetées en mémoire), sans réseau.
+
+    Pour les installations sur une seule machine : plusieurs processus peuvent
+    partager le fichier, les écritures d'un lot forment une transaction.
+    Les appels sont synchrones, de l'ordre de la dizaine de microsecondes.
+    """
+
+    name = "sqlite"
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS entries (
+            key TEXT PRIMARY KEY,
+            value BLOB NOT NULL,
+            is_hash INTEGER NOT NULL DEFAULT 0,
+            expires_at REAL
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (expires_at);
+        CREATE TABLE IF NOT EXISTS members (
+            key TEXT NOT NULL,
+            member TEXT NOT NULL,
+            PRIMARY KEY (key, member)
+        ) WITHOUT ROWID;
+    """
+
+    def __init__(self, path: str = CACHE_SQLITE_PATH):
+        """
+        Ouvre la base, en la créant si elle n'existe pas.
+
+        Args:
+            path: Chemin du fichier SQLite
+        """
+        super().__init__()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        # Mode autocommit : les transactions sont ouvertes explicitement par lot
+        self._db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._lock = threading.RLock()
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(f"PRAGMA mmap_size={CACHE_SQLITE_MMAP_SIZE}")
+        self._db.execute("PRAGMA busy_timeout=5000")
+        self._db.executescript(self.SCHEMA)
+        self._purge_expired(time.time())
+        logger.info(f"✅ Cache SQLite ouvert: {path}")
+
+    @contextmanager
+    def _atomic(self) -> Iterator[None]:
+        with self._lock:
+            if self._db.in_transaction:
+                yield
+                return
+            # IMMEDIATE : le verrou d'écriture est pris dès le début, les
+            # transitions lues puis écrites ne peuvent pas se croiser
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    def _read(self, key: str, now: float) -> Any:
+        row = self._db.execute(
+            "SELECT value, is_hash FROM entries WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (key, now)
+        ).fetchone()
+        if row is None:
+            return None
+        value, is_hash = row
+        return json.loads(value) if is_hash else bytes(value)
+
+    def _write(self, key: str, value: Any, expires_at: Optional[float]) -> None:
+        is_hash = isinstance(value, dict)
+        self._db.execute(
+            "INSERT OR REPLACE INTO entries (key, value, is_hash, expires_at) VALUES (?, ?, ?, ?)",
+            (key, json.dumps(value) if is_hash else value, int(is_hash), expires_at)
+        )
+
+    def _remove(self, keys: Iterable[str], now: float) -> int:
+        removed = 0
+        for key in keys:
+            removed += self._db.execute(
+                "DELETE FROM entries WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)", (key, now)
+            ).rowcount
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            members = self._db.execute("DELETE FROM members WHERE key = ?", (key,)).rowcount
+            removed += 1 if members else 0
+        return removed
+
+    def _add_members(self, key: str, members: List[str]) -> None:
+        self._db.executemany("INSERT OR IGNORE INTO members (key, member) VALUES (?, ?)", [(key, m) for m in members])
+
+    def _remove_members(self, key: str, members: List[str]) -> int:
+        return sum(
+            self._db.execute("DELETE FROM members WHERE key = ? AND member = ?", (key, member)).rowcount
+            for member in members
+        )
+
+    def _members(self, key: str) -> List[str]:
+        return [row[0] for row in self._db.execute("SELECT member FROM members WHERE key = ?", (key,))]
+
+    def _keys(self, prefix: str, now: float) -> List[str]:
+        # Intervalle sur la clé primaire plutôt que LIKE, qui ne profiterait pas de l'index
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        return [row[0] for row in self._db.execute(
+            "SELECT key FROM entries WHERE key >= ? AND key < ? AND (expires_at IS NULL OR expires_at > ?)",
+            (prefix, upper, now)
+        )]
+
+    def _purge_expired(self, now: float) -> None:
+        self._db.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+
+    def _sizes(self, now: float) -> Iterator[Tuple[str, int]]:
+        yield from self._db.execute(
+            "SELECT key, length(value) FROM entries WHERE expires_at IS NULL OR expires_at > ?", (now,)
+        ).fetchall()
+        yield from self._db.execute("SELECT key, sum(length(member)) FROM members GROUP BY key").fetchall()
+
+    async def clear(self) -> None:
+        with self._atomic():
+            self._db.execute("DELETE FROM entries")
+            self._db.execute("DELETE FROM members")
+
+    async def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+def create_backend(name: str = CACHE_BACKEND) -> CacheBackend:
+    """
+    Crée le backend du cache configuré.
+
+    Args:
+        name: 'redis', 'sqlite' ou 'memory'
+
+    Returns:
+        CacheBackend: Le backend
+    """
+    if name == "redis":
+        return RedisBackend()
+    if name == "sqlite":
+        return SQLiteBackend()
+    if name == "memory":
+        return MemoryBackend()
+    raise ValueError(f"Backend de cache inconnu: {name}")
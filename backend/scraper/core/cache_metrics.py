@@ -0,0 +1,211 @@
+"""
+Module de mesure de l'activité du cache : latences, taux de succès et mémoire par préfixe.
+"""
+
+import bisect
+import time
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Bornes supérieures (ms) des classes des histogrammes de latence, la dernière classe est ouverte
+LATENCY_BUCKETS_MS = (0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+# Préfixes dont le second segment fait partie du nom (fp:cleaned, stage:fetched, stream:cleaned)
+NESTED_PREFIXES = ("fp", "stage", "stream")
+
+def key_prefix(key: str) -> str:
+    """
+    Retourne le préfixe d'une clé du cache (raw_html, job, fp:cleaned...).
+
+    Args:
+        key: La clé complète
+
+    Returns:
+        str: Son préfixe
+    """
+    parts = key.split(":", 2)
+    if parts[0] in NESTED_PREFIXES and len(parts) > 2:
+        return f"{parts[0]}:{parts[1]}"
+    return parts[0]
+
+@dataclass
+class OperationStats:
+    """Appels, erreurs et histogramme des latences d'une opération du cache."""
+    calls: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    buckets: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+
+    def observe(self, seconds: float, error: bool = False) -> None:
+        self.calls += 1
+        self.errors += error
+        self.total_seconds += seconds
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, seconds * 1000)] += 1
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_seconds * 1000 / self.calls if self.calls else 0.0
+
+    def percentile_ms(self, percentile: float) -> Optional[float]:
+        """Borne supérieure de la classe contenant le centile (None si au-delà de la dernière borne)."""
+        rank = percentile / 100 * self.calls
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, self.buckets):
+            seen += count
+            if count and seen >= rank:
+                return bound
+        return None
+
+@dataclass
+class LookupStats:
+    """Lectures d'un préfixe : clés trouvées et absentes."""
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> Optional[float]:
+        total = self.hits + self.misses
+        return self.hits / total if total else None
+
+class CacheMetrics:
+    """
+    Compteurs du cache, consultables à tout moment et résumés en fin d'étape.
+
+    - latences et erreurs par opération de JobCache (histogrammes)
+    - succès / échecs de lecture par préfixe (ex: job = fetchs évités)
+    - octets écrits par préfixe
+    - échantillons de l'occupation mémoire par préfixe, estimée par le backend
+    """
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.operations: Dict[str, OperationStats] = {}
+        self.lookups: Dict[str, LookupStats] = {}
+        self.written: Dict[str, List[int]] = {}  # préfixe → [écritures, octets]
+        self.memory_samples: List[Tuple[float, Dict[str, Tuple[int, int]]]] = []
+        self.max_memory_samples = 100
+
+    def observe(self, operation: str, seconds: float, error: bool = False) -> None:
+        """Enregistre la durée d'un appel à une opération."""
+        self.operations.setdefault(operation, OperationStats()).observe(seconds, error)
+
+    def observe_error(self, operation: str) -> None:
+        """Enregistre une erreur rattrapée par une opération, dont l'appel est mesuré par ailleurs."""
+        self.operations.setdefault(operation, OperationStats()).errors += 1
+
+    def record_lookup(self, keys: Sequence[str], values: Sequence) -> None:
+        """Enregistre une lecture : une valeur vide compte comme un échec."""
+        for key, value in zip(keys, values):
+            stats = self.lookups.setdefault(key_prefix(key), LookupStats())
+            if value:
+                stats.hits += 1
+            else:
+                stats.misses += 1
+
+    def record_write(self, key: str, size: int) -> None:
+        """Enregistre l'écriture d'une valeur de size octets."""
+        written = self.written.setdefault(key_prefix(key), [0, 0])
+        written[0] += 1
+        written[1] += size
+
+    def record_memory(self, usage: Dict[str, Tuple[int, int]]) -> None:
+        """Enregistre un échantillon d'occupation mémoire (préfixe → (clés, octets))."""
+        self.memory_samples.append((time.time(), usage))
+        del self.memory_samples[:-self.max_memory_samples]
+
+    @property
+    def last_memory_sample_at(self) -> Optional[float]:
+        return self.memory_samples[-1][0] if self.memory_samples else None
+
+    def hit_ratio(self, prefix: str) -> Optional[float]:
+        """Part des lectures d'un préfixe qui ont trouvé une valeur (None sans lecture)."""
+        stats = self.lookups.get(prefix)
+        return stats.hit_ratio if stats else None
+
+    def snapshot(self) -> dict:
+        """Retourne toutes les mesures sous forme de dictionnaire (sérialisable en JSON)."""
+        return {
+            'uptime_seconds': time.time() - self.started_at,
+            'latency_buckets_ms': list(LATENCY_BUCKETS_MS),
+            'operations': {
+                name: {
+                    'calls': stats.calls,
+                    'errors': stats.errors,
+                    'mean_ms': stats.mean_ms,
+                    'p50_ms': stats.percentile_ms(50),
+                    'p95_ms': stats.percentile_ms(95),
+                    'buckets': list(stats.buckets),
+                }
+                for name, stats in self.operations.items()
+            },
+            'lookups': {
+                prefix: {'hits': stats.hits, 'misses': stats.misses, 'hit_ratio': stats.hit_ratio}
+                for prefix, stats in self.lookups.items()
+            },
+            'written': {prefix: {'writes': writes, 'bytes': size} for prefix, (writes, size) in self.written.items()},
+            'memory': {
+                prefix: {'keys': keys, 'bytes': size}
+                for prefix, (keys, size) in (self.memory_samples[-1][1] if self.memory_samples else {}).items()
+            },
+        }
+
+    def summary(self) -> str:
+        """Retourne un bilan lisible des mesures."""
+        lines = ["📊 Bilan du cache:"]
+        if self.operations:
+            lines.append("  Opérations (appels, erreurs, moyenne, p50, p95):")
+            for name, stats in sorted(self.operations.items(), key=lambda item: -item[1].total_seconds):
+                p50, p95 = stats.percentile_ms(50), stats.percentile_ms(95)
+                lines.append(
+                    f"    - {name}: {stats.calls} appels, {stats.errors} erreurs, {stats.mean_ms:.2f} ms, "
+                    f"≤{_format_bound(p50)}, ≤{_format_bound(p95)}"
+                )
+        if self.lookups:
+            lines.append("  Lectures par préfixe (trouvées / demandées):")
+            for prefix, stats in sorted(self.lookups.items()):
+                lines.append(
+                    f"    - {prefix}: {stats.hits}/{stats.hits + stats.misses} ({stats.hit_ratio:.0%})"
+                )
+        if self.written:
+            lines.append("  Écritures par préfixe:")
+            for prefix, (writes, size) in sorted(self.written.items()):
+                lines.append(f"    - {prefix}: {writes} valeurs, {_format_bytes(size)}")
+        if self.memory_samples:
+            lines.append("  Mémoire estimée par préfixe:")
+            for prefix, (keys, size) in sorted(self.memory_samples[-1][1].items(), key=lambda item: -item[1][1]):
+                lines.append(f"    - {prefix}: {keys} clés, {_format_bytes(size)}")
+        return "\n".join(lines)
+
+def _format_bound(bound: Optional[float]) -> str:
+    return f"{bound:g} ms" if bound is not None else f"{LATENCY_BUCKETS_MS[-1]:g}+ ms"
+
+def _format_bytes(size: float) -> str:
+    for unit in ("o", "Ko", "Mo"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "o" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} Go"
+
+def timed(operation: str):
+    """
+    Décorateur des méthodes asynchrones de JobCache : mesure leur durée dans self.metrics.
+
+    Args:
+        operation: Le nom de l'opération
+    """
+    def decorator(method):
+        @wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            start = time.perf_counter()
+            error = False
+            try:
+                return await method(self, *args, **kwargs)
+            except Exception:
+                error = True
+                raise
+            finally:
+                self.metrics.observe(operation, time.perf_counter() - start, error)
+                self._maybe_sample_memory()
+        return wrapper
+    return decorator
@@ -0,0 +1,151 @@
+"""
+Module de nettoyage parallèle du HTML : les pages sont réparties par paquets
+entre les processus d'un pool, qui créent chacun leur HTMLCleaner une seule fois.
+
+L'apprentissage du gabarit se fait dans le processus principal : chaque paquet
+envoyé au pool emporte les blocs de gabarit connus à cet instant, et les processus
+du pool renvoient les empreintes des blocs de chaque page, ajoutées au modèle qui
+est enregistré à la fermeture.
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
+from loguru import logger
+
+from .boilerplate import BoilerplateModel, BoilerplateSnapshot
+from .html_cleaner import HTMLCleaner
+from ..config.settings import CLEANING_CHUNK_SIZE, CLEANING_WORKERS, HTML_CLEANER_ENGINE
+
+# Nettoyeur du processus courant, créé par _init_worker dans chaque processus du pool
+_worker_cleaner: Optional[HTMLCleaner] = None
+
+def _init_worker(engine: str) -> None:
+    """Initialise le nettoyeur d'un processus du pool (le gabarit arrive avec chaque paquet)."""
+    global _worker_cleaner
+    _worker_cleaner = HTMLCleaner(engine)
+
+def _clean_chunk(
+    chunk: List[Tuple[str, str]],
+    boilerplate: Optional[BoilerplateSnapshot]
+) -> List[Tuple[str, str, List[str]]]:
+    """Nettoie un paquet de pages (clé, HTML brut) et renvoie aussi les empreintes de leurs blocs."""
+    _worker_cleaner.boilerplate = boilerplate
+    results = []
+    for key, html_content in chunk:
+        cleaned_html = _worker_cleaner.clean(html_content)
+        results.append((key, cleaned_html, _worker_cleaner.blocks))
+    return results
+
+class CleaningExecutor:
+    """
+    Nettoie des pages HTML en parallèle sur plusieurs cœurs.
+
+    Les pages sont envoyées par paquets de chunk_size à un pool de processus
+    démarré à la première utilisation et réutilisé ensuite. Avec un seul worker,
+    les pages sont nettoyées dans le processus courant, sans pool.
+    """
+
+    def __init__(
+        self,
+        workers: int = CLEANING_WORKERS,
+        chunk_size: int = CLEANING_CHUNK_SIZE,
+        engine: str = HTML_CLEANER_ENGINE,
+        boilerplate: Optional[BoilerplateModel] = None
+    ):
+        """
+        Initialise l'exécuteur.
+
+        Args:
+            workers: Nombre de processus de nettoyage
+            chunk_size: Pages envoyées à un processus par tâche
+            engine: Moteur du nettoyeur ('bs4' ou 'lxml')
+            boilerplate: Modèle de gabarit appris et appliqué au fil des pages
+        """
+        self.workers = max(1, workers)
+        self.chunk_size = max(1, chunk_size)
+        self.engine = engine
+        self.boilerplate = boilerplate
+        self.cleaner = HTMLCleaner(engine, boilerplate=boilerplate)
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def signature(self) -> str:
+        """Empreinte de la configuration du nettoyage (voir HTMLCleaner.signature)."""
+        return self.cleaner.signature
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Retourne le pool de processus, démarré à la première utilisation."""
+        if self._pool is None:
+            # spawn : le processus parent a une boucle asyncio et des connexions ouvertes
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+                initargs=(self.engine,)
+            )
+            logger.info(f"🧹 Pool de nettoyage démarré ({self.workers} processus)")
+        return self._pool
+
+    async def clean_many(self, pages: Sequence[Tuple[str, str]]) -> AsyncIterator[Tuple[str, Optional[str]]]:
+        """
+        Nettoie des pages et renvoie les résultats au fur et à mesure qu'ils sont prêts.
+
+        Args:
+            pages: Couples (clé, HTML brut)
+
+        Yields:
+            Tuple[str, Optional[str]]: La clé et le HTML nettoyé (None si son paquet a échoué)
+        """
+        if self.workers == 1:
+            for key, html_content in pages:
+                cleaned_html = self.cleaner.clean(html_content)
+                self._observe(cleaned_html, self.cleaner.blocks)
+                yield key, cleaned_html
+            return
+
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        # Blocs de gabarit appris jusqu'ici, y compris pendant les lots précédents
+        boilerplate = self.boilerplate.snapshot() if self.boilerplate is not None else None
+        chunks = {}
+        for start in range(0, len(pages), self.chunk_size):
+            chunk = list(pages[start:start + self.chunk_size])
+            chunks[loop.run_in_executor(pool, _clean_chunk, chunk, boilerplate)] = chunk
+
+        pending = set(chunks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        results = future.result()
+                    except Exception as e:
+                        if isinstance(e, BrokenProcessPool) and self._pool is pool:
+                            # Un processus est mort : le pool est arrêté (processus et thread
+                            # de gestion) et sera recréé au prochain appel
+                            pool.shutdown(wait=False, cancel_futures=True)
+                            self._pool = None
+                        logger.error(f"❌ Erreur lors du nettoyage d'un paquet de {len(chunks[future])} pages: {str(e)}")
+                        results = [(key, None, []) for key, _ in chunks[future]]
+                    for key, cleaned_html, blocks in results:
+                        self._observe(cleaned_html, blocks)
+                        yield key, cleaned_html
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _observe(self, cleaned_html: Optional[str], blocks: List[str]) -> None:
+        """Ajoute les blocs d'une page au modèle de gabarit, si son nettoyage a réussi."""
+        if self.boilerplate is not None and cleaned_html:
+            self.boilerplate.observe(blocks)
+
+    def close(self) -> None:
+        """Arrête le pool de processus et enregistre le modèle de gabarit."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+        if self.boilerplate is not None:
+            self.boilerplate.save()
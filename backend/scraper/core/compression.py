@@ -0,0 +1,178 @@
+"""
+Module de compression des pages HTML stockées dans le cache.
+
+Le dictionnaire partagé par défaut (FREEWORK_DICTIONARY, version 1) est écrit à la
+main et non entraîné : le dépôt ne contient pas de pages free-work à partir
+desquelles l'entraîner, zlib n'accepte qu'un dictionnaire brut, et les valeurs
+stockées en dépendent (il doit rester identique d'un déploiement à l'autre).
+Avec zstd, un dictionnaire entraîné sur les pages en cache
+(python -m backend.scraper.train_compression_dictionary) le remplace s'il existe
+(version 2). Ré-entraîner ce dictionnaire rend illisibles les valeurs déjà
+compressées avec le précédent : à faire après un vidage du cache.
+"""
+
+import os
+import zlib
+from typing import List
+from loguru import logger
+
+try:
+    import zstandard
+except ImportError:  # zstd est optionnel, zlib est toujours disponible
+    zstandard = None
+
+from ..config.settings import CACHE_COMPRESSION, CACHE_COMPRESSION_DICTIONARY_PATH, CACHE_COMPRESSION_LEVEL
+
+# En-tête des valeurs compressées : marqueur + codec + version du dictionnaire.
+# Les valeurs sans ce marqueur sont des chaînes UTF-8 écrites avant la compression.
+MAGIC = b"JAZ"
+CODEC_ZLIB = b"z"
+CODEC_ZSTD = b"s"
+DICTIONARY_VERSION = b"1"  # Dictionnaire écrit à la main (zlib et zstd)
+TRAINED_DICTIONARY_VERSION = b"2"  # Dictionnaire zstd entraîné (CACHE_COMPRESSION_DICTIONARY_PATH)
+
+# Dictionnaire partagé : fragments de balisage récurrents des pages free-work.
+# Les fragments les plus fréquents sont placés à la fin, là où zlib les
+# atteint avec les distances les plus courtes.
+FREEWORK_DICTIONARY = "".join([
+    '<meta name="viewport" content="width=device-width, initial-scale=1">',
+    '<meta property="og:site_name" content="Free-Work">',
+    '<link rel="preload" as="script" href="/_nuxt/',
+    '<script type="application/ld+json">{"@context":"https://schema.org","@type":"JobPosting",',
+    '"hiringOrganization":{"@type":"Organization","name":"',
+    '"jobLocation":{"@type":"Place","address":{"@type":"PostalAddress","addressLocality":"',
+    '"employmentType":"CONTRACTOR","datePosted":"',
+    'Freelance', 'CDI', 'CDD', 'Télétravail partiel', 'Télétravail 100%', 'Pas de télétravail',
+    'Expérience', 'Durée', 'TJM', '€⁄j', 'mois', 'Île-de-France', 'Paris, France',
+    'Postuler', 'Voir l\'offre', 'Offres similaires', 'Suivant', 'Précédent',
+    'https://www.free-work.com/fr/tech-it/', '/job-mission/',
+    '<div class="html-renderer prose-content">',
+    '<div class="flex flex-col md:flex-row justify-between md:items-center gap-4 mb-6">',
+    '<h1 class="text-2xl font-bold">',
+    '<div class="flex items-center">',
+    '<span class="line-clamp-2">',
+    '<span class="tag">',
+    '<div class="text-sm font-semibold">',
+    '<svg xmlns="http://www.w3.org/2000/svg" fill="none" viewBox="0 0 24 24" stroke="currentColor">',
+    '<path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="',
+    '<a href="/fr/tech-it/', '" class="', '<button type="button" class="',
+    '<li>', '</li>', '<ul>', '</ul>', '<p>', '</p>', '<strong>', '</strong>', '<br>',
+    '<span class="', '</span>', '<div class="', '</div>',
+]).encode('utf-8')
+
+_zstd_dictionary = None
+_trained_dictionary = None
+_trained_dictionary_loaded = False
+
+def _get_trained_dictionary():
+    """Charge (une seule fois) le dictionnaire zstd entraîné, None s'il n'existe pas."""
+    global _trained_dictionary, _trained_dictionary_loaded
+    if not _trained_dictionary_loaded:
+        _trained_dictionary_loaded = True
+        if zstandard is not None and os.path.exists(CACHE_COMPRESSION_DICTIONARY_PATH):
+            with open(CACHE_COMPRESSION_DICTIONARY_PATH, 'rb') as f:
+                _trained_dictionary = zstandard.ZstdCompressionDict(f.read())
+            logger.info(f"🗜️ Dictionnaire de compression entraîné chargé ({CACHE_COMPRESSION_DICTIONARY_PATH})")
+    return _trained_dictionary
+
+def _get_zstd_dictionary():
+    """Construit (une seule fois) le dictionnaire zstd à partir du dictionnaire partagé."""
+    global _zstd_dictionary
+    if _zstd_dictionary is None:
+        _zstd_dictionary = zstandard.ZstdCompressionDict(
+            FREEWORK_DICTIONARY,
+            dict_type=zstandard.DICT_TYPE_RAWCONTENT
+        )
+    return _zstd_dictionary
+
+def train_dictionary(samples: List[str], size: int) -> bytes:
+    """
+    Entraîne un dictionnaire zstd sur des pages d'exemple.
+
+    Args:
+        samples: Les pages (HTML brut ou nettoyé), quelques centaines au moins
+        size: Taille maximale du dictionnaire en octets
+
+    Returns:
+        bytes: Le dictionnaire, à écrire dans CACHE_COMPRESSION_DICTIONARY_PATH
+    """
+    if zstandard is None:
+        raise RuntimeError("zstandard n'est pas installé")
+    return zstandard.train_dictionary(size, [sample.encode('utf-8') for sample in samples]).as_bytes()
+
+def _get_codec() -> bytes:
+    """Retourne le codec configuré, zlib si zstd est demandé mais non installé."""
+    if CACHE_COMPRESSION == 'zstd':
+        if zstandard is not None:
+            return CODEC_ZSTD
+        logger.warning("⚠️ zstandard non installé, compression zlib utilisée")
+    return CODEC_ZLIB
+
+def compress_text(text: str) -> bytes:
+    """
+    Compresse une chaîne pour le stockage.
+
+    Args:
+        text: Le contenu à compresser
+
+    Returns:
+        bytes: La valeur à stocker (en-tête + données), ou l'UTF-8 brut si la compression est désactivée
+    """
+    data = text.encode('utf-8')
+    if CACHE_COMPRESSION == 'none':
+        return data
+
+    codec = _get_codec()
+    version = DICTIONARY_VERSION
+    if codec == CODEC_ZSTD:
+        dictionary = _get_trained_dictionary()
+        if dictionary is not None:
+            version = TRAINED_DICTIONARY_VERSION
+        else:
+            dictionary = _get_zstd_dictionary()
+        compressor = zstandard.ZstdCompressor(level=CACHE_COMPRESSION_LEVEL, dict_data=dictionary)
+        payload = compressor.compress(data)
+    else:
+        compressor = zlib.compressobj(level=min(CACHE_COMPRESSION_LEVEL, 9), zdict=FREEWORK_DICTIONARY)
+        payload = compressor.compress(data) + compressor.flush()
+    return MAGIC + codec + version + payload
+
+def decompress_text(value: bytes) -> str:
+    """
+    Décompresse une valeur lue dans le cache.
+
+    Les valeurs sans en-tête (écrites avant la compression) sont lues telles quelles.
+
+    Args:
+        value: La valeur stockée
+
+    Returns:
+        str: Le contenu d'origine
+    """
+    if isinstance(value, str):
+        return value
+    if not value.startswith(MAGIC):
+        return value.decode('utf-8')
+
+    codec = value[3:4]
+    version = value[4:5]
+    payload = value[5:]
+    if version not in (DICTIONARY_VERSION, TRAINED_DICTIONARY_VERSION):
+        raise ValueError(f"Version de dictionnaire inconnue: {version!r}")
+
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("Valeur compressée avec zstd mais zstandard n'est pas installé")
+        if version == TRAINED_DICTIONARY_VERSION:
+            dictionary = _get_trained_dictionary()
+            if dictionary is None:
+                raise RuntimeError(f"Dictionnaire entraîné introuvable: {CACHE_COMPRESSION_DICTIONARY_PATH}")
+        else:
+            dictionary = _get_zstd_dictionary()
+        data = zstandard.ZstdDecompressor(dict_data=dictionary).decompress(payload)
+    elif codec == CODEC_ZLIB and version == DICTIONARY_VERSION:
+        decompressor = zlib.decompressobj(zdict=FREEWORK_DICTIONARY)
+        data = decompressor.decompress(payload) + decompressor.flush()
+    else:
+        raise ValueError(f"Codec de compression inconnu: {codec!r}")
+    return data.decode('utf-8')
@@ -0,0 +1,167 @@
+"""
+Module d'extraction concurrente des pages d'offres.
+"""
+
+import asyncio
+from typing import Dict, Iterable, List, Optional
+from loguru import logger
+
+from .cache import JobCache
+from .http_client import HTTPClient
+from .offer_state import OfferStage
+from .seen_index import SeenIndex
+from ..config.settings import CACHE_BATCH_SIZE, EXTRACTION_CONCURRENCY
+
+class JobExtractor:
+    """
+    Récupère le HTML brut des offres avec plusieurs requêtes en vol.
+    La politesse envers le site est assurée par le limiteur de débit
+    du client HTTP, la concurrence ne fait que masquer la latence.
+    """
+
+    def __init__(
+        self,
+        cache: JobCache,
+        http_client: HTTPClient,
+        concurrency: int = EXTRACTION_CONCURRENCY,
+        seen_index: Optional[SeenIndex] = None
+    ):
+        """
+        Initialise l'extracteur.
+
+        Args:
+            cache: Le cache des offres traitées
+            http_client: Le client HTTP partagé
+            concurrency: Nombre maximal de pages récupérées simultanément
+            seen_index: Index des offres déjà chargées, ignorées sans requête si elles
+                n'ont pas de validateurs HTTP (revalidées sinon)
+        """
+        self.cache = cache
+        self.http_client = http_client
+        self.concurrency = max(1, concurrency)
+        self.seen_index = seen_index
+
+    async def extract(
+        self,
+        urls: List[str],
+        failed: Optional[List[str]] = None,
+        sources: Optional[Dict[str, Iterable[str]]] = None
+    ) -> Dict[str, int]:
+        """
+        Extrait et met en cache le HTML brut de toutes les offres.
+
+        Args:
+            urls: Les URLs des offres à extraire
+            failed: Liste complétée avec les URLs en échec, restées à l'étape discovered
+            sources: URL -> sources qui l'ont trouvée (JobListScraper.get_job_url_sources)
+
+        Returns:
+            Dict[str, int]: Statistiques (extracted, skipped, known, not_modified, failed)
+        """
+        stats = {'extracted': 0, 'skipped': 0, 'known': 0, 'not_modified': 0, 'failed': 0}
+        failed = failed if failed is not None else []
+        queue: asyncio.Queue = asyncio.Queue()
+        await self._enqueue_unprocessed(urls, queue, stats, sources)
+
+        workers = [
+            asyncio.create_task(self._worker(queue, stats, failed))
+            for _ in range(min(self.concurrency, queue.qsize()))
+        ]
+        await asyncio.gather(*workers)
+
+        logger.info(
+            f"📊 Extraction terminée ({self.concurrency} en parallèle) : "
+            f"{stats['extracted']} extraites, {stats['skipped']} déjà vues, "
+            f"{stats['known']} déjà chargées, "
+            f"{stats['not_modified']} inchangées, {stats['failed']} échecs"
+        )
+        return stats
+
+    async def _enqueue_unprocessed(
+        self,
+        urls: List[str],
+        queue: asyncio.Queue,
+        stats: Dict[str, int],
+        sources: Optional[Dict[str, Iterable[str]]] = None
+    ) -> None:
+        """
+        Met en file les offres pas encore traitées, avec leurs validateurs connus.
+
+        Les offres présentes dans l'index des offres chargées sont écartées sans
+        requête HTTP, sauf si elles ont des validateurs : ceux-ci ne sont conservés
+        qu'au chargement, et la requête conditionnelle (304) reste la seule façon
+        de détecter une offre republiée avec un contenu modifié.
+
+        Les vérifications du cache sont faites par lots de CACHE_BATCH_SIZE,
+        en deux allers-retours par lot plutôt que deux par offre.
+
+        Args:
+            urls: Les URLs des offres
+            queue: La file des workers
+            stats: Statistiques à mettre à jour
+            sources: Sources de chaque offre, enregistrées avec l'offre
+        """
+        for start in range(0, len(urls), CACHE_BATCH_SIZE):
+            batch = urls[start:start + CACHE_BATCH_SIZE]
+            known_validators = dict(zip(batch, await self.cache.get_validators_many(batch)))
+            if self.seen_index is not None:
+                fresh = [url for url in batch if known_validators[url] or url not in self.seen_index]
+                stats['known'] += len(batch) - len(fresh)
+                batch = fresh
+            processed = await self.cache.are_processed(batch)
+            pending = [url for url, done in zip(batch, processed) if not done]
+            await self.cache.register_discovered(pending, sources)
+            stats['skipped'] += len(batch) - len(pending)
+            if len(pending) < len(batch):
+                logger.debug(f"⏭️ {len(batch) - len(pending)} URLs déjà extraites sur {len(batch)}")
+            for url in pending:
+                queue.put_nowait((url, known_validators[url]))
+
+    async def _worker(self, queue: asyncio.Queue, stats: Dict[str, int], failed: List[str]) -> None:
+        """Consomme les URLs de la file jusqu'à épuisement."""
+        while True:
+            try:
+                url, validators = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            if not await self._extract_one(url, validators, stats):
+                failed.append(url)
+
+    async def _extract_one(self, url: str, validators: Optional[Dict[str, str]], stats: Dict[str, int]) -> bool:
+        """
+        Extrait une offre pas encore traitée.
+
+        Args:
+            url: L'URL de l'offre
+            validators: Les validateurs HTTP connus de l'offre
+            stats: Statistiques à mettre à jour
+
+        Returns:
+            bool: False si l'extraction a échoué
+        """
+        try:
+            # Requête conditionnelle si l'offre a déjà été chargée : une réponse 304
+            # court-circuite nettoyage, analyse et chargement
+            result = await self.http_client.fetch_conditional(url, validators)
+            if result.not_modified:
+                # Contenu identique à celui déjà traité : rien à refaire en aval, les
+                # validateurs sont prolongés pour la prochaine revalidation
+                await self.cache.mark_processed(url)
+                await self.cache.store_validators(url, result.validators)
+                await self.cache.transition_offers([url], OfferStage.LOADED, OfferStage.DISCOVERED)
+                stats['not_modified'] += 1
+                logger.info(f"♻️ Offre inchangée depuis la dernière extraction: {url}")
+            elif result.text:
+                await self.cache.store_raw_html(url, result.text, result.validators)
+                stats['extracted'] += 1
+                logger.info(f"✅ HTML extrait: {url}")
+            else:
+                stats['failed'] += 1
+                logger.error(f"❌ Échec de l'extraction: {url}")
+                return False
+            return True
+
+        except Exception as e:
+            stats['failed'] += 1
+            logger.error(f"❌ Erreur lors de l'extraction de {url}: {str(e)}")
+            return False
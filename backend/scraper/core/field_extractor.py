@@ -0,0 +1,403 @@
+"""
+Module d'extraction des champs structurés par règles (motifs et valeurs exactes des tags),
+avant l'appel à Mistral : seuls les champs non résolus lui sont demandés.
+"""
+
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import lxml.html
+from lxml import etree
+from loguru import logger
+
+from .html_cleaner import HTMLCleaner
+from .enums import (
+    CompanyType,
+    ContractType,
+    Country,
+    ExperienceLevel,
+    FranceRegion,
+    JobDomain,
+    RemoteType,
+    get_regions_by_country
+)
+from ..config.settings import FIELD_EXTRACTOR_MIN_CONFIDENCE
+
+# Grandes villes et leur région, comme dans la consigne REGION du prompt
+CITY_REGIONS = {
+    'Paris': FranceRegion.ILE_DE_FRANCE,
+    'Lyon': FranceRegion.AUVERGNE_RHONE_ALPES,
+    'Marseille': FranceRegion.PROVENCE_ALPES_COTE_AZUR,
+    'Bordeaux': FranceRegion.NOUVELLE_AQUITAINE,
+    'Toulouse': FranceRegion.OCCITANIE,
+    'Nantes': FranceRegion.PAYS_DE_LA_LOIRE,
+    'Lille': FranceRegion.HAUTS_DE_FRANCE,
+    'Strasbourg': FranceRegion.GRAND_EST
+}
+
+# Écritures des technologies et leur nom normalisé, comme dans la consigne TECHNOS du prompt
+# ("TF" est ambigu entre Terraform et TensorFlow : il est laissé à Mistral)
+TECHNO_ALIASES = {
+    'GCP': ('GCP', 'Google Cloud', 'Google Cloud Platform'),
+    'AWS': ('AWS', 'Amazon Web Services'),
+    'Azure': ('Azure', 'Microsoft Azure'),
+    'React': ('React', 'ReactJS', 'React.js'),
+    'Vue': ('Vue', 'VueJS', 'Vue.js'),
+    'Angular': ('Angular', 'AngularJS'),
+    'Node': ('Node', 'NodeJS', 'Node.js'),
+    'Next': ('Next', 'NextJS', 'Next.js'),
+    'Express': ('Express', 'ExpressJS'),
+    'NestJS': ('NestJS', 'Nest'),
+    'PostgreSQL': ('PostgreSQL', 'Postgres'),
+    'MongoDB': ('MongoDB', 'Mongo'),
+    'Elasticsearch': ('Elasticsearch', 'ES'),
+    'MySQL': ('MySQL', 'MariaDB'),
+    'Kubernetes': ('Kubernetes', 'K8s'),
+    'Docker': ('Docker',),
+    'Jenkins': ('Jenkins',),
+    'Terraform': ('Terraform',),
+    'Ansible': ('Ansible',),
+    'JavaScript': ('JavaScript', 'JS'),
+    'TypeScript': ('TypeScript', 'TS'),
+    'Python': ('Python',),
+    'Java': ('Java',),
+    'Go': ('Go', 'Golang'),
+    'PHP': ('PHP',),
+    '.NET': ('.NET', 'dotnet'),
+    'C#': ('C#', 'Csharp'),
+    'C++': ('C++', 'Cplusplus'),
+    'Django': ('Django', 'DRF'),
+    'Flask': ('Flask',),
+    'FastAPI': ('FastAPI',),
+    'Laravel': ('Laravel',),
+    'Spring': ('Spring', 'Spring Boot'),
+    'Symfony': ('Symfony',),
+    'TensorFlow': ('TensorFlow',),
+    'PyTorch': ('PyTorch',),
+    'Pandas': ('Pandas',),
+    'Spark': ('Spark', 'PySpark'),
+    'Kafka': ('Kafka',),
+    'Airflow': ('Airflow',)
+}
+
+# Autres écritures des domaines dans les titres (la valeur de l'énumération est toujours cherchée)
+DOMAIN_ALIASES = {
+    JobDomain.FULLSTACK: ('full stack', 'full-stack'),
+    JobDomain.FRONTEND: ('front-end', 'front end'),
+    JobDomain.BACKEND: ('back-end', 'back end'),
+    JobDomain.DATA_ENGINEER: ('ingenieur data',),
+    JobDomain.ML_ENGINEER: ('machine learning engineer',),
+    JobDomain.TECH_LEAD: ('lead tech', 'lead dev'),
+    JobDomain.CYBERSECURITY: ('cybersecurity',)
+}
+
+# Les motifs portent sur le texte replié (minuscules, sans accents, espaces insécables remplacés)
+_NUMBER = r"\d+(?: \d{3})*"
+_PER_DAY = r"\s*(?:€|eur(?:os)?)\s*(?:/|⁄|par\s+|)\s*(?:jours?|jr|j)\b"
+TJM_RANGE = re.compile(rf"({_NUMBER})\s*(?:€\s*)?(?:-|–|a|et)\s*({_NUMBER}){_PER_DAY}")
+TJM_SINGLE = re.compile(rf"({_NUMBER}){_PER_DAY}")
+# Pas une durée : expérience, rythme de travail ("3 jours de presentiel par semaine")
+# ou délai de démarrage ("dans 2 semaines", "sous 15 jours")
+DURATION = re.compile(
+    r"(?<!dans )(?<!sous )(?<!d'ici )\b(\d+)\s*(mois|ans?|annees?|semaines?|jours?)\b"
+    r"(?!\s*(?:d['’]\s*|de\s+|en\s+|sur\s+)?(?:exp|teletravail|remote|presentiel|site)"
+    r"|\s*(?:par|/)\s*(?:semaine|mois))"
+)
+XP_YEARS = re.compile(
+    r"\b(\d+)\s*\+?\s*(?:(?:a|-)\s*\d+\s*)?(?:ans?|annees?)\s*(?:d['’]\s*|de\s+|minimum\s+d['’]\s*)?exp"
+    r"|\bexp\w*\s*(?::|de|minimum)?\s*(\d+)\s*(?:ans?|annees?)"
+)
+CONTRACT = re.compile(r"\b(freelance|cdi|cdd|stage|alternance)\b")
+REMOTE_PATTERNS = {
+    RemoteType.FULL: re.compile(
+        r"100\s*%\s*(?:de\s+)?(?:teletravail|remote)|teletravail\s*(?:a\s*)?100\s*%"
+        r"|full\s*remote|teletravail\s+(?:total|complet)"
+    ),
+    RemoteType.HYBRID: re.compile(
+        r"teletravail\s+partiel|hybride|remote\s+partiel|\d\s*jours?\s+de\s+teletravail"
+        r"|\d\s*jours?\s+(?:de\s+|en\s+|sur\s+)?(?:presentiel|site)|presentiel\s+\d\s*jours?"
+    ),
+    RemoteType.OFFICE: re.compile(
+        r"pas\s+de\s+teletravail|sans\s+teletravail|100\s*%\s*(?:sur\s+site|(?:en\s+)?presentiel)"
+    )
+}
+# "Présentiel" seul : bureau, sauf si la ligne cite un autre mode
+PRESENTIEL = re.compile(r"\bpresentiel\b")
+
+def fold(text: str) -> str:
+    """Replie un texte pour la recherche : minuscules, sans accents, espaces normalisés."""
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ' '.join(''.join(c for c in decomposed if not unicodedata.combining(c)).lower().split())
+
+def _word_pattern(words: Iterable[str]) -> re.Pattern:
+    """Compile une alternative de mots ou expressions entiers (texte replié)."""
+    alternatives = sorted({re.escape(fold(word)) for word in words}, key=len, reverse=True)
+    return re.compile(rf"(?<![\w.#+])(?:{'|'.join(alternatives)})(?![\w#+])")
+
+@dataclass
+class FieldExtraction:
+    """Champs extraits par les règles d'une offre, avec leur confiance (de 0 à 1)."""
+    values: Dict[str, Any] = field(default_factory=dict)
+    confidence: Dict[str, float] = field(default_factory=dict)
+
+    def add(self, name: str, value: Any, confidence: float) -> None:
+        """Retient une valeur, sauf si le champ a déjà une valeur plus sûre."""
+        if confidence > self.confidence.get(name, 0.0):
+            self.values[name] = value
+            self.confidence[name] = confidence
+
+    def resolved(self, min_confidence: float = FIELD_EXTRACTOR_MIN_CONFIDENCE) -> Dict[str, Any]:
+        """Champs assez sûrs pour ne pas être demandés à Mistral."""
+        return {
+            name: value for name, value in self.values.items()
+            if self.confidence[name] >= min_confidence
+        }
+
+class FieldExtractor:
+    """
+    Remplit localement les champs structurés des offres (REQUIRED_FIELDS).
+
+    Les tags et les lignes d'informations clés (TJM, durée, télétravail, contrat,
+    expérience) sont affichés sous une forme régulière : une valeur exacte ou
+    un motif trouvé dans ces lignes est sûr, le même motif trouvé seulement dans la
+    description ne l'est pas et le champ reste demandé à Mistral.
+    Les autres champs (titre, entreprise, domaine, lieu, technologies...) dépendent
+    de toute l'offre : ils sont relevés à titre indicatif, avec une confiance plafonnée
+    à TEXT_CONFIDENCE, et restent demandés à Mistral.
+    Fonctionne sur les trois sorties du nettoyeur (html, markdown et text).
+    """
+
+    TAG_CONFIDENCE = 0.9  # Valeur exacte d'un tag ou d'une ligne d'informations clés
+    PATTERN_CONFIDENCE = 0.8  # Motif trouvé dans un tag ou une ligne d'informations clés
+    TEXT_CONFIDENCE = 0.5  # Motif trouvé seulement dans le texte de l'offre
+    # Seuls champs que les règles peuvent résoudre
+    RULE_FIELDS = ('TJM_MIN', 'TJM_MAX', 'DURATION_DAYS', 'REMOTE', 'CONTRACT_TYPE', 'XP')
+
+    def __init__(self):
+        """Compile les recherches de valeurs des énumérations."""
+        self._company_types = {fold(t.value): t.value for t in CompanyType}
+        self._company_type_pattern = _word_pattern(self._company_types)
+        self._contract_types = {fold(t.value): t.value for t in ContractType}
+        self._levels = {fold(level.value): level.value for level in ExperienceLevel}
+        self._level_pattern = _word_pattern(self._levels)
+        self._technos = {
+            fold(alias): techno for techno, aliases in TECHNO_ALIASES.items() for alias in aliases
+        }
+        self._domains = [
+            (domain.value, _word_pattern((domain.value,) + DOMAIN_ALIASES.get(domain, ())))
+            for domain in JobDomain
+        ]
+        self._regions = [
+            (country.value, region, _word_pattern((region,)))
+            for country in Country for region in get_regions_by_country(country)
+        ]
+        self._countries = [(country.value, _word_pattern((country.value,))) for country in Country]
+        self._cities = [(region.value, _word_pattern((city,))) for city, region in CITY_REGIONS.items()]
+        self._key_elements = etree.XPath(
+            "//*[contains(concat(' ', normalize-space(@class), ' '), ' tag ') or contains(@class, 'line-clamp-2')]"
+        )
+
+    def extract(self, content: str, url: str = "") -> FieldExtraction:
+        """
+        Extrait les champs d'une offre nettoyée.
+
+        Args:
+            content: Le contenu nettoyé de l'offre (HTML, markdown ou texte)
+            url: L'URL de l'offre, pour les logs
+
+        Returns:
+            FieldExtraction: Les champs trouvés et leur confiance
+        """
+        extraction = FieldExtraction()
+        try:
+            title, company, key_lines, text = self._read(content)
+            key_lines = [fold(line) for line in key_lines if line.strip()]
+            text = fold(text)
+
+            if title:
+                extraction.add('TITLE', title, self.TAG_CONFIDENCE)
+                self._extract_domain(extraction, fold(title))
+            if company and fold(company) != 'free-work':
+                extraction.add('COMPANY', company, self.TAG_CONFIDENCE)
+            self._extract_company_type(extraction, key_lines, text)
+            self._extract_contract(extraction, key_lines, text)
+            self._extract_remote(extraction, key_lines, text)
+            self._extract_experience(extraction, key_lines, text)
+            self._extract_location(extraction, key_lines)
+            self._extract_technos(extraction, key_lines)
+            if extraction.values.get('CONTRACT_TYPE') == [ContractType.CDI.value]:
+                # Pas de TJM ni de durée pour un CDI
+                confidence = extraction.confidence['CONTRACT_TYPE']
+                for name in ('TJM_MIN', 'TJM_MAX', 'DURATION_DAYS'):
+                    extraction.add(name, None, confidence)
+            else:
+                self._extract_rate(extraction, key_lines, text)
+                self._extract_duration(extraction, key_lines, text)
+        except Exception as e:
+            logger.warning(f"⚠️ Extraction par règles impossible pour {url or 'l’offre'}: {str(e)}")
+        for name, confidence in extraction.confidence.items():
+            if name not in self.RULE_FIELDS:
+                extraction.confidence[name] = min(confidence, self.TEXT_CONFIDENCE)
+        return extraction
+
+    def _read(self, content: str) -> Tuple[Optional[str], Optional[str], List[str], str]:
+        """
+        Sépare le contenu nettoyé en titre, nom d'entreprise, lignes d'informations clés et texte.
+        """
+        if not content.strip():
+            return None, None, [], ''
+        if content.lstrip().startswith('<'):
+            root = lxml.html.fromstring(content)
+            title = root.xpath("string(//h1[contains(@class, 'text-2xl')])")
+            company = root.xpath(
+                "string((//div[@class='flex items-center']//*[self::h1 or self::h2 or self::h3])[1])"
+            )
+            key_lines = [' '.join(element.itertext()) for element in self._key_elements(root)]
+            text = ' '.join(root.itertext())
+            return ' '.join(title.split()) or None, ' '.join(company.split()) or None, key_lines, text
+
+        # Sortie markdown / text : seules les lignes étiquetées par le nettoyeur
+        # ("Tags: a, b" et "Info: ...") sont des informations clés
+        title = None
+        key_lines = []
+        for line in content.splitlines():
+            line = line.strip()
+            if line.startswith('# ') and title is None:
+                title = line[2:]
+            elif line.startswith(HTMLCleaner.TAGS_LABEL):
+                key_lines.extend(line[len(HTMLCleaner.TAGS_LABEL):].split(', '))
+            elif line.startswith(HTMLCleaner.KEY_INFO_LABEL):
+                key_lines.append(line[len(HTMLCleaner.KEY_INFO_LABEL):])
+        return title, None, key_lines, content
+
+    def _search(self, pattern: re.Pattern, key_lines: List[str], text: str) -> Tuple[Optional[re.Match], float]:
+        """Cherche un motif dans les lignes d'informations clés, puis dans le texte."""
+        for line in key_lines:
+            match = pattern.search(line)
+            if match:
+                return match, self.PATTERN_CONFIDENCE
+        return pattern.search(text), self.TEXT_CONFIDENCE
+
+    def _extract_domain(self, extraction: FieldExtraction, title: str) -> None:
+        """Domaine cité dans le titre, s'il est le seul."""
+        domains = [domain for domain, pattern in self._domains if pattern.search(title)]
+        if len(domains) == 1:
+            extraction.add('DOMAIN', domains[0], self.PATTERN_CONFIDENCE)
+
+    def _extract_company_type(self, extraction: FieldExtraction, key_lines: List[str], text: str) -> None:
+        """Type d'entreprise : tag égal à une valeur de l'énumération."""
+        for line in key_lines:
+            if line in self._company_types:
+                extraction.add('COMPANY_TYPE', self._company_types[line], self.TAG_CONFIDENCE)
+                return
+        match = self._company_type_pattern.search(text)
+        if match:
+            extraction.add('COMPANY_TYPE', self._company_types[match.group(0)], self.TEXT_CONFIDENCE)
+
+    def _extract_contract(self, extraction: FieldExtraction, key_lines: List[str], text: str) -> None:
+        """Types de contrat cités dans les tags, dans leur ordre d'apparition."""
+        for lines, confidence in ((key_lines, self.TAG_CONFIDENCE), ([text], self.TEXT_CONFIDENCE)):
+            found = []
+            for line in lines:
+                for match in CONTRACT.finditer(line):
+                    contract_type = self._contract_types[match.group(1)]
+                    if contract_type not in found:
+                        found.append(contract_type)
+            if found:
+                extraction.add('CONTRACT_TYPE', found, confidence)
+                return
+
+    @staticmethod
+    def _remote_modes(line: str) -> List[str]:
+        """Modes de télétravail cités dans une ligne."""
+        modes = [mode.value for mode, pattern in REMOTE_PATTERNS.items() if pattern.search(line)]
+        if not modes and PRESENTIEL.search(line):
+            modes.append(RemoteType.OFFICE.value)
+        return modes
+
+    def _extract_remote(self, extraction: FieldExtraction, key_lines: List[str], text: str) -> None:
+        """Mode de télétravail, s'il n'y en a qu'un dans les lignes examinées."""
+        for lines, confidence in ((key_lines, self.TAG_CONFIDENCE), ([text], self.TEXT_CONFIDENCE)):
+            modes = list(dict.fromkeys(mode for line in lines for mode in self._remote_modes(line)))
+            if len(modes) == 1:
+                extraction.add('REMOTE', modes[0], confidence)
+                return
+            if modes:
+                return
+
+    def _extract_experience(self, extraction: FieldExtraction, key_lines: List[str], text: str) -> None:
+        """Niveau d'expérience : niveau cité ou nombre d'années converti, s'ils concordent."""
+        levels = {
+            self._levels[match.group(0)]
+            for line in key_lines for match in self._level_pattern.finditer(line)
+        }
+        levels.update(
+            ExperienceLevel.from_years(int(match.group(1) or match.group(2))).value
+            for line in key_lines for match in XP_YEARS.finditer(line)
+        )
+        if len(levels) == 1:
+            extraction.add('XP', levels.pop(), self.TAG_CONFIDENCE)
+        elif not levels:
+            match = XP_YEARS.search(text)
+            if match:
+                years = int(match.group(1) or match.group(2))
+                extraction.add('XP', ExperienceLevel.from_years(years).value, self.TEXT_CONFIDENCE)
+
+    def _extract_rate(self, extraction: FieldExtraction, key_lines: List[str], text: str) -> None:
+        """TJM minimum et maximum en euros (le même si un seul taux est donné)."""
+        match, confidence = self._search(TJM_RANGE, key_lines, text)
+        if match:
+            low, high = sorted(int(match.group(i).replace(' ', '')) for i in (1, 2))
+        else:
+            match, confidence = self._search(TJM_SINGLE, key_lines, text)
+            if not match:
+                return
+            low = high = int(match.group(1).replace(' ', ''))
+        extraction.add('TJM_MIN', low, confidence)
+        extraction.add('TJM_MAX', high, confidence)
+
+    def _extract_duration(self, extraction: FieldExtraction, key_lines: List[str], text: str) -> None:
+        """Durée de la mission en jours, avec les conversions de la consigne DURATION_DAYS."""
+        match, confidence = self._search(DURATION, [line for line in key_lines if 'publi' not in line], text)
+        if not match:
+            return
+        count, unit = int(match.group(1)), match.group(2)
+        if unit == 'mois':
+            # Les années pleines comptent 365 jours ("12 mois" = 365, "24 mois" = 730)
+            days = count // 12 * 365 if count % 12 == 0 else count * 30
+        elif unit.startswith(('an', 'annee')):
+            days = count * 365
+        elif unit.startswith('semaine'):
+            days = count * 7
+        else:
+            days = count
+        extraction.add('DURATION_DAYS', days, confidence)
+
+    def _extract_location(self, extraction: FieldExtraction, key_lines: List[str]) -> None:
+        """Région et pays cités dans les informations clés (nom de région, grande ville ou pays)."""
+        for country, region, pattern in self._regions:
+            if any(pattern.search(line) for line in key_lines):
+                extraction.add('REGION', region, self.TAG_CONFIDENCE)
+                extraction.add('COUNTRY', country, self.TAG_CONFIDENCE)
+                return
+        for region, pattern in self._cities:
+            if any(pattern.search(line) for line in key_lines):
+                extraction.add('REGION', region, self.PATTERN_CONFIDENCE)
+                extraction.add('COUNTRY', Country.FRANCE.value, self.PATTERN_CONFIDENCE)
+                return
+        for country, pattern in self._countries:
+            if any(pattern.search(line) for line in key_lines):
+                extraction.add('COUNTRY', country, self.PATTERN_CONFIDENCE)
+                return
+
+    def _extract_technos(self, extraction: FieldExtraction, key_lines: List[str]) -> None:
+        """Technologies des tags, normalisées (5 au plus)."""
+        technos = []
+        for line in key_lines:
+            techno = self._technos.get(line)
+            if techno and techno not in technos:
+                technos.append(techno)
+        if technos:
+            extraction.add('TECHNOS', technos[:5], self.PATTERN_CONFIDENCE)
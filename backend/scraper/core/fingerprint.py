@@ -0,0 +1,56 @@
+"""
+Module de calcul d'empreintes de contenu pour la détection des changements.
+"""
+
+import hashlib
+import re
+
+_SCRIPTS_AND_STYLES = re.compile(r'<(script|style|noscript)\b[^>]*>.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+_COMMENTS = re.compile(r'<!--.*?-->', re.DOTALL)
+_WHITESPACE = re.compile(r'\s+')
+_INTER_TAG_WHITESPACE = re.compile(r'>\s+<')
+
+def normalize_html(html: str) -> str:
+    """
+    Normalise une page brute avant le calcul de son empreinte.
+
+    Les scripts, styles et commentaires sont retirés car ils portent des
+    valeurs qui changent à chaque requête (nonces, identifiants de build,
+    horodatages) sans que l'offre elle-même ne change. Ils sont de toute
+    façon supprimés par le nettoyeur.
+
+    Args:
+        html: Le HTML brut
+
+    Returns:
+        str: Le HTML normalisé
+    """
+    html = _SCRIPTS_AND_STYLES.sub('', html)
+    html = _COMMENTS.sub('', html)
+    html = _INTER_TAG_WHITESPACE.sub('><', html)
+    return _WHITESPACE.sub(' ', html).strip()
+
+def fingerprint(content: str) -> str:
+    """
+    Calcule l'empreinte d'un contenu.
+
+    Args:
+        content: Le contenu (déjà normalisé si nécessaire)
+
+    Returns:
+        str: L'empreinte hexadécimale (BLAKE2b, 128 bits)
+    """
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+
+def html_fingerprint(html: str, salt: str = "") -> str:
+    """
+    Calcule l'empreinte d'une page brute après normalisation.
+
+    Args:
+        html: Le HTML brut
+        salt: Préfixe mêlé au contenu (ex: configuration du traitement appliqué à la page)
+
+    Returns:
+        str: L'empreinte hexadécimale
+    """
+    return fingerprint(salt + normalize_html(html))
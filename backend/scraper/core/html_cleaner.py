@@ -2,18 +2,126 @@
 Module de nettoyage du HTML des offres d'emploi.
 """
 
+import math
+
+import lxml.html
 from bs4 import BeautifulSoup
-from typing import Dict, Any, List, Optional, Tuple
+from bs4.element import PreformattedString, Tag
+from bs4.builder import HTMLTreeBuilder
+from bs4.dammit import EntitySubstitution
+from lxml import etree
+from typing import Dict, Any, Callable, Iterable, List, Optional, Tuple, Union
 from loguru import logger
 
-from ..config.settings import ALLOWED_TAGS, RELEVANT_CLASSES
+from ..config.settings import (
+    ALLOWED_TAGS,
+    HTML_CLEANER_ENGINE,
+    HTML_CLEANER_OUTPUT,
+    HTML_CLEANER_TOKEN_BUDGET,
+    RELEVANT_CLASSES,
+    TOKEN_CHARS_RATIO
+)
 from ..core.enums import CompanyType
+from .boilerplate import BoilerplateModel, BoilerplateSnapshot, block_fingerprint
+from .fingerprint import fingerprint
+
+# Balises qui terminent une ligne dans les sorties markdown / text
+BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'br', 'dd', 'div', 'dl', 'dt', 'footer',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main', 'nav', 'ol', 'p',
+    'pre', 'section', 'table', 'td', 'th', 'tr', 'ul'
+}
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estime le nombre de tokens d'un texte pour le tokenizer Mistral.
+
+    Args:
+        text: Le texte à mesurer
+
+    Returns:
+        int: Le nombre de tokens estimé
+    """
+    return math.ceil(len(text) / TOKEN_CHARS_RATIO)
 
 class HTMLCleaner:
-    """Nettoie et extrait les sections pertinentes du HTML."""
+    """
+    Nettoie et extrait les sections pertinentes du HTML.
+
+    Le document est parsé une seule fois puis parcouru une seule fois pour repérer
+    les scripts, styles et sections à conserver. Deux moteurs produisent la même sortie :
+    - `bs4` : BeautifulSoup
+    - `lxml` : lxml.html et une sérialisation équivalente, plus rapide
+
+    Trois formats de sortie sont disponibles :
+    - `html` : les sections conservées, avec leurs balises et leurs classes
+    - `markdown` / `text` : le texte des sections, section par section, sans balises,
+      tronqué par priorité de section au-delà du budget de tokens
+
+    Avec un modèle de gabarit, les titres et paragraphes présents sur la plupart des
+    pages (navigation, pied de page, mentions légales) sont retirés.
+    """
+
+    ENGINES = ('bs4', 'lxml')
+    OUTPUTS = ('html', 'markdown', 'text')
+
+    # Version de la sortie du nettoyage, à incrémenter quand elle change pour une même page
+    VERSION = 2
+
+    # Div principale, conservée pour les informations entreprise
+    COMPANY_CLASS = 'flex items-center'
+
+    # Sections importantes, extraites dans cet ordre
+    IMPORTANT_CLASSES = [
+        'text-2xl font-bold',  # Titre
+        'html-renderer prose-content',  # Description
+        'tag',  # Tags et labels
+        'line-clamp-2',  # Informations clés
+    ]
+
+    # Titres et paragraphes, conservés s'ils contiennent du texte
+    CONTENT_TAGS = ['h1', 'h2', 'h3', 'p']
+
+    # Sections des sorties markdown / text, dans l'ordre d'affichage et de priorité
+    # face au budget de tokens (titre, tags et informations clés avant la description)
+    TEXT_SECTIONS = ['title', 'company', 'tags', 'key_info', 'description', 'content']
 
-    def __init__(self):
-        """Initialise le nettoyeur avec les paramètres de configuration."""
+    # Étiquettes des lignes de tags et d'informations clés des sorties markdown / text,
+    # qui permettent de les distinguer du reste du texte (voir FieldExtractor)
+    TAGS_LABEL = 'Tags: '
+    KEY_INFO_LABEL = 'Info: '
+
+    # Section de chaque phase d'extraction (div entreprise, classes importantes, puis balises)
+    PHASE_SECTIONS = ['company', 'title', 'description', 'tags', 'key_info'] + ['content'] * len(CONTENT_TAGS)
+
+    # Sections dont les blocs sont comparés au modèle de gabarit (les tags communs comme "CDI" restent)
+    BOILERPLATE_SECTIONS = ('content',)
+
+    def __init__(
+        self,
+        engine: str = HTML_CLEANER_ENGINE,
+        output: str = HTML_CLEANER_OUTPUT,
+        token_budget: int = HTML_CLEANER_TOKEN_BUDGET,
+        boilerplate: Optional[Union[BoilerplateModel, BoilerplateSnapshot]] = None
+    ):
+        """
+        Initialise le nettoyeur avec les paramètres de configuration.
+
+        Args:
+            engine: Moteur de nettoyage ('bs4' ou 'lxml')
+            output: Format de sortie ('html', 'markdown' ou 'text')
+            token_budget: Tokens au plus en sortie markdown / text
+            boilerplate: Modèle des blocs de gabarit à retirer (aucun retrait si None)
+        """
+        if engine not in self.ENGINES:
+            raise ValueError(f"Moteur de nettoyage inconnu: {engine}")
+        if output not in self.OUTPUTS:
+            raise ValueError(f"Format de sortie inconnu: {output}")
+        self.engine = engine
+        self.output = output
+        self.token_budget = token_budget
+        self.boilerplate = boilerplate
+        self.blocks: List[str] = []  # Empreintes des blocs du dernier nettoyage, pour l'apprentissage du gabarit
         self.allowed_tags = ALLOWED_TAGS + ['h1', 'h2', 'h3', 'span', 'div', 'p', 'ul', 'li', 'strong', 'em']
         self.relevant_classes = RELEVANT_CLASSES + [
             'job-title',
@@ -27,7 +135,12 @@ class HTMLCleaner:
             'original_size': 0,
             'cleaned_size': 0,
             'scripts_removed': 0,
-            'styles_removed': 0
+            'styles_removed': 0,
+            'tokens': 0,
+            'truncated': False,
+            'boilerplate_removed': 0,
+            'duplicates_skipped': 0,
+            'duplicate_bytes_saved': 0
         }
 
     @property
@@ -35,6 +148,18 @@ class HTMLCleaner:
         """Retourne les statistiques du dernier nettoyage."""
         return self._stats
 
+    @property
+    def signature(self) -> str:
+        """
+        Empreinte de la configuration du nettoyage (version, moteur, format, budget, gabarit).
+
+        Mêlée à l'empreinte du HTML brut, elle invalide les pages déjà nettoyées
+        quand le nettoyeur change. Du gabarit appris, seule l'activation compte :
+        ses blocs évoluent à chaque lot et ne portent pas les champs de l'offre.
+        """
+        boilerplate = "boilerplate" if self.boilerplate is not None else ""
+        return fingerprint(f"{self.VERSION}:{self.engine}:{self.output}:{self.token_budget}:{boilerplate}")
+
     def extract_company_info(self, soup: BeautifulSoup) -> Tuple[Optional[str], Optional[str]]:
         """
         Extrait les informations de l'entreprise du HTML.
@@ -83,25 +208,18 @@ class HTMLCleaner:
         Returns:
             str: Le HTML nettoyé
         """
+        self.blocks = []
         try:
-            # 1. Parse le HTML
-            soup = self._create_soup(html_content)
-            if not soup:
+            if self.engine == 'lxml':
+                cleaned_html = self._clean_lxml(html_content)
+            else:
+                cleaned_html = self._clean_bs4(html_content)
+            if cleaned_html is None:
                 return ''
-                
-            # 2. Crée une copie du soup pour le nettoyage
-            soup_for_cleaning = BeautifulSoup(str(soup), 'lxml')
             
-            # 3. Supprime les éléments non désirés
-            self._remove_unwanted_elements(soup_for_cleaning)
-            
-            # 4. Extrait les sections pertinentes
-            clean_soup = self._extract_relevant_sections(soup_for_cleaning)
-            
-            # 5. Crée le document final
-            cleaned_html = str(clean_soup)
-            
-            # 6. Met à jour les stats
+            if self.output == 'html':
+                self._stats['tokens'] = estimate_tokens(cleaned_html)
+                self._stats['truncated'] = False
             self._update_stats(len(html_content), len(cleaned_html))
             
             logger.success(f"✅ Nettoyage terminé : {len(cleaned_html):,} caractères (réduction de {self._get_reduction_percent():.1f}%)")
@@ -111,6 +229,107 @@ class HTMLCleaner:
             logger.error(f"❌ Erreur lors du nettoyage HTML: {str(e)}")
             return ''
 
+    def _clean_bs4(self, html: str) -> Optional[str]:
+        """Nettoie la page avec BeautifulSoup, en un seul parsing."""
+        soup = self._create_soup(html)
+        if not soup:
+            return None
+        
+        unwanted, phases = self._classify(soup.find_all(True), lambda tag: tag.name, lambda tag: tag.get('class'))
+        self._remove_unwanted_elements(unwanted, lambda tag: tag.decompose())
+        
+        clean_soup = BeautifulSoup('<div class="cleaned-content"></div>', 'lxml')
+        content_div = clean_soup.find('div', class_='cleaned-content')
+        
+        def is_attached(tag) -> bool:
+            return all(parent is not content_div for parent in tag.parents)
+        
+        sections = self._extract_relevant_sections(phases, is_attached, lambda tag: tag.get_text(), content_div.append)
+        sections = self._drop_boilerplate(sections, lambda tag: tag.get_text(), lambda tag: tag.decompose())
+        if self.output != 'html':
+            return self._render_text(sections, self._walk_bs4)
+        
+        # Nettoie les attributs
+        for tag in content_div.find_all(True):
+            allowed_attrs = ['class'] if tag.name in self.allowed_tags else []
+            attrs = dict(tag.attrs)
+            for attr in attrs:
+                if attr not in allowed_attrs:
+                    del tag[attr]
+        
+        return str(clean_soup)
+
+    def _clean_lxml(self, html: str) -> str:
+        """Nettoie la page avec lxml, puis la sérialise comme le ferait BeautifulSoup."""
+        try:
+            root = lxml.html.document_fromstring(html)
+        except ValueError:
+            # Document avec déclaration d'encodage XML : lxml exige des octets
+            root = lxml.html.document_fromstring(html.encode('utf-8'))
+        except etree.ParserError:
+            # Document vide
+            root = None
+        
+        content_div = lxml.html.Element('div')
+        sections = []
+        if root is not None:
+            unwanted, phases = self._classify(
+                self._iter_lxml(root),
+                lambda element: element.tag,
+                lambda element: element.get('class', '').split() if 'class' in element.attrib else None
+            )
+            self._remove_unwanted_elements(unwanted, lambda element: element.drop_tree())
+            
+            def is_attached(element) -> bool:
+                return all(ancestor is not content_div for ancestor in element.iterancestors())
+            
+            def move(element) -> None:
+                # Le texte qui suit l'élément reste à sa place, comme avec BeautifulSoup
+                if element.getparent() is not None:
+                    element.drop_tree()
+                element.tail = None
+                content_div.append(element)
+            
+            def text_of(element) -> str:
+                return ''.join(element.itertext())
+            
+            sections = self._extract_relevant_sections(phases, is_attached, text_of, move)
+            sections = self._drop_boilerplate(sections, text_of, content_div.remove)
+        if self.output != 'html':
+            return self._render_text(sections, self._walk_lxml)
+        
+        parts = ['<html><body><div class="cleaned-content">']
+        for element in content_div:
+            self._serialize(element, parts)
+        parts.append('</div></body></html>')
+        return ''.join(parts)
+
+    @staticmethod
+    def _iter_lxml(root: Any) -> Iterable[Any]:
+        """
+        Parcourt les éléments lxml dans l'ordre du document en réduisant, comme BeautifulSoup,
+        les textes uniquement composés d'espaces à un espace ou un saut de ligne (hors pre/textarea).
+        """
+        preserved = {
+            element
+            for tag in root.iter(*HTMLTreeBuilder.DEFAULT_PRESERVE_WHITESPACE_TAGS)
+            for element in tag.iter()
+        }
+        
+        def collapse(text: Optional[str]) -> Optional[str]:
+            if text and not text.strip(BeautifulSoup.ASCII_SPACES):
+                return '\n' if '\n' in text else ' '
+            return text
+        
+        for element in root.iter():
+            parent = element.getparent()
+            if element.tail and (parent is None or parent not in preserved):
+                element.tail = collapse(element.tail)
+            if isinstance(element.tag, str):
+                if element.text and element not in preserved:
+                    element.text = collapse(element.text)
+                yield element
+
     def _create_soup(self, html: str) -> Optional[BeautifulSoup]:
         """Crée un objet BeautifulSoup."""
         try:
@@ -119,61 +338,263 @@ class HTMLCleaner:
             logger.error(f"❌ Erreur lors du parsing HTML: {str(e)}")
             return None
 
-    def _remove_unwanted_elements(self, soup: BeautifulSoup) -> None:
-        """Supprime les scripts, styles et autres éléments non désirés."""
-        # Supprime les scripts
-        scripts = soup.find_all('script')
-        for script in scripts:
-            script.decompose()
-        self._stats['scripts_removed'] = len(scripts)
-        
-        # Supprime les styles
-        styles = soup.find_all('style')
-        for style in styles:
-            style.decompose()
-        self._stats['styles_removed'] = len(styles)
-
-    def _extract_relevant_sections(self, soup: BeautifulSoup) -> BeautifulSoup:
-        """Extrait uniquement les sections pertinentes du HTML."""
-        # Crée une nouvelle soupe pour le contenu nettoyé
-        clean_soup = BeautifulSoup('<div class="cleaned-content"></div>', 'lxml')
-        content_div = clean_soup.find('div', class_='cleaned-content')
+    def _classify(
+        self,
+        elements: Iterable[Any],
+        name_of: Callable[[Any], str],
+        classes_of: Callable[[Any], Optional[List[str]]]
+    ) -> Tuple[Dict[str, List[Any]], List[List[Any]]]:
+        """
+        Répartit en un seul parcours les éléments entre les éléments à supprimer
+        et les phases d'extraction (div entreprise, classes importantes, titres et paragraphes).
         
-        # 1. Conserver la div principale avec flex items-center (pour company info)
-        company_div = soup.find('div', class_='flex items-center')
-        if company_div:
-            content_div.append(company_div)
-        
-        # 2. Conserver les sections importantes
-        important_classes = [
-            'text-2xl font-bold',  # Titre
-            'html-renderer prose-content',  # Description
-            'tag',  # Tags et labels
-            'line-clamp-2',  # Informations clés
-        ]
+        Args:
+            elements: Tous les éléments du document, dans l'ordre du document
+            name_of: Retourne le nom de balise d'un élément
+            classes_of: Retourne la liste des classes d'un élément (None sans attribut class)
+            
+        Returns:
+            Tuple[Dict[str, List[Any]], List[List[Any]]]: Scripts et styles, puis les candidats de chaque phase
+        """
+        unwanted = {'script': [], 'style': []}
+        phases = [[] for _ in range(1 + len(self.IMPORTANT_CLASSES) + len(self.CONTENT_TAGS))]
+        tag_phases = {tag: 1 + len(self.IMPORTANT_CLASSES) + index for index, tag in enumerate(self.CONTENT_TAGS)}
         
-        for class_name in important_classes:
-            elements = soup.find_all(class_=class_name)
-            for element in elements:
-                if element:
-                    content_div.append(element)
+        for element in elements:
+            name = name_of(element)
+            if name in unwanted:
+                unwanted[name].append(element)
+                continue
+            
+            classes = classes_of(element)
+            if classes is not None:
+                # Même règle que class_= de BeautifulSoup : une des classes ou l'attribut entier
+                joined = ' '.join(classes)
+                if name == 'div' and not phases[0] and (self.COMPANY_CLASS in classes or joined == self.COMPANY_CLASS):
+                    phases[0].append(element)
+                for index, class_name in enumerate(self.IMPORTANT_CLASSES, 1):
+                    if class_name in classes or joined == class_name:
+                        phases[index].append(element)
+            
+            if name in tag_phases:
+                phases[tag_phases[name]].append(element)
+        
+        return unwanted, phases
+
+    def _remove_unwanted_elements(self, unwanted: Dict[str, List[Any]], remove: Callable[[Any], None]) -> None:
+        """Supprime les scripts et les styles."""
+        for element in unwanted['script'] + unwanted['style']:
+            remove(element)
+        self._stats['scripts_removed'] = len(unwanted['script'])
+        self._stats['styles_removed'] = len(unwanted['style'])
+
+    def _extract_relevant_sections(
+        self,
+        phases: List[List[Any]],
+        is_attached: Callable[[Any], bool],
+        text_of: Callable[[Any], str],
+        move: Callable[[Any], None]
+    ) -> List[Tuple[int, Any]]:
+        """
+        Déplace les sections pertinentes dans le contenu nettoyé, phase par phase :
+        1. la div principale avec flex items-center (pour company info)
+        2. les sections importantes, classe par classe
+        3. les titres et paragraphes avec du contenu, balise par balise
         
-        # 3. Conserver les titres et paragraphes avec du contenu
-        for tag in ['h1', 'h2', 'h3', 'p']:
-            elements = soup.find_all(tag)
+        Un élément dont un ancêtre a déjà été retenu, dans cette phase ou une précédente
+        (paragraphes de la description, tags imbriqués...), reste dans le sous-arbre de
+        cet ancêtre : il n'est ni émis une seconde fois ni sorti de son contexte.
+        
+        Returns:
+            List[Tuple[int, Any]]: Les éléments déplacés et leur phase, dans l'ordre de déplacement
+        """
+        text_phases_start = 1 + len(self.IMPORTANT_CLASSES)
+        sections = []
+        skipped = 0
+        saved_bytes = 0
+        for index, elements in enumerate(phases):
             for element in elements:
-                if element.get_text(strip=True):  # Ne garde que les éléments avec du texte
-                    content_div.append(element)
+                if not is_attached(element):
+                    # Déjà présent dans le contenu avec un ancêtre retenu
+                    text = text_of(element)
+                    if text.strip():
+                        skipped += 1
+                        saved_bytes += len(text.encode('utf-8'))
+                    continue
+                if index < text_phases_start or text_of(element).strip():
+                    move(element)
+                    sections.append((index, element))
         
-        # 4. Nettoyer les attributs
-        for tag in content_div.find_all(True):
-            allowed_attrs = ['class'] if tag.name in self.allowed_tags else []
-            attrs = dict(tag.attrs)
-            for attr in attrs:
-                if attr not in allowed_attrs:
-                    del tag[attr]
+        self._stats['duplicates_skipped'] = skipped
+        self._stats['duplicate_bytes_saved'] = saved_bytes
+        if skipped:
+            logger.debug(f"♻️ {skipped} éléments déjà inclus par un ancêtre ignorés ({saved_bytes:,} octets de texte)")
+        return sections
+
+    def _drop_boilerplate(
+        self,
+        sections: List[Tuple[int, Any]],
+        text_of: Callable[[Any], str],
+        remove: Callable[[Any], None]
+    ) -> List[Tuple[int, Any]]:
+        """
+        Calcule l'empreinte des blocs de contenu et retire ceux que le modèle reconnaît comme du gabarit.
+        
+        Args:
+            sections: Les éléments extraits et leur phase
+            text_of: Retourne le texte d'un élément
+            remove: Retire un élément du contenu nettoyé
+            
+        Returns:
+            List[Tuple[int, Any]]: Les éléments conservés et leur phase
+        """
+        self._stats['boilerplate_removed'] = 0
+        if self.boilerplate is None:
+            return sections
+        
+        text_phases_start = 1 + len(self.IMPORTANT_CLASSES)
+        kept = []
+        for phase, element in sections:
+            if self.PHASE_SECTIONS[phase] in self.BOILERPLATE_SECTIONS:
+                block = block_fingerprint(self.CONTENT_TAGS[phase - text_phases_start], text_of(element))
+                self.blocks.append(block)
+                if self.boilerplate.is_boilerplate(block):
+                    remove(element)
+                    self._stats['boilerplate_removed'] += 1
+                    continue
+            kept.append((phase, element))
+        return kept
+
+    def _render_text(self, sections: List[Tuple[int, Any]], walk: Callable[[Any], Iterable[Tuple[str, str]]]) -> str:
+        """
+        Produit la sortie markdown / text des sections extraites, dans le budget de tokens.
+        
+        Args:
+            sections: Les éléments extraits et leur phase
+            walk: Parcourt un élément en événements ('start' / 'end', balise) et ('text', texte)
+            
+        Returns:
+            str: Le texte des sections, séparées par une ligne vide
+        """
+        lines = {name: [] for name in self.TEXT_SECTIONS}
+        tags = []
+        for phase, element in sections:
+            name = self.PHASE_SECTIONS[phase]
+            if name == 'tags':
+                # Les tags tiennent sur une seule ligne
+                tag = ' '.join(''.join(value for event, value in walk(element) if event == 'text').split())
+                if tag and tag not in tags:
+                    tags.append(tag)
+            elif name == 'key_info':
+                lines[name].extend(f"{self.KEY_INFO_LABEL}{line}" for line in self._render_lines(walk(element)))
+            else:
+                lines[name].extend(self._render_lines(walk(element)))
+        if tags:
+            lines['tags'] = [f"{self.TAGS_LABEL}{', '.join(tags)}"]
+        
+        # Les sections sont retenues par priorité jusqu'à épuisement du budget
+        budget = self.token_budget
+        blocks = []
+        truncated = False
+        for name in self.TEXT_SECTIONS:
+            kept = []
+            for line in lines[name]:
+                tokens = estimate_tokens(line) + 1  # + le saut de ligne
+                if tokens > budget:
+                    truncated = True
+                    # Début de la ligne, coupé entre deux mots
+                    cut = line[:int((budget - 1) * TOKEN_CHARS_RATIO)].rsplit(' ', 1)[0]
+                    if budget > 1 and cut:
+                        kept.append(f"{cut} …")
+                    budget = 0
+                    break
+                kept.append(line)
+                budget -= tokens
+            if kept:
+                blocks.append('\n'.join(kept))
+        
+        text = '\n\n'.join(blocks)
+        self._stats['tokens'] = estimate_tokens(text)
+        self._stats['truncated'] = truncated
+        if truncated:
+            logger.debug(f"✂️ Contenu tronqué au budget de {self.token_budget} tokens")
+        return text
+
+    def _render_lines(self, events: Iterable[Tuple[str, str]]) -> List[str]:
+        """Convertit les événements d'un élément en lignes de texte (titres markdown et listes)."""
+        lines = []
+        pieces = []
+        prefix = ''
+        for event, value in events:
+            if event == 'text':
+                pieces.append(value)
+                continue
+            if value not in BLOCK_TAGS:
+                continue
+            
+            # Une balise de bloc termine la ligne en cours
+            line = ' '.join(''.join(pieces).split())
+            if line:
+                lines.append(prefix + line)
+            pieces = []
+            prefix = ''
+            if event == 'start':
+                if value in ('h1', 'h2', 'h3', 'h4', 'h5', 'h6') and self.output == 'markdown':
+                    prefix = '#' * int(value[1]) + ' '
+                elif value == 'li':
+                    prefix = '- '
+        
+        line = ' '.join(''.join(pieces).split())
+        if line:
+            lines.append(prefix + line)
+        return lines
+
+    @classmethod
+    def _walk_bs4(cls, tag: Tag) -> Iterable[Tuple[str, str]]:
+        """Parcourt un élément BeautifulSoup en événements de début, de texte et de fin."""
+        yield 'start', tag.name
+        for child in tag.children:
+            if isinstance(child, Tag):
+                yield from cls._walk_bs4(child)
+            elif not isinstance(child, PreformattedString):  # Commentaires, CDATA...
+                yield 'text', str(child)
+        yield 'end', tag.name
+
+    @classmethod
+    def _walk_lxml(cls, element: Any) -> Iterable[Tuple[str, str]]:
+        """Parcourt un élément lxml en événements de début, de texte et de fin."""
+        yield 'start', element.tag
+        if element.text:
+            yield 'text', element.text
+        for child in element:
+            if isinstance(child.tag, str):
+                yield from cls._walk_lxml(child)
+            if child.tail:
+                yield 'text', child.tail
+        yield 'end', element.tag
+
+    def _serialize(self, element: Any, parts: List[str]) -> None:
+        """Sérialise un élément lxml nettoyé au format de sortie de BeautifulSoup."""
+        tag = element.tag
+        if isinstance(tag, str):
+            parts.append(f'<{tag}')
+            if tag in self.allowed_tags and 'class' in element.attrib:
+                value = ' '.join(element.get('class').split())
+                parts.append(f' class={EntitySubstitution.substitute_xml(value, make_quoted_attribute=True)}')
+            if tag in HTMLTreeBuilder.empty_element_tags and not element.text and len(element) == 0:
+                parts.append('/>')
+            else:
+                parts.append('>')
+                if element.text:
+                    parts.append(EntitySubstitution.substitute_xml(element.text))
+                for child in element:
+                    self._serialize(child, parts)
+                parts.append(f'</{tag}>')
+        elif tag is etree.Comment:
+            parts.append(f'<!--{element.text or ""}-->')
         
-        return clean_soup
+        if element.tail:
+            parts.append(EntitySubstitution.substitute_xml(element.tail))
 
     def _get_section(self, soup: BeautifulSoup, class_name: str) -> Optional[Any]:
         """Extrait une section spécifique du HTML."""
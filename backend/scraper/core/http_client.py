@@ -0,0 +1,267 @@
+"""
+Module de gestion du client HTTP partagé par les scrapers.
+"""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+import aiohttp
+from loguru import logger
+
+from .rate_limiter import AdaptiveConcurrency, HostRateLimiter
+from ..config.settings import (
+    MAX_RETRIES,
+    RETRY_DELAY,
+    RETRY_MAX_DELAY,
+    RETRY_STATUSES,
+    HTTP_TIMEOUT,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_POOL_LIMIT,
+    HTTP_POOL_LIMIT_PER_HOST,
+    HTTP_DNS_CACHE_TTL,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_HEADERS
+)
+
+@dataclass
+class FetchResult:
+    """Résultat d'une requête HTTP conditionnelle."""
+    status: int = 0  # 0 si la requête a échoué avant la réponse
+    text: Optional[str] = None
+    validators: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def not_modified(self) -> bool:
+        """True si le serveur a confirmé que la page n'a pas changé (304)."""
+        return self.status == 304
+
+class HTTPClient:
+    """
+    Client HTTP longue durée basé sur une session aiohttp unique.
+    Réutilise les connexions (keep-alive), met en cache la résolution DNS,
+    limite le nombre de connexions simultanées par hôte et respecte
+    le débit configuré pour chaque hôte.
+
+    Le nombre de requêtes en vol par hôte s'adapte aux réponses du serveur
+    (AIMD) et les 429/5xx/timeouts sont relancés avec un backoff exponentiel.
+    """
+
+    def __init__(self, rate_limiter: Optional[HostRateLimiter] = None):
+        """
+        Initialise le client sans ouvrir de session (créée à la première requête).
+
+        Args:
+            rate_limiter: Limiteur de débit par hôte (configuré depuis SCRAPING_SOURCES sinon)
+        """
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self._concurrency: Dict[str, AdaptiveConcurrency] = {}
+        self.timeout = aiohttp.ClientTimeout(
+            total=HTTP_TIMEOUT,
+            connect=HTTP_CONNECT_TIMEOUT
+        )
+
+    async def __aenter__(self) -> "HTTPClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Retourne la session partagée, en la créant si nécessaire.
+
+        La session doit être créée dans la boucle asyncio qui l'utilise,
+        d'où la création paresseuse plutôt que dans __init__.
+
+        Returns:
+            aiohttp.ClientSession: La session HTTP partagée
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=HTTP_POOL_LIMIT,
+                limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+                ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+                keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+                enable_cleanup_closed=True
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self.timeout,
+                headers=HTTP_HEADERS,
+                auto_decompress=True
+            )
+            logger.debug(
+                f"🔌 Session HTTP ouverte (pool: {HTTP_POOL_LIMIT}, "
+                f"par hôte: {HTTP_POOL_LIMIT_PER_HOST})"
+            )
+        return self._session
+
+    async def fetch(self, url: str) -> Optional[str]:
+        """
+        Récupère le contenu HTML d'une page via la session partagée.
+
+        Args:
+            url: L'URL de la page à récupérer
+
+        Returns:
+            Optional[str]: Le contenu HTML ou None en cas d'erreur
+        """
+        return (await self.fetch_conditional(url)).text
+
+    async def fetch_conditional(self, url: str, validators: Optional[Dict[str, str]] = None) -> FetchResult:
+        """
+        Récupère une page en revalidant la version déjà connue.
+
+        Les validateurs d'une réponse précédente (ETag, Last-Modified) sont
+        renvoyés en If-None-Match / If-Modified-Since : si la page n'a pas
+        changé, le serveur répond 304 sans corps.
+
+        Args:
+            url: L'URL de la page à récupérer
+            validators: Validateurs connus (etag, last_modified)
+
+        Returns:
+            FetchResult: Le statut, le contenu (si 200) et les nouveaux validateurs
+        """
+        headers = {}
+        if validators:
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
+
+        concurrency = self._get_concurrency(urlparse(url).hostname or '')
+        for attempt in range(MAX_RETRIES + 1):
+            result, retryable, retry_after = await self._send(url, headers, validators, concurrency)
+            if not retryable:
+                return result
+            if attempt == MAX_RETRIES:
+                break
+
+            delay = self._get_retry_delay(attempt, retry_after)
+            logger.warning(
+                f"🔁 Nouvelle tentative ({attempt + 2}/{MAX_RETRIES + 1}) dans {delay:.1f}s "
+                f"pour {url} (statut: {result.status or 'erreur réseau'})"
+            )
+            if result.status == 429:
+                # Toutes les requêtes vers l'hôte attendent, pas seulement celle-ci :
+                # la nouvelle tentative attend la fin de la pause dans le limiteur
+                self.rate_limiter.pause(url, delay)
+            else:
+                await asyncio.sleep(delay)
+
+        logger.error(f"❌ Abandon après {MAX_RETRIES + 1} tentatives: {url}")
+        return result
+
+    def _get_concurrency(self, host: str) -> AdaptiveConcurrency:
+        """Retourne le contrôleur de concurrence d'un hôte, créé si nécessaire."""
+        if host not in self._concurrency:
+            self._concurrency[host] = AdaptiveConcurrency()
+        return self._concurrency[host]
+
+    async def _send(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        validators: Optional[Dict[str, str]],
+        concurrency: AdaptiveConcurrency
+    ) -> Tuple[FetchResult, bool, Optional[float]]:
+        """
+        Envoie une requête unique et informe le contrôleur de concurrence du résultat.
+
+        Returns:
+            Tuple[FetchResult, bool, Optional[float]]: Le résultat, s'il faut
+            réessayer et le délai demandé par le serveur (Retry-After)
+        """
+        await concurrency.acquire()
+        latency = None
+        overloaded = False
+        try:
+            session = self._get_session()
+            await self.rate_limiter.acquire(url)
+            started = time.monotonic()
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304:
+                    logger.debug(f"♻️ Page inchangée (304): {url}")
+                    result = FetchResult(status=304, validators=dict(validators or {}))
+                elif response.status == 200:
+                    text = await response.text()
+                    result = FetchResult(status=200, text=text, validators=self._get_validators(response, text))
+                else:
+                    overloaded = response.status in RETRY_STATUSES
+                    logger.warning(f"⚠️ Statut HTTP inattendu ({response.status}) pour {url}")
+                    return (
+                        FetchResult(status=response.status),
+                        overloaded,
+                        self._parse_retry_after(response.headers.get('Retry-After'))
+                    )
+            latency = time.monotonic() - started
+            return result, False, None
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            overloaded = True
+            logger.warning(f"⚠️ Erreur réseau pour {url}: {str(e) or type(e).__name__}")
+            return FetchResult(), True, None
+        except Exception as e:
+            logger.error(f"❌ Erreur lors de la récupération de {url}: {str(e)}")
+            return FetchResult(), False, None
+        finally:
+            await concurrency.release(latency, overloaded)
+
+    def _get_retry_delay(self, attempt: int, retry_after: Optional[float]) -> float:
+        """
+        Calcule le délai avant une nouvelle tentative.
+
+        Backoff exponentiel avec gigue (entre la moitié et la totalité du délai)
+        pour éviter que les requêtes en échec ne repartent toutes ensemble.
+        Un Retry-After du serveur sert de minimum.
+
+        Args:
+            attempt: Numéro de la tentative échouée (0 pour la première)
+            retry_after: Délai demandé par le serveur, s'il y en a un
+
+        Returns:
+            float: Le délai en secondes, plafonné à RETRY_MAX_DELAY
+        """
+        backoff = min(RETRY_MAX_DELAY, RETRY_DELAY * 2 ** attempt)
+        delay = random.uniform(backoff / 2, backoff)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return min(RETRY_MAX_DELAY, delay)
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Convertit un en-tête Retry-After (secondes ou date HTTP) en secondes."""
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=timezone.utc)
+        return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+    def _get_validators(self, response: aiohttp.ClientResponse, text: str) -> Dict[str, str]:
+        """Extrait les validateurs de cache d'une réponse 200."""
+        validators = {'content_length': response.headers.get('Content-Length') or str(len(text))}
+        if response.headers.get('ETag'):
+            validators['etag'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            validators['last_modified'] = response.headers['Last-Modified']
+        return validators
+
+    async def close(self) -> None:
+        """Ferme la session HTTP et libère les connexions du pool."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            logger.debug("👋 Session HTTP fermée")
+        self._session = None
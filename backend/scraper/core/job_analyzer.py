@@ -3,15 +3,18 @@ Module d'analyse des offres avec Mistral AI.
 """
 
 import json
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 from loguru import logger
 from mistralai import Mistral
 from datetime import datetime
 
+from .field_extractor import FieldExtractor
 from ..config.settings import (
     MISTRAL_API_KEY,
     MISTRAL_MODEL,
     HTTP_TIMEOUT,
+    HTML_CLEANER_OUTPUT,
+    FIELD_EXTRACTOR_MIN_CONFIDENCE,
     REQUIRED_FIELDS
 )
 
@@ -24,11 +27,15 @@ class JobAnalyzer:
         self.client = Mistral(api_key=MISTRAL_API_KEY)
         self.model = MISTRAL_MODEL
         self.timeout = HTTP_TIMEOUT
+        self.extractor = FieldExtractor()
 
     async def analyze(self, html_content: str, url: str = "") -> Dict[str, Any]:
         """
         Analyse une offre d'emploi avec Mistral AI.
         
+        Les champs résolus par les règles (FieldExtractor) ne sont pas demandés à Mistral,
+        qui n'est pas appelé si tous le sont.
+        
         Args:
             html_content: Le contenu HTML nettoyé de l'offre
             url: L'URL de l'offre
@@ -44,23 +51,34 @@ class JobAnalyzer:
             
             logger.debug(f"📝 Longueur du contenu HTML à analyser : {len(html_content)} caractères")
             
-            # Construction du prompt
-            logger.info("1️⃣ Construction du prompt...")
-            prompt = self._construct_prompt(html_content, url)
-            logger.debug(f"🔍 Prompt généré de {len(prompt)} caractères")
-            
-            # Appel à l'API
-            logger.info("2️⃣ Appel à l'API Mistral...")
-            response = await self._make_api_call(prompt)
-            
-            # Validation de la réponse
-            logger.info("3️⃣ Validation de la réponse...")
-            if not self._validate_response(response):
-                logger.warning("⚠️ Réponse invalide de Mistral - Champs manquants")
-                logger.debug(f"Champs manquants : {[field for field in REQUIRED_FIELDS if field not in response]}")
-                return self._get_empty_response()
-            
-            logger.info("✅ Réponse valide reçue de Mistral")
+            # Extraction des champs par règles
+            extraction = self.extractor.extract(html_content, url)
+            resolved = extraction.resolved(FIELD_EXTRACTOR_MIN_CONFIDENCE)
+            missing_fields = [field for field in REQUIRED_FIELDS if field not in resolved]
+            logger.info(f"🧩 {len(resolved)}/{len(REQUIRED_FIELDS)} champs résolus par les règles")
+            logger.debug(f"🧩 Confiance des champs extraits : {extraction.confidence}")
+            
+            if missing_fields:
+                # Construction du prompt
+                logger.info("1️⃣ Construction du prompt...")
+                prompt = self._construct_prompt(html_content, url, missing_fields)
+                logger.debug(f"🔍 Prompt généré de {len(prompt)} caractères")
+                
+                # Appel à l'API
+                logger.info("2️⃣ Appel à l'API Mistral...")
+                response = await self._make_api_call(prompt)
+                
+                # Validation de la réponse
+                logger.info("3️⃣ Validation de la réponse...")
+                if not self._validate_response(response, missing_fields):
+                    logger.warning("⚠️ Réponse invalide de Mistral - Champs manquants")
+                    return self._get_empty_response()
+                
+                logger.info("✅ Réponse valide reçue de Mistral")
+                response = {**{field: response[field] for field in missing_fields}, **resolved}
+            else:
+                logger.info("⏭️ Tous les champs sont résolus par les règles, appel à Mistral évité")
+                response = resolved
             
             # Transformation des clés en majuscules
             logger.info("4️⃣ Transformation des données...")
@@ -74,7 +92,7 @@ class JobAnalyzer:
             if uppercase_response.get('CONTRACT_TYPE') == 'CDI':
                 uppercase_response['DURATION_DAYS'] = None
                 logger.debug("ℹ️ DURATION_DAYS mis à None car CDI")
-            elif uppercase_response.get('DURATION_DAYS') == "None":
+            elif uppercase_response.get('DURATION_DAYS') in ("None", None):
                 uppercase_response['DURATION_DAYS'] = None
                 logger.debug("ℹ️ DURATION_DAYS conservé à None")
             else:
@@ -119,14 +137,15 @@ class JobAnalyzer:
             logger.exception("Détails de l'erreur :")
             return self._get_empty_response()
 
-    def _construct_prompt(self, html_content: str, url: str = "") -> str:
-        """Construit le prompt pour Mistral."""
+    def _construct_prompt(self, html_content: str, url: str = "", fields: Optional[List[str]] = None) -> str:
+        """Construit le prompt pour Mistral, limité aux champs demandés (tous par défaut)."""
         logger.debug("🔨 Construction du prompt")
         
-        # Formatage des champs requis avec l'URL
+        # Formatage des champs demandés avec l'URL
         fields_with_url = {
             k: v.format(url=url) if isinstance(v, str) and "{url}" in v else v
             for k, v in REQUIRED_FIELDS.items()
+            if fields is None or k in fields
         }
         
         # Construction du prompt partie par partie
@@ -137,8 +156,9 @@ class JobAnalyzer:
         # Ajout du format attendu
         prompt_parts.append(f"Format attendu:\n{json.dumps(fields_with_url, indent=2, ensure_ascii=False)}\n")
         
-        # Ajout du contenu HTML
-        prompt_parts.append(f"Contenu HTML:\n{html_content}\n")
+        # Ajout du contenu nettoyé (HTML, ou texte en sortie markdown / text)
+        content_label = "Contenu HTML" if HTML_CLEANER_OUTPUT == 'html' else "Contenu de l'offre"
+        prompt_parts.append(f"{content_label}:\n{html_content}\n")
         
         # Ajout de l'instruction finale
         prompt_parts.append("Reponds uniquement avec un objet JSON valide.")
@@ -150,7 +170,7 @@ class JobAnalyzer:
         return prompt
 
     async def _make_api_call(self, prompt: str) -> Dict[str, Any]:
-        """Fait l'appel à l'API Mistral."""
+        """Fait l'appel à l'API Mistral (réponse vide en cas d'échec, rejetée par la validation)."""
         try:
             logger.info("📤 Envoi de la requête à Mistral AI")
             logger.debug(f"🔧 Configuration : model={self.model}, temperature=0.3, max_tokens=1000")
@@ -200,19 +220,19 @@ class JobAnalyzer:
             logger.error(f"❌ Erreur de parsing JSON : {str(e)}")
             logger.error(f"📄 Contenu problématique : {content}")
             logger.exception("Détails de l'erreur :")
-            return self._get_empty_response()
+            return {}
         except Exception as e:
             logger.error(f"❌ Erreur lors de l'appel API : {str(e)}")
             logger.exception("Détails de l'erreur :")
-            return self._get_empty_response()
+            return {}
 
-    def _validate_response(self, response: Dict[str, Any]) -> bool:
-        """Vérifie que la réponse contient tous les champs requis."""
-        missing_fields = [field for field in REQUIRED_FIELDS if field not in response]
+    def _validate_response(self, response: Dict[str, Any], fields: Optional[List[str]] = None) -> bool:
+        """Vérifie que la réponse contient tous les champs demandés (tous les champs requis par défaut)."""
+        missing_fields = [field for field in (fields or REQUIRED_FIELDS) if field not in response]
         if missing_fields:
             logger.warning(f"⚠️ Champs manquants dans la réponse : {missing_fields}")
             return False
-        logger.debug("✅ Tous les champs requis sont présents")
+        logger.debug("✅ Tous les champs demandés sont présents")
         return True
 
     def _get_empty_response(self) -> Dict[str, Any]:
@@ -2,23 +2,28 @@
 Module principal de scraping des offres.
 """
 
-import aiohttp
 from typing import Dict, Any, Optional
 from bs4 import BeautifulSoup
 from loguru import logger
 
 from .html_cleaner import HTMLCleaner
 from .job_analyzer import JobAnalyzer
-from ..config.settings import HTTP_TIMEOUT
+from .http_client import HTTPClient
 
 class JobScraper:
     """Scraper principal pour les offres d'emploi."""
 
-    def __init__(self):
-        """Initialise le scraper avec ses composants."""
+    def __init__(self, http_client: Optional[HTTPClient] = None):
+        """
+        Initialise le scraper avec ses composants.
+        
+        Args:
+            http_client: Client HTTP partagé (un client dédié est créé sinon)
+        """
         self.cleaner = HTMLCleaner()
         self.analyzer = JobAnalyzer()
-        self.timeout = HTTP_TIMEOUT
+        self._owns_client = http_client is None
+        self.http_client = http_client or HTTPClient()
 
     async def scrape_job_offer(self, url: str) -> Dict[str, Any]:
         """
@@ -40,7 +45,7 @@ class JobScraper:
             cleaned_html = self.cleaner.clean(html)
             
             # 3. Analyse avec DeepSeek
-            result = await self.analyzer.analyze(cleaned_html)
+            result = await self.analyzer.analyze(cleaned_html, url)
             
             # 4. Ajoute les métadonnées
             result['url'] = url
@@ -54,17 +59,12 @@ class JobScraper:
 
     async def _fetch_page(self, url: str) -> Optional[str]:
         """Récupère le contenu HTML d'une page."""
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=self.timeout) as response:
-                    if response.status == 200:
-                        return await response.text()
-                    else:
-                        logger.warning(f"⚠️ Statut HTTP inattendu: {response.status}")
-                        return None
-        except Exception as e:
-            logger.error(f"❌ Erreur lors de la récupération de {url}: {str(e)}")
-            return None
+        return await self.http_client.fetch(url)
+
+    async def close(self) -> None:
+        """Ferme le client HTTP s'il a été créé par ce scraper."""
+        if self._owns_client:
+            await self.http_client.close()
 
     def _get_empty_result(self) -> Dict[str, Any]:
         """Retourne un résultat vide en cas d'erreur."""
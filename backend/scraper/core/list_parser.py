@@ -0,0 +1,104 @@
+"""
+Module d'analyse des pages de liste d'offres.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import lxml.html
+import soupsieve
+from bs4 import BeautifulSoup
+from lxml import etree
+from loguru import logger
+
+from .url_utils import unique_urls
+from ..config.settings import LIST_PARSER_ENGINE
+
+@dataclass
+class ListPage:
+    """Résultat de l'analyse d'une page de liste."""
+    links: List[str] = field(default_factory=list)  # URLs canoniques uniques
+    has_next: bool = False  # Présence d'un bouton "Suivant" actif
+    card_count: int = 0  # Nombre de liens d'offres trouvés (avant dédoublonnage)
+
+class ListPageParser:
+    """
+    Analyse une page de liste en un seul passage : l'arbre est construit
+    une seule fois et les sélecteurs sont compilés à l'initialisation.
+
+    Deux moteurs sont disponibles, choisis par source via la clé `parser` :
+    - `bs4` : BeautifulSoup + sélecteurs CSS soupsieve (`job_link`, `next_button`)
+    - `lxml` : lxml.html + XPath (`job_link_xpath`, `next_button_xpath`), plus rapide
+    """
+
+    ENGINES = ('bs4', 'lxml')
+
+    def __init__(self, source: Dict):
+        """
+        Initialise le parseur pour une source.
+
+        Args:
+            source: Configuration de la source (sélecteurs et moteur)
+        """
+        self.source_name = source['name']
+        self.engine = source.get('parser', LIST_PARSER_ENGINE)
+        if self.engine not in self.ENGINES:
+            raise ValueError(f"Moteur d'analyse inconnu pour {self.source_name}: {self.engine}")
+
+        selectors = source['selectors']
+        if self.engine == 'lxml':
+            self._job_link = etree.XPath(selectors['job_link_xpath'])
+            self._next_button = etree.XPath(selectors['next_button_xpath'])
+        else:
+            self._job_link = soupsieve.compile(selectors['job_link'])
+            self._next_button = soupsieve.compile(selectors['next_button'])
+
+    def parse(self, html: str) -> ListPage:
+        """
+        Extrait les liens d'offres et l'état de pagination d'une page.
+
+        Args:
+            html: Le contenu HTML de la page
+
+        Returns:
+            ListPage: Les liens, la présence d'une page suivante et le nombre de cartes
+        """
+        if not html or not html.strip():
+            return ListPage()
+        logger.debug(f"🔍 HTML reçu ({len(html)} caractères, moteur {self.engine})")
+
+        if self.engine == 'lxml':
+            hrefs, next_button_attrs = self._parse_lxml(html)
+        else:
+            hrefs, next_button_attrs = self._parse_bs4(html)
+
+        # Un attribut booléen HTML est actif dès qu'il est présent, même vide
+        has_next = next_button_attrs is not None and not (
+            'disabled' in next_button_attrs
+            or next_button_attrs.get('aria-disabled') == 'true'
+        )
+        page = ListPage(links=unique_urls(hrefs), has_next=has_next, card_count=len(hrefs))
+        logger.info(f"📑 {len(page.links)} offres trouvées sur la page ({page.card_count} liens)")
+        return page
+
+    def _parse_bs4(self, html: str) -> Tuple[List[str], Optional[Dict[str, str]]]:
+        """Analyse la page avec BeautifulSoup et les sélecteurs CSS précompilés."""
+        soup = BeautifulSoup(html, 'lxml')
+        hrefs = [link['href'] for link in self._job_link.select(soup) if link.get('href')]
+        next_button = self._next_button.select_one(soup)
+        return hrefs, (next_button.attrs if next_button is not None else None)
+
+    def _parse_lxml(self, html: str) -> Tuple[List[str], Optional[Dict[str, str]]]:
+        """Analyse la page avec lxml et les expressions XPath précompilées."""
+        try:
+            try:
+                tree = lxml.html.fromstring(html)
+            except ValueError:
+                # Document avec déclaration d'encodage XML : lxml exige des octets
+                tree = lxml.html.fromstring(html.encode('utf-8'))
+        except etree.ParserError:
+            # Document sans élément (ex: uniquement des commentaires)
+            return [], None
+        hrefs = [link.get('href') for link in self._job_link(tree) if link.get('href')]
+        next_buttons = self._next_button(tree)
+        return hrefs, (dict(next_buttons[0].attrib) if next_buttons else None)
@@ -3,15 +3,19 @@ Module de scraping de la liste des offres d'emploi.
 """
 
 import asyncio
-import aiohttp
-from typing import List, Optional, Dict
-from bs4 import BeautifulSoup
+from typing import List, Optional, Dict, Set
 from loguru import logger
 
+from .cache import JobCache
+from .http_client import HTTPClient
+from .list_parser import ListPageParser
+from .seen_index import SeenIndex
+from .url_utils import dedupe_urls, unique_urls
 from ..config.settings import (
     SCRAPING_SOURCES,
-    REQUEST_DELAY,
-    HTTP_TIMEOUT
+    LIST_PREFETCH,
+    INCREMENTAL_DISCOVERY,
+    INCREMENTAL_STOP_AFTER_SEEN_PAGES
 )
 
 class JobListScraper:
@@ -20,10 +24,26 @@ class JobListScraper:
     Parcourt les pages et extrait les URLs des offres de plusieurs sources.
     """
 
-    def __init__(self):
-        """Initialise le scraper de liste."""
+    def __init__(
+        self,
+        http_client: Optional[HTTPClient] = None,
+        cache: Optional[JobCache] = None,
+        seen_index: Optional[SeenIndex] = None
+    ):
+        """
+        Initialise le scraper de liste.
+        
+        Args:
+            http_client: Client HTTP partagé (un client dédié est créé sinon)
+            cache: Cache des offres traitées, active la découverte incrémentale
+            seen_index: Index des offres déjà chargées, consulté avant le cache
+        """
         self.sources = [s for s in SCRAPING_SOURCES if s['enabled']]
-        self.timeout = HTTP_TIMEOUT
+        self.parsers = {s['name']: ListPageParser(s) for s in self.sources}
+        self.cache = cache if INCREMENTAL_DISCOVERY else None
+        self.seen_index = seen_index
+        self._owns_client = http_client is None
+        self.http_client = http_client or HTTPClient()
 
     async def _fetch_page(self, url: str) -> Optional[str]:
         """
@@ -35,125 +55,149 @@ class JobListScraper:
         Returns:
             Optional[str]: Le contenu HTML ou None en cas d'erreur
         """
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=self.timeout) as response:
-                    if response.status == 200:
-                        return await response.text()
-                    else:
-                        logger.warning(f"⚠️ Statut HTTP inattendu: {response.status}")
-                        return None
-        except Exception as e:
-            logger.error(f"❌ Erreur lors de la récupération de la page: {str(e)}")
-            return None
+        return await self.http_client.fetch(url)
 
-    def _extract_job_urls(self, html: str, source: Dict) -> List[str]:
+    async def close(self) -> None:
+        """Ferme le client HTTP s'il a été créé par ce scraper."""
+        if self._owns_client:
+            await self.http_client.close()
+
+    def _get_page_url(self, source: Dict, page: int) -> str:
+        """Construit l'URL d'une page de résultats d'une source."""
+        separator = '&' if '?' in source['base_url'] else '?'
+        return f"{source['base_url']}{separator}page={page}"
+
+    async def _is_fully_seen(self, urls: List[str]) -> bool:
         """
-        Extrait les URLs des offres d'une page.
+        Vérifie en un seul lot si toutes les offres d'une page sont déjà connues.
         
         Args:
-            html: Le contenu HTML de la page
-            source: Configuration de la source
+            urls: Les URLs de la page
             
         Returns:
-            List[str]: Liste des URLs trouvées
+            bool: True si aucune offre de la page n'est nouvelle
         """
-        urls = []
-        soup = BeautifulSoup(html, 'lxml')
-        
-        # Log pour debug
-        logger.debug(f"🔍 HTML reçu ({len(html)} caractères)")
-        logger.debug(f"🎯 Recherche des liens avec le sélecteur: {source['selectors']['job_link']}")
-        
-        # Trouve tous les liens d'offres selon le sélecteur de la source
-        job_links = soup.select(source['selectors']['job_link'])
-        logger.debug(f"🔗 Nombre de liens trouvés: {len(job_links)}")
-        
-        for link in job_links:
-            href = link.get('href')
-            if href:
-                # Log pour debug
-                logger.debug(f"📎 Lien d'offre trouvé: {href}")
-                
-                # Construit l'URL complète si nécessaire
-                if not href.startswith('http'):
-                    base = "https://www.free-work.com"  # URL de base fixe
-                    href = f"{base}{href}"
-                urls.append(href)
-                
-        logger.info(f"📑 {len(urls)} offres trouvées sur la page")
-        return urls
+        if self.seen_index is not None:
+            # Les offres chargées depuis longtemps n'ont plus de marqueur dans le cache
+            urls = [url for url in urls if url not in self.seen_index]
+        processed = await self.cache.are_processed(urls)
+        new_count = processed.count(False)
+        logger.debug(f"🆕 {new_count}/{len(urls)} offres nouvelles sur la page")
+        return new_count == 0
 
     async def _scrape_source(self, source: Dict) -> List[str]:
         """
         Scrape toutes les offres d'une source.
         
+        La page N+1 est demandée dès que la page N est reçue, pendant que
+        celle-ci est analysée dans un thread. Si la page N s'avère être la
+        dernière, la requête anticipée est annulée.
+        
+        En mode incrémental (cache fourni), la pagination s'arrête après
+        `stop_after_seen_pages` pages consécutives sans aucune offre nouvelle.
+        
         Args:
             source: Configuration de la source
             
         Returns:
             List[str]: Liste des URLs trouvées
         """
-        all_urls = []
+        all_urls: List[str] = []
         page = 1
         max_pages = source.get('max_pages')
+        stop_after_seen = source.get('stop_after_seen_pages', INCREMENTAL_STOP_AFTER_SEEN_PAGES)
+        seen_streak = 0
         
         logger.info(f"🔍 Début du scraping de {source['name']}...")
         
-        while True:
-            # Vérifie si on a atteint la limite de pages
-            if max_pages and page > max_pages:
-                logger.info(f"🛑 Limite de {max_pages} pages atteinte")
-                break
-
-            logger.info(f"📄 Traitement de la page {page}")
-            
-            # 1. Récupère le HTML de la page
-            url = f"{source['base_url']}&page={page}" if '?' in source['base_url'] else f"{source['base_url']}?page={page}"
-            html = await self._fetch_page(url)
-            if not html:
-                logger.warning(f"⚠️ Impossible de récupérer la page {page}")
-                break
+        pending = asyncio.create_task(self._fetch_page(self._get_page_url(source, page)))
+        try:
+            while pending is not None:
+                logger.info(f"📄 Traitement de la page {page} ({source['name']})")
                 
-            # 2. Extrait les URLs de la page courante
-            page_urls = self._extract_job_urls(html, source)
-            all_urls.extend(page_urls)
-            
-            # 3. Vérifie s'il faut continuer
-            if not page_urls:
-                logger.debug("🚫 Page sans offres, arrêt du scraping")
-                break
+                # 1. Récupère le HTML de la page
+                html = await pending
+                pending = None
+                if not html:
+                    logger.warning(f"⚠️ Impossible de récupérer la page {page}")
+                    break
                 
-            # Vérifie la présence d'un bouton suivant actif
-            soup = BeautifulSoup(html, 'lxml')
-            next_button = soup.select_one(source['selectors']['next_button'])
-            if not next_button or next_button.get('disabled'):
-                logger.debug("🚫 Plus de pages suivantes")
-                break
-            
-            # 4. Passe à la page suivante
-            page += 1
-            logger.debug(f"⏳ Attente de {REQUEST_DELAY} secondes avant la page suivante...")
-            await asyncio.sleep(REQUEST_DELAY)
+                # 2. Anticipe la page suivante si la limite n'est pas atteinte
+                if LIST_PREFETCH and (not max_pages or page < max_pages):
+                    pending = asyncio.create_task(self._fetch_page(self._get_page_url(source, page + 1)))
+                
+                # 3. Extrait les URLs de la page courante
+                parsed = await asyncio.to_thread(self.parsers[source['name']].parse, html)
+                all_urls.extend(parsed.links)
+                
+                # 4. Vérifie s'il faut continuer
+                if not parsed.links:
+                    logger.debug("🚫 Page sans offres, arrêt du scraping")
+                    break
+                
+                if not parsed.has_next:
+                    logger.debug("🚫 Plus de pages suivantes")
+                    break
+                
+                if self.cache is not None:
+                    seen_streak = seen_streak + 1 if await self._is_fully_seen(parsed.links) else 0
+                    if seen_streak >= stop_after_seen:
+                        logger.info(f"⏹️ {seen_streak} page(s) sans nouvelle offre, arrêt incrémental")
+                        break
+                
+                if max_pages and page >= max_pages:
+                    logger.info(f"🛑 Limite de {max_pages} pages atteinte")
+                    break
+                
+                # 5. Passe à la page suivante (le débit est régulé par le client HTTP)
+                page += 1
+                if pending is None:
+                    pending = asyncio.create_task(self._fetch_page(self._get_page_url(source, page)))
+        finally:
+            if pending is not None:
+                pending.cancel()
         
+        all_urls = unique_urls(all_urls)
         logger.success(f"✅ Scraping de {source['name']} terminé : {len(all_urls)} offres trouvées")
         return all_urls
 
-    async def get_all_job_urls(self) -> List[str]:
+    async def get_job_url_sources(self) -> Dict[str, Set[str]]:
         """
-        Récupère les URLs de toutes les offres de toutes les sources.
+        Récupère les URLs de toutes les offres de toutes les sources, sans doublons.
+        
+        Les sources sont parcourues simultanément : leurs requêtes s'entrelacent
+        sous le budget de débit commun du client HTTP (un seau par hôte).
+        Une offre trouvée par plusieurs recherches n'apparaît qu'une fois.
         
         Returns:
-            List[str]: Liste de toutes les URLs d'offres trouvées
+            Dict[str, Set[str]]: URL canonique de l'offre -> sources qui l'ont trouvée
         """
-        all_urls = []
+        results = await asyncio.gather(
+            *(self._scrape_source(source) for source in self.sources),
+            return_exceptions=True
+        )
         
-        for source in self.sources:
-            try:
-                urls = await self._scrape_source(source)
-                all_urls.extend(urls)
-            except Exception as e:
-                logger.error(f"❌ Erreur lors du scraping de {source['name']}: {str(e)}")
+        urls_by_source = []
+        total = 0
+        for source, result in zip(self.sources, results):
+            if isinstance(result, Exception):
+                logger.error(f"❌ Erreur lors du scraping de {source['name']}: {str(result)}")
+                continue
+            urls_by_source.append((source['name'], result))
+            total += len(result)
         
-        logger.success(f"✅ Scraping terminé : {len(all_urls)} offres trouvées au total")
-        return all_urls 
\ No newline at end of file
+        url_sources = dedupe_urls(urls_by_source)
+        logger.success(
+            f"✅ Scraping terminé : {len(url_sources)} offres uniques trouvées au total "
+            f"({total - len(url_sources)} doublons entre sources)"
+        )
+        return url_sources
+
+    async def get_all_job_urls(self) -> List[str]:
+        """
+        Récupère les URLs de toutes les offres de toutes les sources.
+        
+        Returns:
+            List[str]: Liste des URLs canoniques uniques, dans l'ordre de découverte
+        """
+        return list(await self.get_job_url_sources())
\ No newline at end of file
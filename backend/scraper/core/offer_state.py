@@ -0,0 +1,64 @@
+"""
+Module de définition des étapes de traitement d'une offre.
+"""
+
+from enum import Enum
+
+class OfferStage(str, Enum):
+    """
+    Étape atteinte par une offre dans le pipeline.
+
+    discovered → fetched → cleaned → analyzed → loaded
+    """
+    DISCOVERED = "discovered"  # Trouvée dans une page de liste, pas encore récupérée
+    FETCHED = "fetched"  # HTML brut en cache (raw_ref)
+    CLEANED = "cleaned"  # HTML nettoyé en cache (cleaned_ref)
+    ANALYZED = "analyzed"  # Analyse en cache (analysis_ref)
+    LOADED = "loaded"  # Chargée dans Supabase, plus aucun contenu en cache
+
+# Étapes dont les offres forment le backlog d'une étape du pipeline.
+# Les offres chargées n'ont pas d'index : l'ensemble grossirait sans fin.
+INDEXED_STAGES = (OfferStage.DISCOVERED, OfferStage.FETCHED, OfferStage.CLEANED, OfferStage.ANALYZED)
+
+ANY_STAGE = "*"
+NO_STAGE = "none"  # Offre sans enregistrement
+
+# Transition atomique d'une offre.
+# KEYS[1] : hash de l'offre
+# ARGV : url, étape cible, horodatage, TTL, préfixe des index, étapes de départ
+#        autorisées (séparées par des virgules, "*" pour toutes), 1 si l'étape
+#        cible est indexée, préfixe des streams de travail (vide si désactivés),
+#        longueur maximale approximative des streams, puis paires (champ, valeur)
+#        à enregistrer
+# Retourne 1 si la transition a eu lieu, 0 si l'offre n'était pas dans une étape de départ
+TRANSITION_SCRIPT = """
+local current = redis.call('HGET', KEYS[1], 'stage')
+if ARGV[6] ~= '*' then
+    local allowed = false
+    for stage in string.gmatch(ARGV[6], '[^,]+') do
+        if stage == current or (stage == 'none' and not current) then
+            allowed = true
+        end
+    end
+    if not allowed then
+        return 0
+    end
+end
+if current then
+    redis.call('SREM', ARGV[5] .. current, ARGV[1])
+else
+    redis.call('HSET', KEYS[1], 'url', ARGV[1], 'discovered_at', ARGV[3])
+end
+redis.call('HSET', KEYS[1], 'stage', ARGV[2], ARGV[2] .. '_at', ARGV[3], 'updated_at', ARGV[3])
+for i = 10, #ARGV, 2 do
+    redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+if ARGV[7] == '1' then
+    redis.call('SADD', ARGV[5] .. ARGV[2], ARGV[1])
+    if ARGV[8] ~= '' then
+        redis.call('XADD', ARGV[8] .. ARGV[2], 'MAXLEN', '~', ARGV[9], '*', 'url', ARGV[1])
+    end
+end
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return 1
+"""
@@ -0,0 +1,207 @@
+"""
+Module de limitation de débit (token bucket) et de concurrence adaptative par hôte.
+"""
+
+import asyncio
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+from loguru import logger
+
+from ..config.settings import SCRAPING_SOURCES, RATE_LIMIT_DEFAULT, ADAPTIVE_CONCURRENCY
+
+class TokenBucket:
+    """
+    Seau à jetons : autorise des rafales de `burst` requêtes puis
+    un débit moyen de `rate` requêtes par seconde.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Initialise le seau plein.
+
+        Args:
+            rate: Nombre de jetons ajoutés par seconde
+            burst: Capacité maximale du seau
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError(f"Paramètres de débit invalides (rate={rate}, burst={burst})")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Ajoute les jetons accumulés depuis le dernier appel."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    async def acquire(self) -> None:
+        """Attend qu'un jeton soit disponible puis le consomme."""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Vide le seau pour suspendre les requêtes pendant `seconds` secondes.
+
+        Args:
+            seconds: Durée de la pause (Retry-After ou backoff)
+        """
+        self._refill()
+        self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+class AdaptiveConcurrency:
+    """
+    Limite adaptative du nombre de requêtes en vol (AIMD).
+
+    La limite augmente d'une unité par fenêtre de réponses saines (réussies
+    sous la latence cible) et est multipliée par `decrease_factor` dès que
+    le serveur montre des signes de surcharge (429, 5xx, timeout). Le débit
+    converge ainsi vers le maximum toléré par le site.
+    """
+
+    def __init__(
+        self,
+        initial: int = ADAPTIVE_CONCURRENCY['initial'],
+        minimum: int = ADAPTIVE_CONCURRENCY['min'],
+        maximum: int = ADAPTIVE_CONCURRENCY['max'],
+        latency_target: float = ADAPTIVE_CONCURRENCY['latency_target'],
+        decrease_factor: float = ADAPTIVE_CONCURRENCY['decrease_factor']
+    ):
+        """
+        Initialise la limite.
+
+        Args:
+            initial: Limite de départ
+            minimum: Limite plancher
+            maximum: Limite plafond
+            latency_target: Latence (secondes) au-delà de laquelle la limite n'augmente plus
+            decrease_factor: Facteur appliqué à la limite en cas de surcharge
+        """
+        if not 1 <= minimum <= initial <= maximum or not 0 < decrease_factor < 1:
+            raise ValueError(
+                f"Paramètres de concurrence invalides (min={minimum}, initial={initial}, "
+                f"max={maximum}, decrease_factor={decrease_factor})"
+            )
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency_target = latency_target
+        self.decrease_factor = decrease_factor
+        self._in_flight = 0
+        self._last_decrease = float('-inf')
+        self._condition = asyncio.Condition()
+
+    @property
+    def in_flight(self) -> int:
+        """Nombre de requêtes actuellement en vol."""
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        """Attend qu'une place se libère sous la limite courante."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+
+    async def release(self, latency: Optional[float], overloaded: bool) -> None:
+        """
+        Libère une place et ajuste la limite selon le résultat de la requête.
+
+        Args:
+            latency: Durée de la requête en secondes (None si elle a échoué)
+            overloaded: True si la réponse signale une surcharge (429, 5xx, timeout)
+        """
+        async with self._condition:
+            self._in_flight -= 1
+            if overloaded:
+                self._decrease()
+            elif latency is not None and latency <= self.latency_target:
+                # +1/limite par réponse, soit +1 par fenêtre complète
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+    def _decrease(self) -> None:
+        """Réduit la limite, au plus une fois par fenêtre de latence."""
+        # Les requêtes en vol au moment de la surcharge échouent souvent
+        # ensemble : une seule réduction pour toute la rafale d'erreurs
+        now = time.monotonic()
+        if now - self._last_decrease < self.latency_target:
+            return
+        self._last_decrease = now
+        previous = self.limit
+        self.limit = max(float(self.minimum), self.limit * self.decrease_factor)
+        logger.warning(f"📉 Concurrence réduite: {int(previous)} -> {int(self.limit)} requêtes en vol")
+
+class HostRateLimiter:
+    """
+    Limiteur de débit avec un seau à jetons par hôte.
+    Le débit de chaque hôte est configuré à partir des sources de scraping.
+    """
+
+    def __init__(self, sources: Optional[List[Dict]] = None):
+        """
+        Initialise les seaux à partir de la configuration des sources.
+
+        Args:
+            sources: Sources de scraping (SCRAPING_SOURCES par défaut)
+        """
+        self._buckets: Dict[str, TokenBucket] = {}
+        for source in SCRAPING_SOURCES if sources is None else sources:
+            rate_limit = source.get('rate_limit')
+            if rate_limit:
+                host = urlparse(source['base_url']).hostname
+                self.configure(host, rate_limit['rate'], rate_limit['burst'])
+
+    def configure(self, host: str, rate: float, burst: int) -> None:
+        """
+        Configure le débit d'un hôte.
+
+        Si plusieurs sources partagent le même hôte, la configuration
+        la plus prudente (débit et rafale minimaux) est conservée.
+
+        Args:
+            host: Le nom d'hôte
+            rate: Requêtes par seconde
+            burst: Taille maximale des rafales
+        """
+        existing = self._buckets.get(host)
+        if existing:
+            rate = min(rate, existing.rate)
+            burst = min(burst, existing.burst)
+        self._buckets[host] = TokenBucket(rate, burst)
+        logger.debug(f"🚦 Débit configuré pour {host}: {rate} req/s (rafale: {burst})")
+
+    def _get_bucket(self, host: str) -> TokenBucket:
+        """Retourne le seau d'un hôte, créé avec le débit par défaut si inconnu."""
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(RATE_LIMIT_DEFAULT['rate'], RATE_LIMIT_DEFAULT['burst'])
+        return self._buckets[host]
+
+    async def acquire(self, url: str) -> None:
+        """
+        Attend l'autorisation d'envoyer une requête vers l'hôte de l'URL.
+
+        Args:
+            url: L'URL de la requête à envoyer
+        """
+        await self._get_bucket(urlparse(url).hostname or '').acquire()
+
+    def pause(self, url: str, seconds: float) -> None:
+        """
+        Suspend les requêtes vers l'hôte de l'URL (réponse 429).
+
+        Args:
+            url: L'URL qui a reçu la réponse
+            seconds: Durée de la pause
+        """
+        host = urlparse(url).hostname or ''
+        self._get_bucket(host).pause(seconds)
+        logger.warning(f"⏸️ Requêtes vers {host} suspendues pendant {seconds:.1f}s")
@@ -0,0 +1,163 @@
+"""
+Module d'index longue durée des offres déjà chargées (filtre de Bloom sur disque).
+"""
+
+import hashlib
+import math
+import mmap
+import os
+import struct
+from typing import Iterable
+from loguru import logger
+
+from ..config.settings import SEEN_INDEX_PATH, SEEN_INDEX_CAPACITY, SEEN_INDEX_ERROR_RATE
+
+# En-tête du fichier : marqueur, nombre de bits, nombre de fonctions de hachage,
+# capacité prévue et nombre d'URLs ajoutées, suivis du tableau de bits
+MAGIC = b"JASEEN01"
+HEADER = struct.Struct('<8sQIQQ')
+
+class SeenIndex:
+    """
+    Ensemble des URLs déjà chargées dans Supabase, sans expiration.
+
+    Filtre de Bloom projeté en mémoire (mmap) depuis un fichier : la taille
+    est fixée par la capacité et le taux de faux positifs (environ 9 Mo pour
+    5 millions d'URLs à 0,1 %), un test d'appartenance coûte quelques
+    microsecondes et seules les pages touchées sont chargées.
+
+    Un faux positif fait ignorer une offre jamais vue : le taux configuré
+    borne cette perte. Il n'y a jamais de faux négatif.
+    """
+
+    def __init__(
+        self,
+        path: str = SEEN_INDEX_PATH,
+        capacity: int = SEEN_INDEX_CAPACITY,
+        error_rate: float = SEEN_INDEX_ERROR_RATE
+    ):
+        """
+        Ouvre l'index, en le créant s'il n'existe pas.
+
+        Un index existant conserve les paramètres avec lesquels il a été créé.
+
+        Args:
+            path: Chemin du fichier de l'index
+            capacity: Nombre d'URLs prévu
+            error_rate: Taux de faux positifs visé à pleine capacité
+        """
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError(f"Paramètres d'index invalides (capacity={capacity}, error_rate={error_rate})")
+        self.path = path
+        if not os.path.exists(path) or os.path.getsize(path) < HEADER.size:
+            self._create(capacity, error_rate)
+
+        self._file = open(path, 'r+b')
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+        magic, self.bits, self.hashes, self.capacity, self._count = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or len(self._mmap) != HEADER.size + self.bits // 8:
+            self._mmap.close()
+            self._file.close()
+            raise ValueError(f"Fichier d'index invalide: {path}")
+        logger.debug(
+            f"🗂️ Index des offres vues ouvert ({self._count} URLs, "
+            f"{self.bits // 8 / 1024 / 1024:.1f} Mo, {self.hashes} hachages)"
+        )
+
+    def __enter__(self) -> "SeenIndex":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Nombre d'URLs distinctes ajoutées (approximatif au-delà de la capacité)."""
+        return self._count
+
+    def _create(self, capacity: int, error_rate: float) -> None:
+        """Crée un fichier d'index vide dimensionné pour la capacité et le taux d'erreur."""
+        bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        bits = (bits + 7) // 8 * 8
+        hashes = max(1, round(bits / capacity * math.log(2)))
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, bits, hashes, capacity, 0))
+            f.truncate(HEADER.size + bits // 8)
+        logger.info(f"🗂️ Index des offres vues créé: {self.path} ({bits // 8 / 1024 / 1024:.1f} Mo)")
+
+    def _positions(self, url: str) -> Iterable[int]:
+        """
+        Calcule les positions des bits d'une URL (double hachage).
+
+        Les k positions sont dérivées de deux entiers de 64 bits extraits d'une
+        seule empreinte BLAKE2b : h1 + i * h2, avec h2 impair.
+        """
+        digest = hashlib.blake2b(url.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.bits for i in range(self.hashes))
+
+    def __contains__(self, url: str) -> bool:
+        """True si l'URL a (très probablement) déjà été ajoutée."""
+        data = self._mmap
+        for position in self._positions(url):
+            if not data[HEADER.size + (position >> 3)] & (1 << (position & 7)):
+                return False
+        return True
+
+    def add(self, url: str) -> bool:
+        """
+        Ajoute une URL à l'index.
+
+        Args:
+            url: L'URL canonique de l'offre
+
+        Returns:
+            bool: True si l'URL était absente
+        """
+        data = self._mmap
+        added = False
+        for position in self._positions(url):
+            index = HEADER.size + (position >> 3)
+            mask = 1 << (position & 7)
+            if not data[index] & mask:
+                data[index] |= mask
+                added = True
+        if added:
+            self._count += 1
+        return added
+
+    def add_many(self, urls: Iterable[str]) -> int:
+        """
+        Ajoute plusieurs URLs et enregistre l'index sur disque.
+
+        Args:
+            urls: Les URLs canoniques des offres
+
+        Returns:
+            int: Le nombre d'URLs nouvelles
+        """
+        added = sum(self.add(url) for url in urls)
+        self.flush()
+        return added
+
+    def flush(self) -> None:
+        """Écrit le compteur et les pages modifiées sur disque."""
+        HEADER.pack_into(self._mmap, 0, MAGIC, self.bits, self.hashes, self.capacity, self._count)
+        self._mmap.flush()
+
+    def close(self) -> None:
+        """Enregistre et ferme l'index."""
+        if self._mmap.closed:
+            return
+        if self._count > self.capacity:
+            logger.warning(
+                f"⚠️ Index des offres vues saturé ({self._count}/{self.capacity}), "
+                f"taux de faux positifs supérieur à la cible"
+            )
+        self.flush()
+        self._mmap.close()
+        self._file.close()
@@ -0,0 +1,66 @@
+"""
+Module de sérialisation des structures (analyses) stockées dans le cache.
+"""
+
+import ast
+import json
+from datetime import date, datetime
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson est optionnel, json produit le même format
+    orjson = None
+
+# En-tête des valeurs sérialisées : marqueur + version du schéma.
+# Les valeurs sans ce marqueur sont des repr() Python écrites avant ce format.
+MAGIC = b"JAS"
+SCHEMA_VERSION = b"1"
+
+def _default(value: Any) -> Any:
+    """Convertit les types non JSON (dates, ensembles) rencontrés à la sérialisation."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f"Type non sérialisable: {type(value).__name__}")
+
+def encode_payload(value: Any) -> bytes:
+    """
+    Sérialise une structure pour le stockage.
+
+    Args:
+        value: La structure à sérialiser (dict, list, scalaires, dates)
+
+    Returns:
+        bytes: La valeur à stocker (en-tête + JSON)
+    """
+    if orjson is not None:
+        data = orjson.dumps(value, default=_default)
+    else:
+        data = json.dumps(value, default=_default, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return MAGIC + SCHEMA_VERSION + data
+
+def decode_payload(value: Union[bytes, str]) -> Any:
+    """
+    Désérialise une valeur lue dans le cache.
+
+    Les valeurs sans en-tête (repr() Python des anciennes versions) sont lues
+    avec ast.literal_eval, qui n'accepte que des littéraux et n'exécute rien.
+
+    Args:
+        value: La valeur stockée
+
+    Returns:
+        Any: La structure d'origine
+    """
+    if isinstance(value, str):
+        value = value.encode('utf-8')
+    if not value.startswith(MAGIC):
+        return ast.literal_eval(value.decode('utf-8'))
+
+    version = value[3:4]
+    if version != SCHEMA_VERSION:
+        raise ValueError(f"Version de schéma inconnue: {version!r}")
+    data = value[4:]
+    return orjson.loads(data) if orjson is not None else json.loads(data)
@@ -0,0 +1,248 @@
+"""
+Module de traitement par lots des étapes du pipeline (nettoyage, analyse, chargement).
+
+Les mêmes fonctions sont utilisées par le DAG Airflow, qui parcourt le backlog
+de chaque étape, et par les workers des files Redis Streams.
+"""
+
+import asyncio
+from typing import Dict, List, Optional
+from loguru import logger
+
+from .cache import JobCache
+from .fingerprint import fingerprint, html_fingerprint
+from .cleaning_executor import CleaningExecutor
+from .job_analyzer import JobAnalyzer
+from .offer_state import OfferStage
+from .seen_index import SeenIndex
+from .storage import JobStorage
+
+def new_stats() -> Dict[str, int]:
+    """Retourne des compteurs vides (processed, skipped, failed)."""
+    return {'processed': 0, 'skipped': 0, 'failed': 0}
+
+async def clean_offers(cache: JobCache, executor: CleaningExecutor, urls: List[str], stats: Dict[str, int]) -> List[str]:
+    """
+    Nettoie un lot d'offres à l'étape fetched.
+
+    Une offre récupérée à l'identique (même HTML brut, même nettoyeur) dont la
+    dernière analyse porte sur le HTML nettoyé de ce contenu passe directement
+    à l'étape analyzed, sans nettoyage ni analyse.
+
+    Args:
+        cache: Le cache des offres
+        executor: L'exécuteur du nettoyage HTML
+        urls: Les URLs des offres
+        stats: Compteurs à mettre à jour
+
+    Returns:
+        List[str]: Les URLs des offres en échec, restées à l'étape fetched
+    """
+    keys = [f"raw_html:{url}" for url in urls]
+    contents = await cache.get_raw_html_many(keys)
+    previous_fingerprints, cleaned_outputs, analyzed_fingerprints = await asyncio.gather(
+        cache.get_fingerprints(urls, "cleaned"),
+        cache.get_fingerprints(urls, "cleaned_output"),
+        cache.get_reusable_fingerprints(urls, "analyzed")
+    )
+    salt = executor.signature
+
+    pages = []
+    raw_fingerprints = {}
+    unchanged = []
+    expired = []
+    failed = []
+    for url, key, html_content, previous_fingerprint, cleaned_output, analyzed_fingerprint in zip(
+        urls, keys, contents, previous_fingerprints, cleaned_outputs, analyzed_fingerprints
+    ):
+        try:
+            if not html_content:
+                logger.warning(f"⚠️ HTML non trouvé pour {key}")
+                stats['failed'] += 1
+                expired.append(url)
+                continue
+
+            # Saute nettoyage et analyse si le HTML brut et le nettoyeur n'ont pas changé
+            # depuis le dernier passage, et que l'analyse gardée porte sur son résultat
+            raw_fingerprint = html_fingerprint(html_content, salt)
+            if (
+                previous_fingerprint == raw_fingerprint
+                and analyzed_fingerprint is not None
+                and analyzed_fingerprint == cleaned_output
+            ):
+                logger.debug(f"⏭️ HTML brut inchangé, nettoyage et analyse ignorés: {key}")
+                stats['skipped'] += 1
+                unchanged.append(url)
+                continue
+
+            pages.append((key, html_content))
+            raw_fingerprints[key] = raw_fingerprint
+
+        except Exception as e:
+            stats['failed'] += 1
+            failed.append(url)
+            logger.error(f"❌ Erreur lors du nettoyage de {key}: {str(e)}")
+
+    # Les pages sont nettoyées en parallèle et reviennent dans l'ordre où elles sont prêtes
+    batch = []
+    async for key, cleaned_html in executor.clean_many(pages):
+        if cleaned_html is None:
+            stats['failed'] += 1
+            failed.append(key.split(":", 1)[1])
+            continue
+        batch.append((key, cleaned_html, raw_fingerprints[key]))
+
+    # Offres dont le HTML a expiré : oubliées, elles seront redécouvertes
+    await cache.discard_offers(expired)
+    await cache.transition_offers(unchanged, OfferStage.ANALYZED, OfferStage.FETCHED)
+    try:
+        await cache.store_cleaned_html_many(batch)
+        stats['processed'] += len(batch)
+        if batch:
+            logger.info(f"✅ {len(batch)} nettoyages réussis")
+    except Exception as e:
+        stats['failed'] += len(batch)
+        failed.extend(key.split(":", 1)[1] for key, _, _ in batch)
+        logger.error(f"❌ Erreur lors du stockage de {len(batch)} HTML nettoyés: {str(e)}")
+    return failed
+
+async def analyze_offers(cache: JobCache, analyzer: JobAnalyzer, urls: List[str], stats: Dict[str, int]) -> List[str]:
+    """
+    Analyse un lot d'offres à l'étape cleaned.
+
+    Args:
+        cache: Le cache des offres
+        analyzer: L'analyseur Mistral
+        urls: Les URLs des offres
+        stats: Compteurs à mettre à jour
+
+    Returns:
+        List[str]: Les URLs des offres en échec, restées à l'étape cleaned
+    """
+    keys = [f"cleaned_html:{url}" for url in urls]
+    contents = await cache.get_cleaned_html_many(keys)
+    previous_fingerprints = await cache.get_reusable_fingerprints(urls, "analyzed")
+
+    batch = []
+    unchanged = []
+    expired = []
+    failed = []
+    for url, key, cleaned_html, previous_fingerprint in zip(urls, keys, contents, previous_fingerprints):
+        try:
+            if not cleaned_html:
+                logger.warning(f"⚠️ HTML nettoyé non trouvé pour {key}")
+                stats['failed'] += 1
+                expired.append(url)
+                continue
+
+            # Saute l'analyse si le HTML nettoyé n'a pas changé depuis la dernière analyse
+            # (gardée après le chargement), même si le HTML brut a changé
+            cleaned_fingerprint = fingerprint(cleaned_html)
+            if previous_fingerprint == cleaned_fingerprint:
+                logger.debug(f"⏭️ HTML nettoyé inchangé, analyse ignorée: {key}")
+                stats['skipped'] += 1
+                unchanged.append(url)
+                continue
+
+            analysis = await analyzer.analyze(cleaned_html, url)
+
+            # L'empreinte n'est enregistrée que pour une analyse non vide,
+            # afin qu'un échec de Mistral soit retenté au prochain passage
+            if analysis:
+                succeeded = any(value not in ("", None, []) for value in analysis.values())
+                batch.append((key, analysis, cleaned_fingerprint if succeeded else None))
+                logger.info(f"✅ Analyse réussie: {key}")
+            else:
+                stats['failed'] += 1
+                failed.append(url)
+                logger.error(f"❌ Échec de l'analyse: {key}")
+
+        except Exception as e:
+            stats['failed'] += 1
+            failed.append(url)
+            logger.error(f"❌ Erreur lors de l'analyse de {key}: {str(e)}")
+
+    await cache.discard_offers(expired)
+    await cache.transition_offers(unchanged, OfferStage.ANALYZED, OfferStage.CLEANED)
+    try:
+        await cache.store_analysis_many(batch)
+        stats['processed'] += len(batch)
+    except Exception as e:
+        stats['failed'] += len(batch)
+        failed.extend(key.split(":", 1)[1] for key, _, _ in batch)
+        logger.error(f"❌ Erreur lors du stockage de {len(batch)} analyses: {str(e)}")
+    return failed
+
+def _prepare_analysis(analysis: dict, url: str) -> dict:
+    """Normalise une analyse avant son insertion dans Supabase."""
+    analysis['URL'] = url
+
+    # Nettoyage des valeurs None
+    if analysis.get('DURATION_DAYS') == "None":
+        analysis['DURATION_DAYS'] = None
+
+    # Assurer que CONTRACT_TYPE est une liste
+    contract_type = analysis.get('CONTRACT_TYPE')
+    if contract_type:
+        if isinstance(contract_type, str):
+            analysis['CONTRACT_TYPE'] = [contract_type]
+        elif not isinstance(contract_type, list):
+            analysis['CONTRACT_TYPE'] = [str(contract_type)]
+    else:
+        analysis['CONTRACT_TYPE'] = []
+    return analysis
+
+async def load_offers(
+    cache: JobCache,
+    storage: JobStorage,
+    urls: List[str],
+    stats: Dict[str, int],
+    seen_index: Optional[SeenIndex] = None
+) -> List[str]:
+    """
+    Charge dans Supabase un lot d'offres à l'étape analyzed.
+
+    Args:
+        cache: Le cache des offres
+        storage: Le stockage Supabase
+        urls: Les URLs des offres
+        stats: Compteurs à mettre à jour
+        seen_index: Index des offres chargées à compléter
+
+    Returns:
+        List[str]: Les URLs des offres en échec, restées à l'étape analyzed
+    """
+    keys = [f"analysis:{url}" for url in urls]
+    loaded_urls = []
+    expired = []
+    failed = []
+
+    for url, key, analysis in zip(urls, keys, await cache.get_analysis_many(keys)):
+        try:
+            if not analysis:
+                logger.warning(f"⚠️ Analyse non trouvée pour {key}")
+                stats['failed'] += 1
+                expired.append(url)
+                continue
+
+            if await storage.store_job_analysis(_prepare_analysis(analysis, url)):
+                stats['processed'] += 1
+                logger.info(f"✅ Analyse chargée avec succès : {key}")
+                loaded_urls.append(url)
+            else:
+                stats['failed'] += 1
+                failed.append(url)
+                logger.error(f"❌ Échec du chargement de l'analyse : {key}")
+
+        except Exception as e:
+            stats['failed'] += 1
+            failed.append(url)
+            logger.exception(f"❌ Erreur lors du chargement de {key}: {str(e)}")
+
+    # Les offres chargées passent à l'étape loaded, leurs HTML brut et nettoyé
+    # sont supprimés du cache et leurs URLs ajoutées à l'index
+    await cache.complete_offers(loaded_urls)
+    await cache.discard_offers(expired)
+    if seen_index is not None:
+        seen_index.add_many(loaded_urls)
+    return failed
@@ -0,0 +1,70 @@
+"""
+Module de normalisation des URLs d'offres.
+"""
+
+import re
+from typing import Dict, Iterable, List, Set, Tuple
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+from ..config.settings import SCRAPING_BASE_URL
+
+_MULTIPLE_SLASHES = re.compile(r'/{2,}')
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+def canonicalize_url(url: str, base_url: str = SCRAPING_BASE_URL) -> str:
+    """
+    Retourne la forme canonique d'une URL d'offre.
+
+    1. Résout les URLs relatives par rapport à `base_url`
+    2. Supprime la query string (paramètres de recherche et de tracking) et le fragment
+    3. Normalise le schéma et l'hôte (minuscules, https, sans port par défaut)
+    4. Supprime les slashes multiples et le slash final
+
+    Args:
+        url: L'URL brute trouvée dans la page
+        base_url: L'URL de base pour les liens relatifs
+
+    Returns:
+        str: L'URL canonique
+    """
+    parts = urlsplit(urljoin(base_url, url.strip()))
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    if scheme == 'http' and host == urlsplit(base_url).hostname:
+        scheme = 'https'
+
+    path = _MULTIPLE_SLASHES.sub('/', parts.path).rstrip('/') or '/'
+    return urlunsplit((scheme, host, path, '', ''))
+
+def dedupe_urls(urls_by_source: Iterable[Tuple[str, Iterable[str]]]) -> Dict[str, Set[str]]:
+    """
+    Fusionne les URLs de plusieurs sources sans doublons.
+
+    L'ordre de première apparition est conservé et chaque URL canonique
+    garde l'ensemble des sources qui l'ont trouvée.
+
+    Args:
+        urls_by_source: Paires (nom de la source, URLs trouvées)
+
+    Returns:
+        Dict[str, Set[str]]: URL canonique -> noms des sources
+    """
+    merged: Dict[str, Set[str]] = {}
+    for source_name, urls in urls_by_source:
+        for url in urls:
+            merged.setdefault(canonicalize_url(url), set()).add(source_name)
+    return merged
+
+def unique_urls(urls: Iterable[str]) -> List[str]:
+    """
+    Canonicalise une liste d'URLs en supprimant les doublons (ordre conservé).
+
+    Args:
+        urls: Les URLs brutes
+
+    Returns:
+        List[str]: Les URLs canoniques uniques
+    """
+    return list(dict.fromkeys(canonicalize_url(url) for url in urls))
@@ -0,0 +1,250 @@
+"""
+Module de files de travail Redis Streams pour les workers du pipeline.
+
+Chaque étape du pipeline a un stream (stream:<étape>) alimenté par les
+transitions d'offres et consommé par un groupe de consommateurs : plusieurs
+workers, sur une ou plusieurs machines, se partagent les offres. Un message
+n'est acquitté qu'une fois son offre traitée ; les messages d'un worker tombé
+ou d'une offre en échec sont repris après STREAM_CLAIM_IDLE_MS, au plus
+STREAM_MAX_DELIVERIES fois.
+"""
+
+import os
+import socket
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from redis.asyncio import Redis
+from redis.exceptions import ResponseError
+from loguru import logger
+
+from .cache import JobCache
+from .offer_state import OfferStage, INDEXED_STAGES
+from ..config.settings import (
+    WORK_QUEUE_GROUP,
+    WORK_QUEUE_BATCH_SIZE,
+    WORK_QUEUE_BLOCK_MS,
+    STREAM_MAXLEN,
+    STREAM_CLAIM_IDLE_MS,
+    STREAM_MAX_DELIVERIES
+)
+
+# Étape du pipeline → étape des offres qu'elle consomme
+STAGE_INPUTS = {
+    'fetch': OfferStage.DISCOVERED,
+    'clean': OfferStage.FETCHED,
+    'analyze': OfferStage.CLEANED,
+    'load': OfferStage.ANALYZED,
+}
+
+class StreamWorkQueue:
+    """
+    File de travail d'une étape, sur un stream Redis avec groupe de consommateurs.
+
+    Les messages ne portent que l'URL de l'offre : l'étape courante, dans le
+    hash offer:<url>, reste la référence. Un message en double ou périmé est
+    donc sans danger, il est écarté par le worker avant traitement.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        stage: OfferStage,
+        group: str = WORK_QUEUE_GROUP,
+        consumer: Optional[str] = None
+    ):
+        """
+        Initialise la file.
+
+        Args:
+            redis: Le client Redis (réponses décodées)
+            stage: L'étape des offres à traiter
+            group: Le groupe de consommateurs
+            consumer: Le nom du worker, unique dans le groupe (hôte-pid par défaut)
+        """
+        if stage not in INDEXED_STAGES:
+            raise ValueError(f"Étape sans file de travail: {stage.value}")
+        self.redis = redis
+        self.stage = stage
+        self.key = f"stream:{stage.value}"
+        self.group = group
+        self.consumer = consumer or f"{socket.gethostname()}-{os.getpid()}"
+        self._claim_cursor = "0-0"
+
+    async def ensure_group(self) -> None:
+        """Crée le stream et le groupe de consommateurs s'ils n'existent pas."""
+        try:
+            await self.redis.xgroup_create(self.key, self.group, id="0", mkstream=True)
+            logger.info(f"🆕 Groupe {self.group} créé sur {self.key}")
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def publish(self, urls: List[str]) -> int:
+        """
+        Publie des offres dans le stream, en un seul aller-retour.
+
+        Args:
+            urls: Les URLs des offres
+
+        Returns:
+            int: Le nombre de messages publiés
+        """
+        if not urls:
+            return 0
+        pipeline = self.redis.pipeline(transaction=False)
+        for url in urls:
+            pipeline.xadd(self.key, {"url": url}, maxlen=STREAM_MAXLEN, approximate=True)
+        await pipeline.execute()
+        return len(urls)
+
+    async def claim(self, count: int = WORK_QUEUE_BATCH_SIZE, block_ms: int = WORK_QUEUE_BLOCK_MS) -> List[Tuple[str, str]]:
+        """
+        Réclame un lot de messages pour ce worker.
+
+        Les messages non acquittés depuis STREAM_CLAIM_IDLE_MS (worker tombé)
+        sont repris en priorité, puis les nouveaux messages sont lus.
+
+        Args:
+            count: Nombre maximal de messages
+            block_ms: Attente maximale si le stream est vide
+
+        Returns:
+            List[Tuple[str, str]]: Les couples (identifiant du message, URL)
+        """
+        cursor, messages, *_ = await self.redis.xautoclaim(
+            self.key, self.group, self.consumer,
+            min_idle_time=STREAM_CLAIM_IDLE_MS, start_id=self._claim_cursor, count=count
+        )
+        self._claim_cursor = cursor
+        if messages:
+            logger.info(f"♻️ {len(messages)} messages repris sur {self.key}")
+        else:
+            response = await self.redis.xreadgroup(
+                self.group, self.consumer, {self.key: ">"}, count=count, block=block_ms
+            )
+            messages = response[0][1] if response else []
+
+        # Un message supprimé du stream (MAXLEN) est repris sans contenu
+        return [(message_id, fields["url"]) for message_id, fields in messages if fields and "url" in fields]
+
+    async def ack(self, message_ids: List[str]) -> int:
+        """
+        Acquitte des messages traités.
+
+        Args:
+            message_ids: Les identifiants des messages
+
+        Returns:
+            int: Le nombre de messages acquittés
+        """
+        if not message_ids:
+            return 0
+        return await self.redis.xack(self.key, self.group, *message_ids)
+
+    async def pending_count(self) -> int:
+        """Retourne le nombre de messages distribués mais pas encore acquittés."""
+        return (await self.redis.xpending(self.key, self.group))["pending"]
+
+    async def delivery_counts(self, message_ids: List[str]) -> List[int]:
+        """
+        Retourne le nombre de distributions de messages non acquittés, en un seul aller-retour.
+
+        Args:
+            message_ids: Les identifiants des messages
+
+        Returns:
+            List[int]: Le nombre de distributions de chaque message (0 s'il n'est plus en attente)
+        """
+        if not message_ids:
+            return []
+        pipeline = self.redis.pipeline(transaction=False)
+        for message_id in message_ids:
+            pipeline.xpending_range(self.key, self.group, min=message_id, max=message_id, count=1)
+        return [
+            entries[0]["times_delivered"] if entries else 0
+            for entries in await pipeline.execute()
+        ]
+
+async def _release_failed(
+    queue: StreamWorkQueue,
+    messages: List[Tuple[str, str]],
+    max_deliveries: int,
+    stats: Dict[str, int]
+) -> None:
+    """
+    Laisse en attente les messages en échec, sauf ceux distribués trop souvent.
+
+    Un message non acquitté est repris après STREAM_CLAIM_IDLE_MS ; au-delà de
+    max_deliveries distributions, il est acquitté sans traitement pour qu'un lot
+    qui échoue toujours ne soit pas repris indéfiniment.
+    """
+    if not messages:
+        return
+    counts = await queue.delivery_counts([message_id for message_id, _ in messages])
+    abandoned = [(message_id, url) for (message_id, url), count in zip(messages, counts) if count >= max_deliveries]
+    stats['retried'] += len(messages) - len(abandoned)
+    if abandoned:
+        await queue.ack([message_id for message_id, _ in abandoned])
+        stats['abandoned'] += len(abandoned)
+        for _, url in abandoned:
+            logger.error(f"☠️ Offre abandonnée après {max_deliveries} tentatives sur {queue.key}: {url}")
+
+async def run_worker(
+    queue: StreamWorkQueue,
+    cache: JobCache,
+    handler: Callable[[List[str]], Awaitable[Optional[List[str]]]],
+    batch_size: int = WORK_QUEUE_BATCH_SIZE,
+    until_idle: bool = False,
+    max_deliveries: int = STREAM_MAX_DELIVERIES
+) -> Dict[str, int]:
+    """
+    Consomme une file de travail, lot par lot.
+
+    Chaque lot est filtré contre l'étape courante des offres puis traité par le
+    handler, qui retourne les URLs des offres en échec. Les autres messages sont
+    acquittés ; ceux des offres en échec, ou de tout le lot si le handler lève
+    une exception, restent en attente et sont repris par un worker après
+    STREAM_CLAIM_IDLE_MS, jusqu'à max_deliveries distributions.
+
+    Args:
+        queue: La file de l'étape
+        cache: Le cache des offres
+        handler: Traitement d'un lot d'URLs, retourne les URLs à retraiter
+        batch_size: Nombre de messages réclamés par lecture
+        until_idle: S'arrête dès que la file est vide au lieu d'attendre
+        max_deliveries: Distributions d'un message en échec avant son abandon
+
+    Returns:
+        Dict[str, int]: Statistiques (messages, duplicates, batches, failed_batches, retried, abandoned)
+    """
+    stats = {'messages': 0, 'duplicates': 0, 'batches': 0, 'failed_batches': 0, 'retried': 0, 'abandoned': 0}
+    await queue.ensure_group()
+    logger.info(f"👷 Worker {queue.consumer} à l'écoute de {queue.key} (groupe {queue.group})")
+
+    while True:
+        messages = await queue.claim(batch_size)
+        if not messages:
+            if until_idle:
+                break
+            continue
+
+        urls = await cache.filter_offers([url for _, url in messages], queue.stage)
+        stats['messages'] += len(messages)
+        stats['duplicates'] += len(messages) - len(urls)
+        try:
+            failed = set(await handler(urls) or []) if urls else set()
+        except Exception as e:
+            stats['failed_batches'] += 1
+            logger.error(f"❌ Échec du lot de {len(urls)} offres sur {queue.key}, non acquitté: {str(e)}")
+            await _release_failed(queue, messages, max_deliveries, stats)
+            continue
+        await queue.ack([message_id for message_id, url in messages if url not in failed])
+        await _release_failed(queue, [(message_id, url) for message_id, url in messages if url in failed], max_deliveries, stats)
+        stats['batches'] += 1
+
+    logger.info(
+        f"📊 Worker {queue.consumer} arrêté : {stats['messages']} messages, "
+        f"{stats['duplicates']} doublons, {stats['batches']} lots traités, "
+        f"{stats['failed_batches']} lots en échec, {stats['retried']} offres à reprendre, "
+        f"{stats['abandoned']} abandonnées"
+    )
+    return stats
@@ -7,15 +7,17 @@ from loguru import logger
 
 from backend.scraper.core.list_scraper import JobListScraper
 from backend.scraper.core.job_scraper import JobScraper
+from backend.scraper.core.http_client import HTTPClient
 from backend.scraper.core.logger import setup_logger
 from backend.scraper.config.settings import ANALYSIS_LOG_FORMAT
 
 async def test_list_scraping():
     """Teste le scraping d'une liste d'offres."""
+    http_client = HTTPClient()
     try:
-        # Initialisation des scrapers
-        list_scraper = JobListScraper()
-        job_scraper = JobScraper()
+        # Initialisation des scrapers (client HTTP partagé)
+        list_scraper = JobListScraper(http_client=http_client)
+        job_scraper = JobScraper(http_client=http_client)
         
         logger.info("🚀 Démarrage du scraping de liste")
         
@@ -58,6 +60,8 @@ async def test_list_scraping():
             
     except Exception as e:
         logger.error(f"❌ Erreur globale : {str(e)}")
+    finally:
+        await http_client.close()
 
 if __name__ == "__main__":
     # Configuration du logger
@@ -0,0 +1,98 @@
+"""
+Entraîne le dictionnaire zstd de compression du cache sur les pages en cache.
+
+Exemple : python -m backend.scraper.train_compression_dictionary --samples 2000
+
+Le dictionnaire est écrit dans CACHE_COMPRESSION_DICTIONARY_PATH et utilisé par
+JobCache dès le démarrage suivant (CACHE_COMPRESSION=zstd). Les valeurs déjà
+compressées avec un autre dictionnaire entraîné deviennent illisibles : lancer
+ce script sur un cache rempli, puis vider le cache avant de déployer le nouveau
+dictionnaire.
+"""
+
+import asyncio
+import argparse
+import os
+from typing import List
+from loguru import logger
+
+from .core.cache import JobCache, batched
+from .core.compression import train_dictionary
+from .config.settings import CACHE_COMPRESSION_DICTIONARY_PATH
+from .main import setup_logging
+
+def parse_args():
+    """Parse les arguments de la ligne de commande."""
+    parser = argparse.ArgumentParser(description="Entraînement du dictionnaire de compression du cache")
+    parser.add_argument(
+        "--samples",
+        type=int,
+        default=2000,
+        help="Nombre maximal de pages lues dans le cache"
+    )
+    parser.add_argument(
+        "--size",
+        type=int,
+        default=112_640,
+        help="Taille maximale du dictionnaire en octets"
+    )
+    parser.add_argument(
+        "--output",
+        default=CACHE_COMPRESSION_DICTIONARY_PATH,
+        help="Fichier du dictionnaire"
+    )
+    return parser.parse_args()
+
+async def collect_samples(cache: JobCache, limit: int) -> List[str]:
+    """
+    Lit des pages brutes (la moitié au plus) puis nettoyées dans le cache.
+
+    Args:
+        cache: Le cache des offres
+        limit: Nombre maximal de pages
+
+    Returns:
+        List[str]: Les pages lues
+    """
+    samples: List[str] = []
+    for iter_keys, get_many, quota in (
+        (cache.iter_raw_html_keys, cache.get_raw_html_many, limit // 2),
+        (cache.iter_cleaned_html_keys, cache.get_cleaned_html_many, limit)
+    ):
+        async for keys in batched(iter_keys()):
+            samples.extend(page for page in await get_many(keys) if page)
+            if len(samples) >= quota:
+                break
+        del samples[quota:]
+    return samples
+
+async def main(args: argparse.Namespace) -> int:
+    """
+    Entraîne et écrit le dictionnaire.
+
+    Args:
+        args: Les arguments de la ligne de commande
+
+    Returns:
+        int: La taille du dictionnaire écrit, en octets
+    """
+    cache = JobCache()
+    try:
+        samples = await collect_samples(cache, args.samples)
+    finally:
+        await cache.close()
+    logger.info(f"📚 {len(samples)} pages lues dans le cache")
+
+    dictionary = train_dictionary(samples, args.size)
+    directory = os.path.dirname(args.output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(args.output, 'wb') as f:
+        f.write(dictionary)
+    return len(dictionary)
+
+if __name__ == "__main__":
+    setup_logging()
+    args = parse_args()
+    size = asyncio.run(main(args))
+    logger.success(f"✅ Dictionnaire de {size} octets écrit dans {args.output}")
@@ -0,0 +1,150 @@
+"""
+Point d'entrée des workers du pipeline, consommateurs des files Redis Streams.
+
+Exemple : python -m backend.scraper.worker analyze --feed --until-idle
+"""
+
+import asyncio
+import argparse
+from typing import Dict
+from loguru import logger
+
+from .core.boilerplate import BoilerplateModel
+from .core.cache import JobCache
+from .core.cache_backend import RedisBackend
+from .core.extractor import JobExtractor
+from .core.cleaning_executor import CleaningExecutor
+from .core.http_client import HTTPClient
+from .core.job_analyzer import JobAnalyzer
+from .core.seen_index import SeenIndex
+from .core.stages import new_stats, clean_offers, analyze_offers, load_offers
+from .core.storage import JobStorage
+from .core.work_queue import STAGE_INPUTS, StreamWorkQueue, run_worker
+from .config.settings import BOILERPLATE_ENABLED, LOG_FORMAT, WORK_QUEUE_BATCH_SIZE, WORK_QUEUE_GROUP
+from .main import setup_logging
+
+def parse_args():
+    """Parse les arguments de la ligne de commande."""
+    parser = argparse.ArgumentParser(description="Worker du pipeline d'offres d'emploi")
+    parser.add_argument(
+        "stage",
+        choices=list(STAGE_INPUTS),
+        help="L'étape du pipeline à traiter"
+    )
+    parser.add_argument(
+        "--consumer",
+        help="Nom du worker dans le groupe (hôte-pid par défaut)"
+    )
+    parser.add_argument(
+        "--group",
+        default=WORK_QUEUE_GROUP,
+        help="Groupe de consommateurs"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=WORK_QUEUE_BATCH_SIZE,
+        help="Offres réclamées par lecture"
+    )
+    parser.add_argument(
+        "--feed",
+        action="store_true",
+        help="Publie d'abord dans la file tout le backlog de l'étape"
+    )
+    parser.add_argument(
+        "--until-idle",
+        action="store_true",
+        help="S'arrête dès que la file est vide"
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Active le mode debug"
+    )
+    return parser.parse_args()
+
+async def main(args: argparse.Namespace) -> Dict[str, int]:
+    """
+    Lance un worker sur la file d'une étape.
+
+    Args:
+        args: Les arguments de la ligne de commande
+
+    Returns:
+        Dict[str, int]: Statistiques de l'étape
+    """
+    cache = JobCache()
+    seen_index = SeenIndex() if args.stage in ("fetch", "load") else None
+    http_client = HTTPClient() if args.stage == "fetch" else None
+    executor = None
+    if args.stage == "clean":
+        executor = CleaningExecutor(boilerplate=BoilerplateModel() if BOILERPLATE_ENABLED else None)
+    stats = new_stats()
+    try:
+        if not isinstance(cache.backend, RedisBackend):
+            raise ValueError(f"Les workers nécessitent le backend Redis (CACHE_BACKEND={cache.backend.name})")
+        queue = StreamWorkQueue(cache.backend.redis, STAGE_INPUTS[args.stage], args.group, args.consumer)
+
+        if args.feed:
+            published = 0
+            async for urls in cache.iter_offers(queue.stage):
+                published += await queue.publish(urls)
+            logger.info(f"📬 {published} offres publiées dans {queue.key}")
+
+        if args.stage == "fetch":
+            extractor = JobExtractor(cache, http_client, seen_index=seen_index)
+
+            async def handler(urls):
+                failed = []
+                result = await extractor.extract(urls, failed)
+                stats['processed'] += result['extracted'] + result['not_modified']
+                stats['skipped'] += result['skipped'] + result['known']
+                stats['failed'] += result['failed']
+                return failed
+        elif args.stage == "clean":
+            async def handler(urls):
+                return await clean_offers(cache, executor, urls, stats)
+        elif args.stage == "analyze":
+            analyzer = JobAnalyzer()
+
+            async def handler(urls):
+                return await analyze_offers(cache, analyzer, urls, stats)
+        else:
+            storage = JobStorage()
+
+            async def handler(urls):
+                return await load_offers(cache, storage, urls, stats, seen_index)
+
+        await run_worker(queue, cache, handler, args.batch_size, args.until_idle)
+        return stats
+
+    finally:
+        if http_client is not None:
+            await http_client.close()
+        if seen_index is not None:
+            seen_index.close()
+        if executor is not None:
+            executor.close()
+        await cache.log_summary()
+        await cache.close()
+
+if __name__ == "__main__":
+    # Parse les arguments
+    args = parse_args()
+
+    # Configure le logging
+    if args.debug:
+        logger.remove()
+        logger.add(lambda msg: print(msg), level="DEBUG", format=LOG_FORMAT)
+    else:
+        setup_logging()
+
+    logger.info(f"🚀 Démarrage du worker {args.stage}...")
+    try:
+        stats = asyncio.run(main(args))
+        logger.success(
+            f"✅ Worker {args.stage} terminé : {stats['processed']} traitées, "
+            f"{stats['skipped']} ignorées, {stats['failed']} échecs"
+        )
+    except KeyboardInterrupt:
+        logger.info("🛑 Worker interrompu")
@@ -0,0 +1,28 @@
+import os
+from urllib.parse import urlparse
+
+import pytest
+import pytest_asyncio
+from redis import Redis as SyncRedis
+from redis.asyncio import Redis
+
+REDIS_TEST_URL = os.getenv('REDIS_TEST_URL', 'redis://localhost:6379/15')
+
+@pytest.fixture
+def redis_url():
+    """URL d'un redis-server local, test ignoré s'il est injoignable."""
+    probe = SyncRedis.from_url(REDIS_TEST_URL, socket_connect_timeout=1)
+    try:
+        probe.ping()
+    except Exception:
+        pytest.skip(f"Redis injoignable ({REDIS_TEST_URL})")
+    finally:
+        probe.close()
+    return urlparse(REDIS_TEST_URL)
+
+@pytest_asyncio.fixture
+async def redis(redis_url):
+    """Client vers le redis-server de test (réponses décodées)."""
+    client = Redis.from_url(redis_url.geturl(), decode_responses=True)
+    yield client
+    await client.aclose()
@@ -0,0 +1,89 @@
+import pytest
+
+from backend.scraper.core.boilerplate import BoilerplateModel, block_fingerprint
+from backend.scraper.core.cleaning_executor import CleaningExecutor
+
+def page(i: int) -> str:
+    """Page d'offre avec un paragraphe propre à l'offre et un pied de page commun."""
+    return (
+        f'<h1 class="text-2xl font-bold">Offre {i}</h1><span class="tag">CDI</span>'
+        f'<p>Mission numéro {i} au sein de l\'équipe data.</p>'
+        '<footer><p>Free-Work  © 2025 - Mentions légales</p></footer>'
+    )
+
+def test_recurring_blocks_are_learned_and_persisted(tmp_path):
+    """Test qu'un bloc présent sur la plupart des pages est reconnu, y compris après rechargement."""
+    path = str(tmp_path / "boilerplate.json")
+    model = BoilerplateModel(path, threshold=0.5, min_pages=10, window=1000)
+    footer = block_fingerprint("p", "Free-Work © 2025 - Mentions légales")
+
+    for i in range(9):
+        model.observe([footer, block_fingerprint("p", f"Mission {i}")])
+    assert not model.is_boilerplate(footer)  # Pas encore assez de pages
+    model.observe([footer])
+    assert model.is_boilerplate(footer)
+    assert not model.is_boilerplate(block_fingerprint("p", "Mission 1"))
+
+    model.save()
+    reloaded = BoilerplateModel(path, threshold=0.5, min_pages=10, window=1000)
+    assert reloaded.pages == 10 and reloaded.is_boilerplate(footer)
+
+def test_counts_decay_after_window(tmp_path):
+    """Test que les compteurs sont divisés par deux et les blocs isolés oubliés."""
+    model = BoilerplateModel(str(tmp_path / "boilerplate.json"), threshold=0.5, min_pages=1, window=4)
+    for block in ["a", "a", "a", "b"]:
+        model.observe([block])
+
+    assert model.pages == 2
+    assert model.counts == {"a": 1}
+
+@pytest.mark.asyncio
+async def test_executor_learns_and_strips_footer(tmp_path):
+    """Test que le pied de page commun disparaît du contenu nettoyé une fois appris."""
+    path = str(tmp_path / "boilerplate.json")
+    executor = CleaningExecutor(workers=1, boilerplate=BoilerplateModel(path, threshold=0.5, min_pages=5))
+    pages = [(f"raw_html:{i}", page(i)) for i in range(8)]
+    try:
+        cleaned = dict([result async for result in executor.clean_many(pages)])
+    finally:
+        executor.close()
+
+    assert "Mentions légales" in cleaned["raw_html:0"]
+    assert "Mentions légales" not in cleaned["raw_html:7"]
+    assert "Mission numéro 7" in cleaned["raw_html:7"] and "CDI" in cleaned["raw_html:7"]
+    assert BoilerplateModel(path).pages == 8
+
+def test_concurrent_saves_are_merged(tmp_path):
+    """Test que deux processus qui partagent le modèle additionnent leurs observations."""
+    path = str(tmp_path / "boilerplate.json")
+    first = BoilerplateModel(path, threshold=0.5, min_pages=1, window=1000)
+    second = BoilerplateModel(path, threshold=0.5, min_pages=1, window=1000)
+
+    for _ in range(3):
+        first.observe(["footer", "a"])
+    for _ in range(2):
+        second.observe(["footer", "b"])
+    first.save()
+    second.save()
+
+    merged = BoilerplateModel(path)
+    assert merged.pages == 5
+    assert merged.counts == {"footer": 5, "a": 3, "b": 2}
+    assert second.counts == merged.counts  # Le dernier enregistrement recharge aussi les autres
+    second.save()  # Rien de nouveau : pas de double comptage
+    assert BoilerplateModel(path).pages == 5
+
+@pytest.mark.asyncio
+async def test_pool_uses_blocks_learned_during_run(tmp_path):
+    """Test que les processus du pool retirent les blocs appris depuis le démarrage du pool."""
+    model = BoilerplateModel(str(tmp_path / "boilerplate.json"), threshold=0.5, min_pages=5)
+    executor = CleaningExecutor(workers=2, chunk_size=2, boilerplate=model)
+    try:
+        first = dict([result async for result in executor.clean_many([(f"raw_html:{i}", page(i)) for i in range(6)])])
+        second = dict([result async for result in executor.clean_many([("raw_html:6", page(6))])])
+    finally:
+        executor.close()
+
+    assert "Mentions légales" in first["raw_html:0"]
+    assert "Mentions légales" not in second["raw_html:6"]
+    assert "Mission numéro 6" in second["raw_html:6"]
@@ -0,0 +1,70 @@
+import pytest
+
+from backend.scraper.core.cache import JobCache
+from backend.scraper.core.cache_backend import MemoryBackend
+from backend.scraper.core.cache_metrics import CacheMetrics, key_prefix
+
+def test_key_prefix():
+    """Test que les préfixes à deux segments sont conservés."""
+    assert key_prefix("raw_html:https://example.com/a") == "raw_html"
+    assert key_prefix("fp:cleaned:https://example.com/a") == "fp:cleaned"
+    assert key_prefix("stage:fetched") == "stage"
+
+def test_latency_histogram_percentiles():
+    """Test que les centiles renvoient la borne de leur classe."""
+    metrics = CacheMetrics()
+    for _ in range(90):
+        metrics.observe("get_raw_html_many", 0.0008)
+    for _ in range(10):
+        metrics.observe("get_raw_html_many", 0.2)
+
+    stats = metrics.operations["get_raw_html_many"]
+    assert stats.calls == 100
+    assert stats.percentile_ms(50) == 1
+    assert stats.percentile_ms(95) == 250
+
+@pytest.mark.asyncio
+async def test_job_cache_records_hits_writes_and_memory():
+    """Test que JobCache mesure succès de lecture, écritures et occupation par préfixe."""
+    cache = JobCache(MemoryBackend())
+    await cache.store_raw_html("https://example.com/a", "<p>a</p>")
+
+    assert await cache.are_processed(["https://example.com/a", "https://example.com/b"]) == [True, False]
+    assert cache.metrics.hit_ratio("job") == 0.5
+    assert cache.metrics.written["raw_html"][0] == 1
+
+    usage = await cache.sample_memory()
+    assert usage["raw_html"][0] == 1 and usage["offer"][0] == 1
+    assert cache.metrics.snapshot()["operations"]["are_processed"]["calls"] == 1
+
+class FailingBackend(MemoryBackend):
+    """Backend mémoire dont les lectures et les lots échouent."""
+
+    async def exists_many(self, keys):
+        raise ConnectionError("Redis injoignable")
+
+    async def execute(self, ops, transaction):
+        raise ConnectionError("Redis injoignable")
+
+@pytest.mark.asyncio
+async def test_caught_errors_are_counted():
+    """Test qu'une erreur rattrapée (valeur par défaut renvoyée) compte comme une erreur de l'opération."""
+    cache = JobCache(FailingBackend())
+
+    assert await cache.are_processed(["https://example.com/a"]) == [False]
+    await cache.mark_processed("https://example.com/a")
+
+    operations = cache.metrics.snapshot()["operations"]
+    assert operations["are_processed"] == {**operations["are_processed"], 'calls': 1, 'errors': 1}
+    assert operations["mark_processed"]["errors"] == 1
+
+@pytest.mark.asyncio
+async def test_failed_batch_records_no_write():
+    """Test que les écritures d'un lot en échec ne sont pas comptées."""
+    cache = JobCache(FailingBackend())
+
+    with pytest.raises(ConnectionError):
+        await cache.store_raw_html("https://example.com/a", "<p>a</p>")
+
+    assert cache.metrics.written == {}
+    assert cache.metrics.operations["store_raw_html"].errors == 1
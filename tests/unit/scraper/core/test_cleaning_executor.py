@@ -0,0 +1,66 @@
+import os
+import signal
+
+import pytest
+
+from backend.scraper.core.cache import JobCache
+from backend.scraper.core.cache_backend import MemoryBackend
+from backend.scraper.core.cleaning_executor import CleaningExecutor
+from backend.scraper.core.html_cleaner import HTMLCleaner
+from backend.scraper.core.offer_state import OfferStage
+from backend.scraper.core.stages import new_stats, clean_offers
+
+PAGES = [
+    (f"raw_html:https://example.com/job-mission/{i}", f'<h1 class="text-2xl font-bold">Offre {i}</h1><p>Texte {i}</p>')
+    for i in range(5)
+]
+
+@pytest.mark.asyncio
+async def test_pool_matches_inline_cleaning():
+    """Test que le pool de processus renvoie chaque page nettoyée comme le nettoyeur seul."""
+    executor = CleaningExecutor(workers=2, chunk_size=2)
+    try:
+        results = dict([result async for result in executor.clean_many(PAGES)])
+    finally:
+        executor.close()
+
+    cleaner = HTMLCleaner()
+    assert results == {key: cleaner.clean(html_content) for key, html_content in PAGES}
+
+@pytest.mark.asyncio
+async def test_broken_pool_is_shut_down_and_replaced():
+    """Test qu'un pool dont un processus est mort est arrêté, puis remplacé au lot suivant."""
+    executor = CleaningExecutor(workers=2, chunk_size=2)
+    try:
+        assert all([result async for result in executor.clean_many(PAGES)])
+        broken = executor._pool
+        shutdowns = []
+        shutdown = broken.shutdown
+        broken.shutdown = lambda **kwargs: shutdowns.append(kwargs) or shutdown(**kwargs)
+        for process in list(broken._processes.values()):
+            os.kill(process.pid, signal.SIGKILL)
+
+        results = dict([result async for result in executor.clean_many(PAGES)])
+        assert set(results.values()) == {None}
+        assert executor._pool is None
+        assert shutdowns == [{'wait': False, 'cancel_futures': True}]
+
+        results = dict([result async for result in executor.clean_many(PAGES)])
+        assert None not in results.values()
+    finally:
+        executor.close()
+
+@pytest.mark.asyncio
+async def test_clean_offers_stores_cleaned_pages():
+    """Test que clean_offers stocke les pages nettoyées et fait avancer les offres."""
+    cache = JobCache(MemoryBackend())
+    urls = [key.split(":", 1)[1] for key, _ in PAGES]
+    for url, (_, html_content) in zip(urls, PAGES):
+        await cache.store_raw_html(url, html_content)
+
+    stats = new_stats()
+    await clean_offers(cache, CleaningExecutor(workers=1), urls, stats)
+
+    assert stats == {'processed': 5, 'skipped': 0, 'failed': 0}
+    assert await cache.count_offers(OfferStage.CLEANED) == 5
+    assert "Offre 0" in (await cache.get_cleaned_html_many([f"cleaned_html:{urls[0]}"]))[0]
@@ -0,0 +1,62 @@
+import pytest
+
+from backend.scraper.core import compression
+from backend.scraper.core.compression import compress_text, decompress_text, MAGIC
+
+SAMPLE_HTML = "<html><body>" + "".join(
+    f'<div class="flex items-center"><span class="tag">Freelance</span><p>Mission {i} à Paris – 6 mois</p></div>'
+    for i in range(50)
+) + "</body></html>"
+
+@pytest.mark.parametrize("codec", ["zlib", "zstd"])
+def test_round_trip(monkeypatch, codec):
+    """Test que le contenu compressé est restitué à l'identique."""
+    if codec == "zstd" and compression.zstandard is None:
+        pytest.skip("zstandard non installé")
+    monkeypatch.setattr(compression, "CACHE_COMPRESSION", codec)
+
+    value = compress_text(SAMPLE_HTML)
+
+    assert value.startswith(MAGIC)
+    assert len(value) < len(SAMPLE_HTML.encode("utf-8")) / 5
+    assert decompress_text(value) == SAMPLE_HTML
+
+def test_compression_disabled(monkeypatch):
+    """Test que la compression peut être désactivée."""
+    monkeypatch.setattr(compression, "CACHE_COMPRESSION", "none")
+
+    assert compress_text(SAMPLE_HTML) == SAMPLE_HTML.encode("utf-8")
+
+def test_legacy_uncompressed_values():
+    """Test la lecture des valeurs écrites avant la compression."""
+    assert decompress_text(SAMPLE_HTML.encode("utf-8")) == SAMPLE_HTML
+    assert decompress_text(SAMPLE_HTML) == SAMPLE_HTML
+
+def test_unknown_codec():
+    """Test le rejet d'un codec inconnu."""
+    with pytest.raises(ValueError):
+        decompress_text(MAGIC + b"x1" + b"data")
+
+def test_trained_dictionary(monkeypatch, tmp_path):
+    """Test qu'un dictionnaire entraîné est utilisé s'il existe, et reste lisible après rechargement."""
+    if compression.zstandard is None:
+        pytest.skip("zstandard non installé")
+    pages = [
+        SAMPLE_HTML.replace("Mission", f"Offre {i} ({['Lyon', 'Nantes', 'Lille'][i % 3]})")[:2000 + 7 * i]
+        for i in range(300)
+    ]
+    path = tmp_path / "freework.zdict"
+    path.write_bytes(compression.train_dictionary(pages, 4096))
+    monkeypatch.setattr(compression, "CACHE_COMPRESSION", "zstd")
+    monkeypatch.setattr(compression, "CACHE_COMPRESSION_DICTIONARY_PATH", str(path))
+    monkeypatch.setattr(compression, "_trained_dictionary", None)
+    monkeypatch.setattr(compression, "_trained_dictionary_loaded", False)
+
+    value = compress_text(SAMPLE_HTML)
+
+    assert value[4:5] == compression.TRAINED_DICTIONARY_VERSION
+    assert decompress_text(value) == SAMPLE_HTML
+    # Sans le dictionnaire entraîné, la valeur est rejetée plutôt que mal décodée
+    monkeypatch.setattr(compression, "_trained_dictionary", None)
+    with pytest.raises(RuntimeError):
+        decompress_text(value)
@@ -0,0 +1,100 @@
+import pytest
+
+from backend.scraper.core.cache import JobCache
+from backend.scraper.core.cache_backend import MemoryBackend
+from backend.scraper.core.extractor import JobExtractor
+from backend.scraper.core.http_client import FetchResult
+from backend.scraper.core.offer_state import OfferStage
+from backend.scraper.core.seen_index import SeenIndex
+
+URL = "https://www.free-work.com/fr/tech-it/data-engineer/job-mission/offre-1"
+VALIDATORS = {'etag': '"v1"', 'content_length': "14"}
+
+class FakeHTTPClient:
+    """Client HTTP qui répond 304 dès que l'ETag courant est envoyé."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def fetch_conditional(self, url, validators=None):
+        self.sent.append(dict(validators or {}))
+        if validators and validators.get('etag') == VALIDATORS['etag']:
+            return FetchResult(status=304, validators=dict(validators))
+        return FetchResult(status=200, text="<h1>Offre</h1>", validators=dict(VALIDATORS))
+
+async def next_run(cache):
+    """Simule un nouveau passage, après expiration du marqueur de traitement."""
+    await cache.backend.delete([f"job:{URL}"])
+
+@pytest.mark.asyncio
+async def test_validators_are_kept_only_for_loaded_offers():
+    """Test qu'une offre jamais chargée est extraite en entier, sans requête conditionnelle."""
+    cache = JobCache(MemoryBackend())
+    client = FakeHTTPClient()
+    extractor = JobExtractor(cache, client)
+
+    assert (await extractor.extract([URL]))['extracted'] == 1
+    assert await cache.get_validators_many([URL]) == [{}]
+
+    # L'offre échoue en aval et est oubliée : le passage suivant la récupère en entier
+    await cache.discard_offers([URL])
+    await next_run(cache)
+    stats = await extractor.extract([URL])
+
+    assert stats['extracted'] == 1 and stats['not_modified'] == 0
+    assert client.sent == [{}, {}]
+
+@pytest.mark.asyncio
+async def test_loaded_offer_is_revalidated():
+    """Test qu'une offre chargée puis redécouverte est revalidée et repasse à l'étape loaded."""
+    cache = JobCache(MemoryBackend())
+    client = FakeHTTPClient()
+    extractor = JobExtractor(cache, client)
+
+    await extractor.extract([URL])
+    await cache.store_cleaned_html_many([(f"raw_html:{URL}", "propre", "fp")])
+    await cache.store_analysis_many([(f"cleaned_html:{URL}", {'TITLE': "Data"}, None)])
+    assert await cache.complete_offers([URL]) == 1
+    assert await cache.get_validators_many([URL]) == [VALIDATORS]
+    expires_at = cache.backend._data[f"validators:{URL}"][1]
+
+    await next_run(cache)
+    stats = await extractor.extract([URL])
+
+    assert stats['not_modified'] == 1
+    assert client.sent[-1] == VALIDATORS
+    assert (await cache.get_offer(URL))['stage'] == OfferStage.LOADED.value
+    # Les validateurs sont prolongés pour les passages suivants
+    assert await cache.get_validators_many([URL]) == [VALIDATORS]
+    assert cache.backend._data[f"validators:{URL}"][1] > expires_at
+
+@pytest.mark.asyncio
+async def test_seen_index_keeps_offers_with_validators(tmp_path):
+    """Test qu'une offre de l'index est revalidée si elle a des validateurs, ignorée sinon."""
+    cache = JobCache(MemoryBackend())
+    client = FakeHTTPClient()
+    other = URL.replace("offre-1", "offre-2")
+
+    with SeenIndex(str(tmp_path / "seen.bloom")) as index:
+        extractor = JobExtractor(cache, client, seen_index=index)
+        await extractor.extract([URL])
+        await cache.store_cleaned_html_many([(f"raw_html:{URL}", "propre", "fp")])
+        await cache.store_analysis_many([(f"cleaned_html:{URL}", {'TITLE': "Data"}, None)])
+        await cache.complete_offers([URL])
+        index.add_many([URL, other])
+
+        await next_run(cache)
+        stats = await extractor.extract([URL, other])
+
+    assert stats['not_modified'] == 1 and stats['known'] == 1
+    assert client.sent == [{}, VALIDATORS]
+
+@pytest.mark.asyncio
+async def test_sources_are_kept_with_offer():
+    """Test que les sources qui ont trouvé une offre sont gardées dans son hash offer:<url>."""
+    cache = JobCache(MemoryBackend())
+    extractor = JobExtractor(cache, FakeHTTPClient())
+
+    await extractor.extract([URL], sources={URL: {"Free-Work Data Engineer", "Free-Work Fullstack"}})
+
+    assert (await cache.get_offer(URL))['sources'] == "Free-Work Data Engineer,Free-Work Fullstack"
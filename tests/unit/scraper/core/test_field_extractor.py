@@ -0,0 +1,90 @@
+import pytest
+
+from backend.scraper.config.settings import REQUIRED_FIELDS
+from backend.scraper.core.field_extractor import FieldExtractor
+from backend.scraper.core.html_cleaner import HTMLCleaner
+
+PAGE = """<html><body>
+<div class="flex items-center"><h2>VISIAN</h2><span class="tag">ESN</span></div>
+<h1 class="text-2xl font-bold">Data Engineer AWS</h1>
+<div><span class="tag">Freelance</span><span class="tag">Python</span><span class="tag">PySpark</span></div>
+<p class="line-clamp-2">Paris, France</p>
+<p class="line-clamp-2">400-550 €⁄j</p>
+<p class="line-clamp-2">12 mois</p>
+<p class="line-clamp-2">Télétravail partiel</p>
+<p class="line-clamp-2">5 à 10 ans d’expérience</p>
+<div class="html-renderer prose-content"><p>Au sein de l'équipe data, vous serez en présentiel 2 jours par semaine et justifiez de 3 ans d'expérience en Kafka.</p></div>
+</body></html>"""
+
+def test_resolves_only_rule_fields():
+    """Test que les règles résolvent TJM, durée, télétravail, contrat et expérience, et laissent le reste à Mistral."""
+    extraction = FieldExtractor().extract(HTMLCleaner("lxml").clean(PAGE))
+    resolved = extraction.resolved(0.8)
+
+    assert resolved == {
+        'CONTRACT_TYPE': ["Freelance"],
+        'XP': "Confirmé",
+        'REMOTE': "Hybride",
+        'DURATION_DAYS': 365,
+        'TJM_MIN': 400,
+        'TJM_MAX': 550
+    }
+    # Titre, entreprise, domaine, lieu et technologies (Kafka n'est que dans la description)
+    # sont relevés mais restent demandés à Mistral
+    missing = set(REQUIRED_FIELDS) - set(resolved)
+    assert {'TITLE', 'COMPANY', 'COMPANY_TYPE', 'DOMAIN', 'REGION', 'COUNTRY', 'TECHNOS'} <= missing
+    assert extraction.values['TECHNOS'] == ["Python", "Spark"]
+    assert all(extraction.confidence[name] < 0.8 for name in missing if name in extraction.confidence)
+
+@pytest.mark.parametrize("output", ["markdown", "text"])
+def test_text_outputs_resolve_key_info(output):
+    """Test que les sorties markdown / text donnent les mêmes champs issus des tags et informations clés."""
+    extraction = FieldExtractor().extract(HTMLCleaner("lxml", output=output).clean(PAGE))
+    resolved = extraction.resolved(0.8)
+
+    assert resolved['TJM_MIN'] == 400 and resolved['TJM_MAX'] == 550
+    assert resolved['DURATION_DAYS'] == 365
+    assert resolved['REMOTE'] == "Hybride"
+    assert resolved['CONTRACT_TYPE'] == ["Freelance"]
+    assert set(resolved) == set(FieldExtractor.RULE_FIELDS)
+
+@pytest.mark.parametrize("output", ["markdown", "text"])
+def test_short_description_lines_are_not_key_info(output):
+    """Test qu'une ligne courte de la description n'a pas la confiance d'une information clé."""
+    html = (
+        '<h1 class="text-2xl font-bold">Stage Data Engineer</h1><span class="tag">Freelance</span>'
+        '<div class="html-renderer prose-content"><p>Stage</p><p>Profil senior</p></div>'
+    )
+    extraction = FieldExtractor().extract(HTMLCleaner("lxml", output=output).clean(html))
+    resolved = extraction.resolved(0.8)
+
+    assert resolved['CONTRACT_TYPE'] == ["Freelance"]
+    assert 'XP' not in resolved
+
+def test_description_only_matches_stay_unresolved():
+    """Test qu'un motif trouvé seulement dans la description garde une confiance trop faible pour éviter Mistral."""
+    html = (
+        '<span class="tag">CDI</span><p class="line-clamp-2">Publiée il y a 3 jours</p>'
+        '<div class="html-renderer prose-content"><p>Salaire 45k-55k €/an, mission de 6 mois, '
+        '100% télétravail.</p></div>'
+    )
+    extraction = FieldExtractor().extract(HTMLCleaner("lxml").clean(html))
+    resolved = extraction.resolved(0.8)
+
+    # Pas de TJM ni de durée pour un CDI
+    assert resolved == {'CONTRACT_TYPE': ["CDI"], 'TJM_MIN': None, 'TJM_MAX': None, 'DURATION_DAYS': None}
+    assert extraction.values['REMOTE'] == "100%" and extraction.confidence['REMOTE'] < 0.8
+
+@pytest.mark.parametrize("key_info, remote", [
+    ("3 jours de présentiel par semaine", "Hybride"),
+    ("Démarrage dans 2 semaines", None),
+    ("Présentiel, télétravail partiel", "Hybride"),
+    ("Présentiel", "Non"),
+])
+def test_work_rhythm_is_not_a_duration(key_info, remote):
+    """Test qu'un rythme de présence ou un délai de démarrage ne donne pas de durée, et qu'un présentiel seul ne masque pas l'hybride."""
+    html = f'<span class="tag">Freelance</span><p class="line-clamp-2">{key_info}</p>'
+    resolved = FieldExtractor().extract(HTMLCleaner("lxml").clean(html)).resolved(0.8)
+
+    assert resolved.get('DURATION_DAYS') is None
+    assert resolved.get('REMOTE') == remote
@@ -0,0 +1,28 @@
+from backend.scraper.core.fingerprint import fingerprint, html_fingerprint, normalize_html
+
+def test_normalize_html_ignores_volatile_markup():
+    """Test que scripts, styles, commentaires et espaces n'influencent pas la page normalisée."""
+    html = """<html>
+    <head><script nonce="abc">window.build = 42;</script><STYLE>p {}</STYLE></head>
+    <body>  <!-- rendu 12:00 -->
+        <h1>Data   Engineer</h1>
+        <noscript>Activez JavaScript</noscript><p>Paris</p>
+    </body></html>"""
+
+    assert normalize_html(html) == "<html><head></head><body><h1>Data Engineer</h1><p>Paris</p></body></html>"
+
+def test_html_fingerprint_detects_content_changes():
+    """Test que l'empreinte ne change qu'avec le contenu de l'offre."""
+    page = '<h1>Data Engineer</h1><script>var t = 1;</script><p>450 €/j</p>'
+
+    assert html_fingerprint(page) == html_fingerprint(page.replace("var t = 1;", "var t = 2;"))
+    assert html_fingerprint(page) == html_fingerprint(page.replace("</h1><", "</h1>\n  <"))
+    assert html_fingerprint(page) != html_fingerprint(page.replace("450", "500"))
+    assert len(html_fingerprint(page)) == 32
+
+def test_salt_changes_fingerprint():
+    """Test qu'un sel différent (configuration du nettoyage) donne une autre empreinte."""
+    page = "<p>Offre</p>"
+
+    assert html_fingerprint(page) == fingerprint("<p>Offre</p>")
+    assert html_fingerprint(page, "v1") != html_fingerprint(page, "v2")
@@ -0,0 +1,98 @@
+import pytest
+
+from backend.scraper.core.html_cleaner import HTMLCleaner
+
+PAGE = """<html><head><style>p{}</style><script>var a;</script></head><body>
+<div class="flex items-center" id="company"><h2>ACME</h2><span class="tag">ESN</span></div>
+<h1 class="text-2xl font-bold" data-x="1">Data engineer</h1>
+<div class="html-renderer prose-content"><p>Python &amp; SQL</p><pre>  </pre></div>
+<ul><li class="tag">Remote</li></ul>
+<p>   </p><p><a href="/x">Postuler</a></p>
+</body></html>"""
+
+EXPECTED = (
+    '<html><body><div class="cleaned-content">'
+    '<div class="flex items-center"><h2>ACME</h2><span class="tag">ESN</span></div>'
+    '<h1 class="text-2xl font-bold">Data engineer</h1>'
+    '<div class="html-renderer prose-content"><p>Python &amp; SQL</p><pre>  </pre></div>'
+    '<li class="tag">Remote</li><p><a>Postuler</a></p>'
+    '</div></body></html>'
+)
+
+@pytest.mark.parametrize("engine", HTMLCleaner.ENGINES)
+def test_clean_keeps_relevant_sections(engine):
+    """Test que chaque moteur conserve les sections pertinentes, sans scripts ni attributs superflus."""
+    cleaner = HTMLCleaner(engine)
+
+    assert cleaner.clean(PAGE) == EXPECTED
+    assert cleaner.stats['scripts_removed'] == 1
+    assert cleaner.stats['styles_removed'] == 1
+
+def test_engines_produce_same_output():
+    """Test que les deux moteurs donnent la même sortie sur des sections imbriquées."""
+    html = (
+        '<body><div class="tag"><p class="line-clamp-2">a<span class="tag">b</span></p>'
+        '<h1>\n  <h1>Titre</h1></h1></div>texte<br class="x"><!-- note --><p>&lt;c&gt;</p></body>'
+    )
+    outputs = {engine: HTMLCleaner(engine).clean(html) for engine in HTMLCleaner.ENGINES}
+
+    assert outputs['bs4'] == outputs['lxml']
+    assert HTMLCleaner('lxml').clean('') == '<html><body><div class="cleaned-content"></div></body></html>'
+
+@pytest.mark.parametrize("engine", HTMLCleaner.ENGINES)
+def test_markdown_output(engine):
+    """Test que la sortie markdown garde le texte des sections, tags sur une ligne."""
+    cleaner = HTMLCleaner(engine, output="markdown")
+
+    assert cleaner.clean(PAGE) == (
+        "# Data engineer\n\n"
+        "## ACME\nESN\n\n"
+        "Tags: Remote\n\n"
+        "Python & SQL\n\n"
+        "Postuler"
+    )
+    assert not cleaner.stats['truncated']
+
+def test_text_output_labels_key_info():
+    """Test que les lignes d'informations clés sont étiquetées comme la ligne des tags."""
+    html = (
+        '<h1 class="text-2xl font-bold">Data engineer</h1><span class="tag">Python</span>'
+        '<p class="line-clamp-2">Paris, France</p><p class="line-clamp-2">12 mois</p>'
+        '<div class="html-renderer prose-content"><p>Stage</p></div>'
+    )
+
+    assert HTMLCleaner("lxml", output="text").clean(html) == (
+        "Data engineer\n\nTags: Python\n\nInfo: Paris, France\nInfo: 12 mois\n\nStage"
+    )
+
+def test_text_output_truncates_description_first():
+    """Test qu'au-delà du budget de tokens, la description est tronquée avant le titre et les tags."""
+    description = "".join(f"<p>Paragraphe {i} de la description du poste.</p>" for i in range(50))
+    html = (
+        '<h1 class="text-2xl font-bold">Data engineer</h1><span class="tag">Python</span>'
+        f'<div class="html-renderer prose-content">{description}</div>'
+    )
+    cleaner = HTMLCleaner("lxml", output="text", token_budget=60)
+    text = cleaner.clean(html)
+
+    assert text.startswith("Data engineer\n\nTags: Python\n\nParagraphe 0 de la description du poste.")
+    assert "Paragraphe 49" not in text
+    assert cleaner.stats['truncated'] and cleaner.stats['tokens'] <= 60
+
+@pytest.mark.parametrize("engine", HTMLCleaner.ENGINES)
+def test_nested_matches_are_emitted_once(engine):
+    """Test qu'un élément déjà inclus par un ancêtre retenu reste en place et est compté comme doublon."""
+    html = (
+        '<div class="tag">Data <span class="tag">Python</span></div>'
+        '<div class="html-renderer prose-content"><p>Mission</p><p>Profil</p></div>'
+    )
+    cleaner = HTMLCleaner(engine)
+
+    assert cleaner.clean(html) == (
+        '<html><body><div class="cleaned-content">'
+        '<div class="html-renderer prose-content"><p>Mission</p><p>Profil</p></div>'
+        '<div class="tag">Data <span class="tag">Python</span></div>'
+        '</div></body></html>'
+    )
+    assert cleaner.stats['duplicates_skipped'] == 3
+    assert cleaner.stats['duplicate_bytes_saved'] == len("Python") + len("Mission") + len("Profil")
@@ -0,0 +1,54 @@
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from backend.scraper.core.http_client import HTTPClient
+
+ETAG = '"v1"'
+
+@pytest_asyncio.fixture
+async def server_url():
+    """Serveur local qui répond 304 aux requêtes portant le bon ETag."""
+    async def offer(request):
+        if request.headers.get('If-None-Match') == ETAG:
+            return web.Response(status=304)
+        return web.Response(
+            text="<h1>Offre</h1>",
+            content_type="text/html",
+            headers={'ETag': ETAG, 'Last-Modified': "Wed, 01 Jan 2025 00:00:00 GMT"}
+        )
+
+    app = web.Application()
+    app.router.add_get("/offre", offer)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}/offre"
+    await runner.cleanup()
+
+@pytest.mark.asyncio
+async def test_fetch_conditional_returns_validators(server_url):
+    """Test qu'une réponse 200 donne le contenu et les validateurs de cache."""
+    async with HTTPClient() as client:
+        result = await client.fetch_conditional(server_url)
+
+    assert result.status == 200 and not result.not_modified
+    assert result.text == "<h1>Offre</h1>"
+    assert result.validators == {
+        'content_length': "14",
+        'etag': ETAG,
+        'last_modified': "Wed, 01 Jan 2025 00:00:00 GMT"
+    }
+
+@pytest.mark.asyncio
+async def test_fetch_conditional_not_modified(server_url):
+    """Test que les validateurs connus sont renvoyés et qu'une réponse 304 les conserve."""
+    validators = {'etag': ETAG, 'content_length': "14"}
+    async with HTTPClient() as client:
+        result = await client.fetch_conditional(server_url, validators)
+
+    assert result.not_modified
+    assert result.text is None
+    assert result.validators == validators
@@ -0,0 +1,51 @@
+import pytest
+
+from backend.scraper.config.settings import SCRAPING_SOURCES
+from backend.scraper.core.list_parser import ListPage, ListPageParser
+
+PAGE = """<html><body>
+<a href="/fr/tech-it/developpeur/job-mission/data-engineer-1?utm_source=list">Offre 1</a>
+<a href="https://www.free-work.com/fr/tech-it/developpeur/job-mission/data-engineer-1">Offre 1 (doublon)</a>
+<a href="/fr/tech-it/developpeur/job-mission/data-engineer-2">Offre 2</a>
+<a href="/fr/tech-it/jobs?page=2">Autre lien</a>
+<button class="next" aria-disabled="false">Suivant</button>
+</body></html>"""
+
+def parser(engine):
+    """Parseur de la première source, avec le moteur demandé."""
+    return ListPageParser({**SCRAPING_SOURCES[0], 'parser': engine})
+
+def test_engines_produce_same_page():
+    """Test que les moteurs bs4 et lxml trouvent les mêmes offres et la même pagination."""
+    pages = {engine: parser(engine).parse(PAGE) for engine in ListPageParser.ENGINES}
+
+    assert pages['bs4'] == pages['lxml']
+    assert len(pages['lxml'].links) == 2
+    assert pages['lxml'].card_count == 3
+    assert pages['lxml'].has_next
+
+@pytest.mark.parametrize("engine", ListPageParser.ENGINES)
+def test_disabled_next_button(engine):
+    """Test qu'un bouton "Suivant" désactivé, même par un attribut vide, arrête la pagination."""
+    html = PAGE.replace('aria-disabled="false"', 'disabled')
+
+    assert not parser(engine).parse(html).has_next
+
+@pytest.mark.parametrize("engine", ListPageParser.ENGINES)
+@pytest.mark.parametrize("html", [
+    None,
+    "",
+    "   \n",
+    "<!-- commentaire seul -->",
+    '<?xml version="1.0" encoding="utf-8"?><!-- commentaire seul -->',
+])
+def test_empty_pages(engine, html):
+    """Test qu'une page vide ou sans élément donne une page sans offre, sans exception."""
+    assert parser(engine).parse(html) == ListPage()
+
+@pytest.mark.parametrize("engine", ListPageParser.ENGINES)
+def test_encoding_declaration(engine):
+    """Test qu'une page avec déclaration d'encodage XML est analysée normalement."""
+    html = '<?xml version="1.0" encoding="utf-8"?>' + PAGE.replace("Offre 2", "Offre 2 — Île-de-France")
+
+    assert parser(engine).parse(html) == parser(engine).parse(PAGE)
@@ -0,0 +1,72 @@
+import pytest
+
+from backend.scraper.config.settings import SCRAPING_SOURCES
+from backend.scraper.core.cache import JobCache
+from backend.scraper.core.cache_backend import MemoryBackend
+from backend.scraper.core.list_scraper import JobListScraper
+from backend.scraper.core.seen_index import SeenIndex
+
+SOURCE = {**SCRAPING_SOURCES[0], 'max_pages': 10, 'stop_after_seen_pages': 2}
+
+def offer_url(page, i):
+    """URL canonique de la i-ème offre d'une page."""
+    return f"https://www.free-work.com/fr/tech-it/developpeur/job-mission/offre-{page}-{i}"
+
+class FakeHTTPClient:
+    """Client HTTP qui sert des pages de liste de 2 offres, toutes avec un bouton "Suivant"."""
+
+    def __init__(self):
+        self.requested = []
+
+    async def fetch(self, url):
+        page = int(url.rsplit("page=", 1)[1])
+        self.requested.append(page)
+        links = "".join(f'<a href="{offer_url(page, i)}">Offre</a>' for i in range(2))
+        return f'<html><body>{links}<button class="next">Suivant</button></body></html>'
+
+    async def close(self):
+        pass
+
+async def scrape(seen_pages, seen_index=None):
+    """Scrape la source après avoir marqué comme traitées les offres des pages données."""
+    cache = JobCache(MemoryBackend())
+    for page in seen_pages:
+        for i in range(2):
+            await cache.mark_processed(offer_url(page, i))
+    client = FakeHTTPClient()
+    scraper = JobListScraper(http_client=client, cache=cache, seen_index=seen_index)
+    urls = await scraper._scrape_source(SOURCE)
+    await cache.close()
+    return urls, client.requested
+
+@pytest.mark.asyncio
+async def test_stops_after_consecutive_seen_pages():
+    """Test que la pagination s'arrête après `stop_after_seen_pages` pages sans offre nouvelle."""
+    urls, requested = await scrape(seen_pages=[2, 3, 4, 5])
+
+    assert urls == [offer_url(page, i) for page in (1, 2, 3) for i in range(2)]
+    # Seule la page 4, anticipée, a pu être demandée en plus
+    assert max(requested) <= 4
+
+@pytest.mark.asyncio
+async def test_new_offer_resets_seen_streak():
+    """Test qu'une page avec une offre nouvelle remet le compteur de pages vues à zéro."""
+    urls, _ = await scrape(seen_pages=[1, 3, 4])
+
+    assert {url.rsplit("-", 2)[1] for url in urls} == {"1", "2", "3", "4"}
+
+@pytest.mark.asyncio
+async def test_seen_index_counts_as_seen(tmp_path):
+    """Test que les offres de l'index des offres chargées comptent comme vues, sans marqueur en cache."""
+    with SeenIndex(str(tmp_path / "seen.bloom")) as index:
+        index.add_many(offer_url(page, i) for page in (1, 2) for i in range(2))
+        urls, _ = await scrape(seen_pages=[], seen_index=index)
+
+    assert urls == [offer_url(page, i) for page in (1, 2) for i in range(2)]
+
+@pytest.mark.asyncio
+async def test_max_pages_without_seen_offers():
+    """Test que sans offre déjà vue, seule la limite de pages arrête la pagination."""
+    urls, _ = await scrape(seen_pages=[])
+
+    assert len(urls) == 2 * SOURCE['max_pages']
@@ -0,0 +1,78 @@
+import pytest
+
+from backend.scraper.core.http_client import HTTPClient
+from backend.scraper.core.rate_limiter import AdaptiveConcurrency
+
+@pytest.mark.asyncio
+async def test_limit_grows_by_one_per_healthy_window():
+    """Test que la limite augmente d'environ une unité par fenêtre de réponses rapides."""
+    controller = AdaptiveConcurrency(initial=2, minimum=1, maximum=10, latency_target=1.0)
+
+    for _ in range(2):
+        await controller.acquire()
+        await controller.release(latency=0.1, overloaded=False)
+
+    assert controller.limit == pytest.approx(2.9)  # 2 + 1/2 + 1/2.5
+    assert controller.in_flight == 0
+
+@pytest.mark.asyncio
+async def test_limit_halves_once_per_burst_of_errors():
+    """Test qu'une rafale d'erreurs simultanées ne réduit la limite qu'une fois."""
+    controller = AdaptiveConcurrency(initial=8, minimum=1, maximum=10, latency_target=60.0)
+
+    for _ in range(4):
+        await controller.acquire()
+    for _ in range(4):
+        await controller.release(latency=None, overloaded=True)
+
+    assert controller.limit == 4.0
+
+@pytest.mark.asyncio
+async def test_slow_responses_do_not_raise_limit():
+    """Test que les réponses au-delà de la latence cible n'augmentent pas la limite."""
+    controller = AdaptiveConcurrency(initial=2, minimum=1, maximum=10, latency_target=1.0)
+
+    await controller.acquire()
+    await controller.release(latency=5.0, overloaded=False)
+
+    assert controller.limit == 2.0
+
+def test_retry_delay_honours_retry_after(monkeypatch):
+    """Test que le Retry-After du serveur sert de délai minimum, dans la limite du plafond."""
+    from backend.scraper.core import http_client
+    monkeypatch.setattr(http_client, "RETRY_DELAY", 1)
+    monkeypatch.setattr(http_client, "RETRY_MAX_DELAY", 30)
+    client = HTTPClient()
+
+    assert 0.5 <= client._get_retry_delay(0, None) <= 1
+    assert client._get_retry_delay(0, 12.0) == 12.0
+    assert client._get_retry_delay(0, 3600.0) == 30
+    assert HTTPClient._parse_retry_after("120") == 120.0
+    assert HTTPClient._parse_retry_after("n'importe quoi") is None
+
+@pytest.mark.asyncio
+async def test_429_waits_once_in_rate_limiter(monkeypatch):
+    """Test qu'une réponse 429 suspend l'hôte sans attendre une seconde fois localement."""
+    from backend.scraper.core import http_client
+    from backend.scraper.core.http_client import FetchResult
+    client = HTTPClient()
+    responses = iter([(FetchResult(status=429), True, 5.0), (FetchResult(status=200, text="ok"), False, None)])
+    pauses, sleeps = [], []
+
+    async def send(*args):
+        return next(responses)
+
+    async def sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(client, "_send", send)
+    monkeypatch.setattr(client.rate_limiter, "pause", lambda url, seconds: pauses.append(seconds))
+    monkeypatch.setattr(http_client.asyncio, "sleep", sleep)
+    monkeypatch.setattr(http_client, "RETRY_DELAY", 1)
+    monkeypatch.setattr(http_client, "RETRY_MAX_DELAY", 30)
+
+    result = await client.fetch_conditional("https://example.com/offre")
+
+    assert result.text == "ok"
+    assert pauses == [5.0]
+    assert sleeps == []
@@ -0,0 +1,34 @@
+import pytest
+
+from backend.scraper.core.seen_index import SeenIndex
+
+def test_membership_and_persistence(tmp_path):
+    """Test que les URLs ajoutées sont retrouvées après réouverture du fichier."""
+    path = str(tmp_path / "seen.bloom")
+    urls = [f"https://www.free-work.com/fr/tech-it/data-engineer/job-mission/offre-{i}" for i in range(1000)]
+
+    with SeenIndex(path, capacity=10_000, error_rate=0.01) as index:
+        assert index.add_many(urls) == 1000
+        assert not index.add(urls[0])
+
+    with SeenIndex(path, capacity=1, error_rate=0.5) as index:
+        assert len(index) == 1000
+        assert index.capacity == 10_000  # Paramètres d'origine conservés
+        assert all(url in index for url in urls)
+
+def test_false_positive_rate_is_bounded(tmp_path):
+    """Test que le taux de faux positifs reste proche de la cible à pleine capacité."""
+    with SeenIndex(str(tmp_path / "seen.bloom"), capacity=5000, error_rate=0.01) as index:
+        index.add_many(f"https://example.com/job-mission/{i}" for i in range(5000))
+        false_positives = sum(f"https://example.com/other/{i}" in index for i in range(20_000))
+
+    assert false_positives / 20_000 < 0.02
+
+def test_invalid_file_is_rejected(tmp_path):
+    """Test qu'un fichier qui n'est pas un index n'est ni lu ni écrasé."""
+    path = tmp_path / "seen.bloom"
+    path.write_bytes(b"x" * 64)
+
+    with pytest.raises(ValueError):
+        SeenIndex(str(path))
+    assert path.read_bytes() == b"x" * 64
@@ -0,0 +1,46 @@
+from datetime import datetime
+
+import pytest
+
+from backend.scraper.core import serialization
+from backend.scraper.core.serialization import decode_payload, encode_payload, MAGIC
+
+ANALYSIS = {
+    'TITLE': "Data Engineer – Paris",
+    'DURATION_DAYS': None,
+    'CONTRACT_TYPE': ["Freelance"],
+    'DAILY_MAX': 650,
+    'REMOTE': True,
+}
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_round_trip(monkeypatch, use_orjson):
+    """Test qu'une analyse est restituée à l'identique, None compris."""
+    if use_orjson and serialization.orjson is None:
+        pytest.skip("orjson non installé")
+    if not use_orjson:
+        monkeypatch.setattr(serialization, "orjson", None)
+
+    value = encode_payload(ANALYSIS)
+
+    assert value.startswith(MAGIC)
+    assert decode_payload(value) == ANALYSIS
+    assert decode_payload(value.decode('utf-8')) == ANALYSIS
+
+def test_datetimes_are_stored_as_iso_strings():
+    """Test que les dates sont sérialisées au format ISO."""
+    value = encode_payload({'SCRAPED_AT': datetime(2025, 1, 2, 3, 4, 5)})
+
+    assert decode_payload(value) == {'SCRAPED_AT': "2025-01-02T03:04:05"}
+
+def test_legacy_repr_is_read_without_eval():
+    """Test que les anciennes valeurs str(dict) sont lues, mais jamais exécutées."""
+    assert decode_payload(str(ANALYSIS)) == ANALYSIS
+
+    with pytest.raises(ValueError):
+        decode_payload("__import__('os').system('true')")
+
+def test_unknown_schema_version_is_rejected():
+    """Test qu'une version de schéma inconnue lève une erreur."""
+    with pytest.raises(ValueError):
+        decode_payload(MAGIC + b"9{}")
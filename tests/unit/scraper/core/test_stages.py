@@ -0,0 +1,121 @@
+import pytest
+
+from backend.scraper.core.boilerplate import BoilerplateModel
+from backend.scraper.core.cache import JobCache
+from backend.scraper.core.cache_backend import MemoryBackend
+from backend.scraper.core.cleaning_executor import CleaningExecutor
+from backend.scraper.core.offer_state import OfferStage
+from backend.scraper.core.stages import new_stats, clean_offers, analyze_offers, load_offers
+
+URL = "https://www.free-work.com/fr/tech-it/data-engineer/job-mission/offre-1"
+HTML = '<h1 class="text-2xl font-bold">Data Engineer</h1><p>Mission de 12 mois</p>'
+
+class FakeAnalyzer:
+    """Analyseur qui compte ses appels."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def analyze(self, cleaned_html, url):
+        self.calls += 1
+        return {'TITLE': "Data Engineer"}
+
+class FakeStorage:
+    """Stockage qui accepte toutes les analyses."""
+
+    async def store_job_analysis(self, analysis):
+        return True
+
+async def run_pipeline(cache, executor, analyzer, html=HTML):
+    """Fait passer l'offre par toutes les étapes, comme le DAG, et retourne les compteurs de chacune."""
+    await cache.register_discovered([URL])
+    await cache.store_raw_html(URL, html)
+    stats = [new_stats() for _ in range(3)]
+    await clean_offers(cache, executor, await cache.filter_offers([URL], OfferStage.FETCHED), stats[0])
+    await analyze_offers(cache, analyzer, await cache.filter_offers([URL], OfferStage.CLEANED), stats[1])
+    await load_offers(cache, FakeStorage(), await cache.filter_offers([URL], OfferStage.ANALYZED), stats[2])
+    return stats
+
+@pytest.mark.asyncio
+async def test_unchanged_refetch_after_load_is_skipped():
+    """Test qu'une offre chargée puis récupérée à l'identique saute nettoyage et analyse."""
+    cache = JobCache(MemoryBackend())
+    analyzer = FakeAnalyzer()
+    executor = CleaningExecutor(workers=1)
+
+    await run_pipeline(cache, executor, analyzer)
+    # Les empreintes et l'analyse survivent au chargement, pas le HTML nettoyé
+    assert await cache.get_cleaned_html(f"cleaned_html:{URL}") is None
+    stats = await run_pipeline(cache, executor, analyzer)
+
+    assert [s['skipped'] for s in stats] == [1, 0, 0]
+    assert stats[2]['processed'] == 1
+    assert analyzer.calls == 1
+    assert (await cache.get_offer(URL))['stage'] == OfferStage.LOADED.value
+
+@pytest.mark.asyncio
+async def test_changed_refetch_after_load_is_processed_again():
+    """Test qu'une offre chargée puis modifiée est renettoyée et réanalysée."""
+    cache = JobCache(MemoryBackend())
+    analyzer = FakeAnalyzer()
+    executor = CleaningExecutor(workers=1)
+
+    await run_pipeline(cache, executor, analyzer)
+    stats = await run_pipeline(cache, executor, analyzer, HTML.replace("12 mois", "6 mois"))
+
+    assert [s['processed'] for s in stats] == [1, 1, 1]
+    assert analyzer.calls == 2
+
+@pytest.mark.asyncio
+async def test_unchanged_cleaned_html_skips_analysis():
+    """Test qu'un HTML brut modifié sans effet sur le HTML nettoyé n'est pas réanalysé."""
+    cache = JobCache(MemoryBackend())
+    analyzer = FakeAnalyzer()
+    executor = CleaningExecutor(workers=1)
+
+    await run_pipeline(cache, executor, analyzer)
+    stats = await run_pipeline(cache, executor, analyzer, HTML + "<script>var build = 2;</script><nav></nav>")
+
+    assert [s['processed'] for s in stats] == [1, 0, 1]
+    assert stats[1]['skipped'] == 1
+    assert analyzer.calls == 1
+
+@pytest.mark.asyncio
+async def test_missing_analysis_cleans_again():
+    """Test qu'une offre inchangée sans analyse réutilisable est nettoyée à nouveau."""
+    cache = JobCache(MemoryBackend())
+    executor = CleaningExecutor(workers=1)
+    await cache.store_raw_html(URL, HTML)
+    await clean_offers(cache, executor, [URL], new_stats())
+
+    # Offre oubliée avant son analyse, puis récupérée à nouveau
+    await cache.discard_offers([URL])
+    await cache.store_raw_html(URL, HTML)
+    stats = new_stats()
+    await clean_offers(cache, executor, [URL], stats)
+
+    assert stats == {'processed': 1, 'skipped': 0, 'failed': 0}
+    assert (await cache.get_offer(URL))['stage'] == OfferStage.CLEANED.value
+
+@pytest.mark.asyncio
+async def test_cleaner_change_invalidates_cleaned_fingerprint():
+    """Test qu'un changement de configuration du nettoyeur relance le nettoyage d'une page identique."""
+    cache = JobCache(MemoryBackend())
+    analyzer = FakeAnalyzer()
+
+    await run_pipeline(cache, CleaningExecutor(workers=1), analyzer)
+    stats = await run_pipeline(cache, CleaningExecutor(workers=1, engine="bs4"), analyzer)
+
+    assert stats[0] == {'processed': 1, 'skipped': 0, 'failed': 0}
+
+def test_learned_boilerplate_keeps_signature(tmp_path):
+    """Test que l'apprentissage du gabarit ne change pas la signature du nettoyage."""
+    model = BoilerplateModel(str(tmp_path / "boilerplate.json"), threshold=0.5, min_pages=1)
+    executor = CleaningExecutor(workers=1, boilerplate=model)
+    signature = executor.signature
+
+    model.observe(["a", "b"])
+
+    assert model.boilerplate_count > 0
+    assert executor.signature == signature
+    assert CleaningExecutor(workers=1).signature != signature
@@ -0,0 +1,41 @@
+import pytest
+
+from backend.scraper.core.url_utils import canonicalize_url, dedupe_urls, unique_urls
+
+BASE = "https://www.free-work.com"
+OFFER = "https://www.free-work.com/fr/tech-it/developpeur-fullstack/job-mission/dev-fullstack-react"
+
+@pytest.mark.parametrize("raw", [
+    "/fr/tech-it/developpeur-fullstack/job-mission/dev-fullstack-react",
+    "/fr/tech-it/developpeur-fullstack/job-mission/dev-fullstack-react/",
+    "https://WWW.Free-Work.com/fr/tech-it/developpeur-fullstack/job-mission/dev-fullstack-react",
+    "http://www.free-work.com/fr/tech-it/developpeur-fullstack/job-mission/dev-fullstack-react",
+    "https://www.free-work.com:443//fr/tech-it/developpeur-fullstack/job-mission/dev-fullstack-react",
+    "/fr/tech-it/developpeur-fullstack/job-mission/dev-fullstack-react?utm_source=list&position=3",
+    "/fr/tech-it/developpeur-fullstack/job-mission/dev-fullstack-react#apply",
+])
+def test_canonicalize_url(raw):
+    """Test que toutes les variantes d'une offre donnent la même URL."""
+    assert canonicalize_url(raw, BASE) == OFFER
+
+def test_canonicalize_url_keeps_path_case():
+    """Test que le chemin n'est pas mis en minuscules."""
+    assert canonicalize_url("/fr/Job-Mission/ABC", BASE) == f"{BASE}/fr/Job-Mission/ABC"
+
+def test_dedupe_urls_keeps_sources():
+    """Test la fusion des URLs de plusieurs sources."""
+    merged = dedupe_urls([
+        ("free-work-fullstack", [OFFER, "/fr/job-mission/a"]),
+        ("free-work-web", [f"{OFFER}?utm_campaign=web", "/fr/job-mission/b"]),
+    ])
+
+    assert list(merged) == [OFFER, f"{BASE}/fr/job-mission/a", f"{BASE}/fr/job-mission/b"]
+    assert merged[OFFER] == {"free-work-fullstack", "free-work-web"}
+    assert merged[f"{BASE}/fr/job-mission/b"] == {"free-work-web"}
+
+def test_unique_urls_preserves_order():
+    """Test la suppression des doublons dans une page."""
+    assert unique_urls(["/fr/job-mission/b", "/fr/job-mission/a", "/fr/job-mission/b/"]) == [
+        f"{BASE}/fr/job-mission/b",
+        f"{BASE}/fr/job-mission/a",
+    ]
@@ -0,0 +1,126 @@
+import uuid
+
+import pytest
+import pytest_asyncio
+
+from backend.scraper.core import work_queue
+from backend.scraper.core.cache import JobCache
+from backend.scraper.core.cache_backend import MemoryBackend
+from backend.scraper.core.offer_state import OfferStage
+from backend.scraper.core.work_queue import StreamWorkQueue, run_worker
+
+@pytest_asyncio.fixture
+async def queues(redis):
+    """Deux workers d'un même groupe, sur un stream propre au test."""
+    group = f"test-{uuid.uuid4().hex}"
+    first = StreamWorkQueue(redis, OfferStage.CLEANED, group, "worker-1")
+    second = StreamWorkQueue(redis, OfferStage.CLEANED, group, "worker-2")
+    first.key = second.key = f"stream:test:{group}"
+    await first.ensure_group()
+    await second.ensure_group()
+    yield first, second
+    await redis.delete(first.key)
+
+@pytest.mark.asyncio
+async def test_workers_split_messages(queues):
+    """Test que deux workers d'un groupe se partagent les offres sans doublon."""
+    first, second = queues
+    urls = [f"https://example.com/job-mission/{i}" for i in range(10)]
+    await first.publish(urls)
+
+    claimed_first = await first.claim(count=6, block_ms=10)
+    claimed_second = await second.claim(count=6, block_ms=10)
+
+    assert len(claimed_first) == 6 and len(claimed_second) == 4
+    assert sorted(url for _, url in claimed_first + claimed_second) == sorted(urls)
+    assert await first.claim(count=6, block_ms=10) == []
+
+    await first.ack([message_id for message_id, _ in claimed_first])
+    assert await first.pending_count() == 4
+
+@pytest.mark.asyncio
+async def test_unacknowledged_messages_are_reclaimed(queues, monkeypatch):
+    """Test que les offres d'un worker tombé sont reprises par un autre."""
+    first, second = queues
+    await first.publish(["https://example.com/job-mission/1"])
+    [(message_id, url)] = await first.claim(block_ms=10)
+
+    monkeypatch.setattr(work_queue, "STREAM_CLAIM_IDLE_MS", 0)
+    assert await second.claim(block_ms=10) == [(message_id, url)]
+
+    await second.ack([message_id])
+    assert await second.pending_count() == 0
+
+@pytest.mark.asyncio
+async def test_delivery_counts(queues, monkeypatch):
+    """Test que chaque reprise d'un message non acquitté augmente son nombre de distributions."""
+    first, second = queues
+    await first.publish(["https://example.com/job-mission/1"])
+    [(message_id, _)] = await first.claim(block_ms=10)
+    monkeypatch.setattr(work_queue, "STREAM_CLAIM_IDLE_MS", 0)
+    await second.claim(block_ms=10)
+
+    assert await first.delivery_counts([message_id]) == [2]
+    await second.ack([message_id])
+    assert await first.delivery_counts([message_id]) == [0]
+
+class FakeQueue:
+    """File en mémoire qui redistribue les messages non acquittés, comme XAUTOCLAIM."""
+
+    def __init__(self, urls):
+        self.stage = OfferStage.CLEANED
+        self.key, self.group, self.consumer = "stream:cleaned", "workers", "worker-1"
+        self.pending = {f"{i}-0": url for i, url in enumerate(urls)}
+        self.deliveries = dict.fromkeys(self.pending, 0)
+
+    async def ensure_group(self):
+        pass
+
+    async def claim(self, count=20, block_ms=0):
+        messages = list(self.pending.items())[:count]
+        for message_id, _ in messages:
+            self.deliveries[message_id] += 1
+        return messages
+
+    async def ack(self, message_ids):
+        for message_id in message_ids:
+            self.pending.pop(message_id, None)
+        return len(message_ids)
+
+    async def delivery_counts(self, message_ids):
+        return [self.deliveries[message_id] if message_id in self.pending else 0 for message_id in message_ids]
+
+@pytest.mark.asyncio
+async def test_failed_offers_are_retried_then_abandoned():
+    """Test que seules les offres en échec restent en attente, jusqu'à la limite de distributions."""
+    cache = JobCache(MemoryBackend())
+    urls = [f"https://example.com/job-mission/{i}" for i in range(3)]
+    await cache.transition_offers(urls, OfferStage.CLEANED)
+    queue = FakeQueue(urls)
+    handled = []
+
+    async def handler(batch):
+        handled.append(batch)
+        return [urls[0]]
+
+    stats = await run_worker(queue, cache, handler, until_idle=True, max_deliveries=3)
+
+    assert handled == [urls, [urls[0]], [urls[0]]]
+    assert stats['retried'] == 2 and stats['abandoned'] == 1
+    assert queue.pending == {}
+
+@pytest.mark.asyncio
+async def test_handler_exception_keeps_batch_pending():
+    """Test qu'une exception du handler laisse tout le lot en attente."""
+    cache = JobCache(MemoryBackend())
+    urls = [f"https://example.com/job-mission/{i}" for i in range(2)]
+    await cache.transition_offers(urls, OfferStage.CLEANED)
+    queue = FakeQueue(urls)
+
+    async def handler(batch):
+        raise RuntimeError("Mistral indisponible")
+
+    stats = await run_worker(queue, cache, handler, until_idle=True, max_deliveries=2)
+
+    assert stats['failed_batches'] == 2
+    assert stats['retried'] == 2 and stats['abandoned'] == 2